@@ -0,0 +1,66 @@
+"""Throughput of batched RapidOCR line recognition at batch sizes 1-16.
+
+Usage:
+    python -m benchmarks.bench_batch_recognition --lines 64
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.frames import make_line_crops
+from subtitle.subtitle_ocr import (
+    RAPIDOCR_REC_MODEL_PATH,
+    _recognize_text_lines_local,
+)
+
+BATCH_SIZES = (1, 2, 4, 8, 12, 16)
+
+
+def run(lines: int = 64, repeats: int = 3) -> dict:
+    crops = make_line_crops(lines)
+    # Untimed call builds and warms the engine pool. The in-process path is
+    # timed so repeats measure the recognizer, not the OCR result cache.
+    _recognize_text_lines_local(crops[:1], rec_model_path=RAPIDOCR_REC_MODEL_PATH)
+
+    results = {}
+    for batch_size in BATCH_SIZES:
+        best = float("inf")
+        for _ in range(repeats):
+            started = time.perf_counter()
+            _recognize_text_lines_local(
+                crops,
+                rec_model_path=RAPIDOCR_REC_MODEL_PATH,
+                max_batch_size=batch_size,
+                min_confidence=0.0,
+            )
+            best = min(best, time.perf_counter() - started)
+        results[str(batch_size)] = {
+            "lines_per_second": round(lines / best, 2),
+            "ms_per_line": round(best * 1000 / lines, 3),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    results = run(args.lines, args.repeats)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Batched line recognition ({args.lines} lines, best of {args.repeats})")
+    for batch_size, stats in results.items():
+        print(
+            f"  batch={batch_size:>2}  {stats['lines_per_second']:>9.2f} lines/s"
+            f"  {stats['ms_per_line']:>8.3f} ms/line"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare in-thread and out-of-process OCR throughput.
+
+Usage:
+    python -m benchmarks.bench_ocr_backend --frames 60 --workers 2
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.frames import make_frame_set
+from subtitle.subtitle_ocr import (
+    RAPIDOCR_REC_MODEL_PATH,
+    extract_subtitle_text,
+    set_ocr_backend,
+)
+
+
+def _ocr_kwargs(engine: str) -> dict:
+    if engine == "winocr":
+        return {"use_winocr": True, "lang": "en"}
+    return {"use_winocr": False, "rec_model_path": RAPIDOCR_REC_MODEL_PATH}
+
+
+def _measure(frames, concurrency: int, kwargs: dict) -> dict:
+    # One untimed call so engine construction is not measured.
+    extract_subtitle_text(frames[0], **kwargs)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda frame: extract_subtitle_text(frame, **kwargs), frames))
+    elapsed = time.perf_counter() - started
+    return {
+        "frames": len(frames),
+        "seconds": round(elapsed, 4),
+        "fps": round(len(frames) / elapsed, 2) if elapsed else 0.0,
+        "ms_per_frame": round(elapsed * 1000 / len(frames), 2),
+    }
+
+
+def run(frames: int = 60, workers: int = 2, engine: str = "rapidocr") -> dict:
+    frame_set = make_frame_set(frames)
+    kwargs = _ocr_kwargs(engine)
+
+    results = {}
+    set_ocr_backend("thread")
+    results["thread"] = _measure(frame_set, workers, kwargs)
+
+    set_ocr_backend("process", workers=workers)
+    try:
+        results["process"] = _measure(frame_set, workers, kwargs)
+    finally:
+        set_ocr_backend("thread")
+
+    results["speedup"] = (
+        round(results["process"]["fps"] / results["thread"]["fps"], 2)
+        if results["thread"]["fps"]
+        else 0.0
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--engine", choices=("rapidocr", "winocr"), default="rapidocr")
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    results = run(args.frames, args.workers, args.engine)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"OCR backend throughput ({args.engine}, {args.frames} frames, {args.workers} workers)"
+    )
+    for mode in ("thread", "process"):
+        stats = results[mode]
+        print(
+            f"  {mode:<8} {stats['fps']:>8.2f} fps  {stats['ms_per_frame']:>8.2f} ms/frame"
+        )
+    print(f"  speedup  {results['speedup']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
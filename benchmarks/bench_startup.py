@@ -0,0 +1,180 @@
+"""Measure startup: import-time profile and time to the first shown overlay.
+
+The import profile runs `python -X importtime -c "import <module>"` in a fresh
+interpreter and lists the modules with the largest self and cumulative import
+time, plus which heavy optional modules (provider SDKs, pyautogui, cv2) were
+loaded. The startup benchmark runs the steps of main.main() in a fresh
+interpreter per run, from the first line up to the first processed show of
+the overlay (needs PyQt5 and Windows).
+
+Usage:
+    python -m benchmarks.bench_startup --top 15
+    python -m benchmarks.bench_startup --runs 5 --skip-imports
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that should only be imported once they are actually needed.
+HEAVY_MODULES = (
+    "google.genai",
+    "openai",
+    "imagehash",
+    "PIL.Image",
+    "pyautogui",
+    "cv2",
+    "rapidocr_onnxruntime",
+    "winocr",
+)
+
+_STARTUP_CHILD = r"""
+import json, sys, time
+started = time.perf_counter()
+marks = {}
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+marks["qapplication_ms"] = time.perf_counter() - started
+from core.translator_app import TranslatorApp
+marks["import_ms"] = time.perf_counter() - started
+window = TranslatorApp()
+marks["construct_ms"] = time.perf_counter() - started
+window.show()
+
+def shown():
+    marks["shown_ms"] = time.perf_counter() - started
+    result = {name: round(value * 1000, 1) for name, value in marks.items()}
+    result["loaded"] = [name for name in HEAVY if name in sys.modules]
+    print(json.dumps(result))
+    window.close()
+    app.quit()
+
+QTimer.singleShot(0, shown)
+app.exec_()
+"""
+
+
+def import_profile(module: str = "core.translator_app", top: int = 15) -> dict:
+    """Profile importing module with -X importtime in a fresh interpreter."""
+    code = f"import json, sys; import {module}; print(json.dumps(list(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    entries: List[Dict] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        entries.append(
+            {
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+    loaded = set(json.loads(proc.stdout.strip().splitlines()[-1]))
+    total = next(
+        (entry["cumulative_ms"] for entry in entries if entry["module"] == module),
+        0.0,
+    )
+    by_self = sorted(entries, key=lambda entry: entry["self_ms"], reverse=True)
+    top_level = [entry for entry in entries if "." not in entry["module"]]
+    by_package = sorted(top_level, key=lambda e: e["cumulative_ms"], reverse=True)
+    return {
+        "module": module,
+        "total_ms": total,
+        "modules": len(entries),
+        "top_self": by_self[:top],
+        "top_packages": by_package[:top],
+        "heavy_loaded": [name for name in HEAVY_MODULES if name in loaded],
+    }
+
+
+def startup_time(runs: int = 3) -> dict:
+    """Time main()'s steps up to the first shown overlay, one process per run."""
+    code = f"HEAVY = {HEAVY_MODULES!r}\n" + _STARTUP_CHILD
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    phases = ("qapplication_ms", "import_ms", "construct_ms", "shown_ms")
+    return {
+        "runs": runs,
+        "median": {
+            phase: round(statistics.median(s[phase] for s in samples), 1)
+            for phase in phases
+        },
+        "min_shown_ms": min(s["shown_ms"] for s in samples),
+        "heavy_loaded": samples[-1]["loaded"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="core.translator_app")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--skip-imports", action="store_true")
+    parser.add_argument("--skip-startup", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    results = {}
+    if not args.skip_imports:
+        results["imports"] = import_profile(args.module, args.top)
+    if not args.skip_startup:
+        try:
+            results["startup"] = startup_time(args.runs)
+        except RuntimeError as exc:
+            results["startup"] = {"skipped": str(exc)}
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    imports = results.get("imports")
+    if imports:
+        print(
+            f"Import profile of {imports['module']}: {imports['total_ms']:.1f} ms, "
+            f"{imports['modules']} modules"
+        )
+        print("  Slowest modules (self time):")
+        for entry in imports["top_self"]:
+            print(
+                f"    {entry['self_ms']:>8.1f} ms  {entry['cumulative_ms']:>8.1f} ms"
+                f"  {entry['module']}"
+            )
+        print("  Slowest top-level packages (cumulative):")
+        for entry in imports["top_packages"]:
+            print(f"    {entry['cumulative_ms']:>8.1f} ms  {entry['module']}")
+        print(f"  Heavy modules loaded: {', '.join(imports['heavy_loaded']) or '-'}")
+
+    startup = results.get("startup")
+    if startup and "skipped" in startup:
+        print(f"Startup benchmark skipped: {startup['skipped']}")
+    elif startup:
+        median = startup["median"]
+        print(f"Startup to first shown overlay (median of {startup['runs']} runs)")
+        for phase, value in median.items():
+            print(f"  {phase:<16} {value:>8.1f} ms")
+        print(f"  Heavy modules loaded: {', '.join(startup['heavy_loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
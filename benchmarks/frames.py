@@ -0,0 +1,63 @@
+"""Synthetic subtitle frames for benchmarks."""
+
+from typing import List, Sequence
+
+import cv2
+import numpy as np
+
+SAMPLE_LINES = (
+    "Where did you put the key?",
+    "I left it on the table.",
+    "We have to leave before dawn.",
+    "Nobody knows what happened here.",
+    "The train departs at seven.",
+    "Don't tell anyone about this.",
+)
+
+
+def make_subtitle_frame(
+    lines: Sequence[str],
+    width: int = 960,
+    height: int = 140,
+    noise: bool = True,
+    seed: int = 0,
+) -> np.ndarray:
+    """Render white, outlined subtitle text on a noisy dark background (RGB)."""
+    rng = np.random.default_rng(seed)
+    if noise:
+        frame = rng.integers(20, 90, size=(height, width, 3), dtype=np.uint8)
+    else:
+        frame = np.full((height, width, 3), 30, dtype=np.uint8)
+
+    line_height = height // (len(lines) + 1)
+    for index, line in enumerate(lines):
+        (text_w, _), _ = cv2.getTextSize(line, cv2.FONT_HERSHEY_SIMPLEX, 1.1, 2)
+        origin = (max(4, (width - text_w) // 2), line_height * (index + 1) + 12)
+        cv2.putText(frame, line, origin, cv2.FONT_HERSHEY_SIMPLEX, 1.1, (0, 0, 0), 6)
+        cv2.putText(
+            frame, line, origin, cv2.FONT_HERSHEY_SIMPLEX, 1.1, (255, 255, 255), 2
+        )
+    return frame
+
+
+def make_frame_set(count: int, lines_per_frame: int = 2, **kwargs) -> List[np.ndarray]:
+    """Build ``count`` frames cycling through SAMPLE_LINES."""
+    frames = []
+    for index in range(count):
+        lines = [
+            SAMPLE_LINES[(index + offset) % len(SAMPLE_LINES)]
+            for offset in range(lines_per_frame)
+        ]
+        frames.append(make_subtitle_frame(lines, seed=index, **kwargs))
+    return frames
+
+
+def make_line_crops(count: int, height: int = 48) -> List[np.ndarray]:
+    """Build single-line crops of varying width, as produced by line segmentation."""
+    crops = []
+    for index in range(count):
+        line = SAMPLE_LINES[index % len(SAMPLE_LINES)]
+        (text_w, _), _ = cv2.getTextSize(line, cv2.FONT_HERSHEY_SIMPLEX, 1.0, 2)
+        crop = make_subtitle_frame([line], width=text_w + 24, height=height, seed=index)
+        crops.append(crop)
+    return crops
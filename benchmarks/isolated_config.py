@@ -0,0 +1,46 @@
+"""A real ConfigManager for harnesses, isolated from the repo's .env.
+
+ConfigManager reads settings from os.environ (load_dotenv never overrides
+existing variables), writes changes back to its .env file and registers an
+atexit flush. isolated_config gives a harness a manager backed by a
+temporary .env, applies the given values to the environment only for the
+duration of the block, and undoes all of it afterwards.
+"""
+
+import atexit
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+
+@contextlib.contextmanager
+def isolated_config(**values) -> Iterator:
+    """Yield a ConfigManager whose settings are values over the defaults.
+
+    Example:
+        with isolated_config(TRANSLATION_SERVICE="groq", GROQ_API_KEY="k") as cfg:
+            worker = TranslationWorker(cfg)
+    """
+    from core.config_manager import ConfigManager
+
+    values = {key: str(value) for key, value in values.items()}
+    saved_environ = dict(os.environ)
+    with tempfile.TemporaryDirectory(prefix="translator-config-") as directory:
+        env_path = Path(directory) / ".env"
+        env_path.write_text(
+            "".join(f"{key}={value}\n" for key, value in values.items()),
+            encoding="utf-8",
+        )
+        os.environ.update(values)
+        config = None
+        try:
+            config = ConfigManager(str(env_path))
+            yield config
+        finally:
+            if config is not None:
+                atexit.unregister(config.flush)
+                config.flush()
+            os.environ.clear()
+            os.environ.update(saved_environ)
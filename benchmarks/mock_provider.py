@@ -0,0 +1,487 @@
+"""Local stand-in for the translation providers' HTTP APIs.
+
+Implements the OpenAI-compatible chat-completions endpoint used by Groq,
+OpenRouter, SambaNova and Cerebras, and the Gemini generateContent /
+streamGenerateContent endpoints. Latency follows a configurable
+distribution; 429 and 5xx responses (with Retry-After) can be injected at
+random and a tokens-per-minute limit enforced, so throughput, key failover
+and rate-limit handling can be measured without real API calls.
+
+Usage:
+    python -m benchmarks.mock_provider --port 8765 --latency lognormal:350,0.4 \\
+        --rate-limit-rate 0.05 --error-rate 0.02 --tpm 60000
+
+Then point the services at it, e.g.:
+    GROQ_BASE_URL=http://127.0.0.1:8765/v1
+    GEMINI_BASE_URL=http://127.0.0.1:8765
+
+GET /stats returns request, error and token counters as JSON.
+"""
+
+import argparse
+import collections
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+_GEMINI_PATH = re.compile(r"/models/([^/:]+):(generateContent|streamGenerateContent)")
+
+
+class LatencyModel:
+    """Samples response latency in milliseconds from a named distribution.
+
+    Spec formats: ``fixed:MS``, ``uniform:MIN,MAX``, ``normal:MEAN,SD`` and
+    ``lognormal:MEDIAN,SIGMA``.
+    """
+
+    def __init__(self, spec: str = "fixed:300", seed: Optional[int] = None):
+        kind, _, params = spec.partition(":")
+        self.kind = kind.strip().lower()
+        self.params = [float(value) for value in params.split(",") if value.strip()]
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        if expected.get(self.kind) != len(self.params):
+            raise ValueError(f"Invalid latency spec: {spec}")
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample_ms(self) -> float:
+        with self._lock:
+            if self.kind == "fixed":
+                value = self.params[0]
+            elif self.kind == "uniform":
+                value = self._random.uniform(*self.params)
+            elif self.kind == "normal":
+                value = self._random.gauss(*self.params)
+            else:
+                median, sigma = self.params
+                value = self._random.lognormvariate(math.log(median), sigma)
+        return max(0.0, value)
+
+
+class TokenBucket:
+    """Sliding 60-second token window enforcing a tokens-per-minute limit."""
+
+    def __init__(self, tokens_per_minute: int = 0):
+        self.limit = tokens_per_minute
+        self._events: "collections.deque[Tuple[float, int]]" = collections.deque()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def consume(self, tokens: int) -> float:
+        """Record usage; return 0.0 if allowed, else seconds until it would be."""
+        if self.limit <= 0:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            while self._events and now - self._events[0][0] >= 60.0:
+                self._used -= self._events.popleft()[1]
+            if self._used + tokens <= self.limit:
+                self._events.append((now, tokens))
+                self._used += tokens
+                return 0.0
+            freed = 0
+            for started, used in self._events:
+                freed += used
+                if self._used - freed + tokens <= self.limit:
+                    return max(0.1, 60.0 - (now - started))
+            return 60.0
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class MockProviderState:
+    """Behaviour settings and counters shared by all request handlers."""
+
+    def __init__(
+        self,
+        latency: str = "fixed:300",
+        first_token_ms: float = 150.0,
+        token_interval_ms: float = 15.0,
+        rate_limit_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 2.0,
+        tokens_per_minute: int = 0,
+        image_tokens: int = 258,
+        reply: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        self.latency = LatencyModel(latency, seed)
+        self.first_token_ms = first_token_ms
+        self.token_interval_ms = token_interval_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.bucket = TokenBucket(tokens_per_minute)
+        self.image_tokens = image_tokens
+        self.reply = reply
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = collections.Counter()
+
+    def count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def roll_fault(self) -> Optional[Tuple[int, float]]:
+        """Return (status, retry_after) for an injected failure, if any."""
+        with self._lock:
+            roll = self._random.random()
+            status = None
+            if roll < self.rate_limit_rate:
+                status = 429
+            elif roll < self.rate_limit_rate + self.error_rate:
+                status = self._random.choice((500, 502, 503))
+        if status is None:
+            return None
+        return status, self.retry_after
+
+    def reply_for(self, prompt: str) -> str:
+        if self.reply is not None:
+            return self.reply
+        snippet = " ".join(prompt.split())[-60:]
+        return f"[mock translation] {snippet}".strip()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.stats)
+
+
+class MockProviderHandler(BaseHTTPRequestHandler):
+    server_version = "MockProvider/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> MockProviderState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        logging.debug("mock provider: " + format, *args)
+
+    def _send_json(
+        self, status: int, payload: dict, headers: Optional[dict] = None
+    ) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, retry_after: float, gemini: bool) -> None:
+        self.state.count(f"status_{status}")
+        headers = {"Retry-After": str(int(math.ceil(retry_after)))}
+        message = "Rate limit exceeded" if status == 429 else "Upstream error"
+        if gemini:
+            payload = {
+                "error": {
+                    "code": status,
+                    "message": message,
+                    "status": (
+                        "RESOURCE_EXHAUSTED" if status == 429 else "UNAVAILABLE"
+                    ),
+                }
+            }
+        else:
+            payload = {
+                "error": {
+                    "message": message,
+                    "type": "rate_limit_exceeded" if status == 429 else "server_error",
+                    "code": status,
+                }
+            }
+        self._send_json(status, payload, headers)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(raw or b"{}")
+        except ValueError:
+            return {}
+
+    def _admit(self, prompt_tokens: int, completion_tokens: int, gemini: bool) -> bool:
+        """Apply fault injection and the TPM limit; send the error if rejected."""
+        fault = self.state.roll_fault()
+        if fault is not None:
+            self._send_error(fault[0], fault[1], gemini)
+            return False
+        wait = self.state.bucket.consume(prompt_tokens + completion_tokens)
+        if wait:
+            self.state.count("tpm_rejections")
+            self._send_error(429, wait, gemini)
+            return False
+        self.state.count("prompt_tokens", prompt_tokens)
+        self.state.count("completion_tokens", completion_tokens)
+        return True
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            self._send_json(200, self.state.snapshot())
+        else:
+            self._send_json(404, {"error": {"message": "Not found"}})
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0]
+        body = self._read_body()
+        if path.endswith("/chat/completions"):
+            self._chat_completions(body)
+            return
+        match = _GEMINI_PATH.search(path)
+        if match:
+            stream = match.group(2) == "streamGenerateContent"
+            self._generate_content(match.group(1), body, stream)
+            return
+        self._send_json(404, {"error": {"message": f"Unknown endpoint {path}"}})
+
+    # OpenAI-compatible chat completions
+
+    def _chat_prompt(self, body: dict) -> Tuple[str, int]:
+        texts = []
+        images = 0
+        for message in body.get("messages", []):
+            content = message.get("content")
+            if isinstance(content, str):
+                texts.append(content)
+                continue
+            for part in content or []:
+                if part.get("type") == "text":
+                    texts.append(part.get("text", ""))
+                elif part.get("type") == "image_url":
+                    images += 1
+        prompt = "\n".join(texts)
+        return prompt, estimate_tokens(prompt) + images * self.state.image_tokens
+
+    def _chat_completions(self, body: dict) -> None:
+        self.state.count("requests")
+        self.state.count("chat_requests")
+        prompt, prompt_tokens = self._chat_prompt(body)
+        reply = self.state.reply_for(prompt)
+        completion_tokens = estimate_tokens(reply)
+        if not self._admit(prompt_tokens, completion_tokens, gemini=False):
+            return
+
+        model = body.get("model", "mock-model")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+        if not body.get("stream"):
+            time.sleep(self.state.latency.sample_ms() / 1000)
+            self._send_json(
+                200,
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": reply},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                },
+            )
+            return
+
+        def chunk(delta: dict, finish_reason=None) -> dict:
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+            }
+
+        events = [chunk({"role": "assistant", "content": ""})]
+        events += [chunk({"content": piece}) for piece in _split_tokens(reply)]
+        events.append(chunk({}, "stop"))
+        self._stream_sse(events, done_marker=True)
+
+    # Gemini generateContent
+
+    def _gemini_prompt(self, body: dict) -> Tuple[str, int]:
+        texts = []
+        images = 0
+        for content in body.get("contents", []):
+            for part in content.get("parts", []):
+                if "text" in part:
+                    texts.append(part["text"])
+                elif "inlineData" in part or "inline_data" in part:
+                    images += 1
+        prompt = "\n".join(texts)
+        return prompt, estimate_tokens(prompt) + images * self.state.image_tokens
+
+    def _generate_content(self, model: str, body: dict, stream: bool) -> None:
+        self.state.count("requests")
+        self.state.count("gemini_requests")
+        prompt, prompt_tokens = self._gemini_prompt(body)
+        reply = self.state.reply_for(prompt)
+        completion_tokens = estimate_tokens(reply)
+        if not self._admit(prompt_tokens, completion_tokens, gemini=True):
+            return
+
+        def response(text: str, finish_reason: Optional[str]) -> dict:
+            candidate = {
+                "content": {"parts": [{"text": text}], "role": "model"},
+                "index": 0,
+            }
+            if finish_reason:
+                candidate["finishReason"] = finish_reason
+            return {
+                "candidates": [candidate],
+                "usageMetadata": {
+                    "promptTokenCount": prompt_tokens,
+                    "candidatesTokenCount": completion_tokens,
+                    "totalTokenCount": prompt_tokens + completion_tokens,
+                },
+                "modelVersion": model,
+            }
+
+        if not stream:
+            time.sleep(self.state.latency.sample_ms() / 1000)
+            self._send_json(200, response(reply, "STOP"))
+            return
+
+        pieces = _split_tokens(reply)
+        events = [
+            response(piece, "STOP" if index == len(pieces) - 1 else None)
+            for index, piece in enumerate(pieces)
+        ]
+        self._stream_sse(events, done_marker=False)
+
+    def _stream_sse(self, events, done_marker: bool) -> None:
+        self.state.count("streams")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        time.sleep(self.state.first_token_ms / 1000)
+        for index, event in enumerate(events):
+            if index:
+                time.sleep(self.state.token_interval_ms / 1000)
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        if done_marker:
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+
+
+def _split_tokens(text: str):
+    pieces = re.findall(r"\S+\s*", text)
+    return pieces or [""]
+
+
+class MockProviderServer:
+    """Runs the mock provider on a background thread.
+
+    Args:
+        host: Interface to bind (localhost by default)
+        port: Port to bind; 0 picks a free port
+        **settings: MockProviderState options
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **settings):
+        self.state = MockProviderState(**settings)
+        self._server = ThreadingHTTPServer((host, port), MockProviderHandler)
+        self._server.daemon_threads = True
+        self._server.state = self.state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockProviderServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="MockProvider", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def __enter__(self) -> "MockProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--latency",
+        default="fixed:300",
+        help="fixed:MS | uniform:MIN,MAX | normal:MEAN,SD | lognormal:MEDIAN,SIGMA",
+    )
+    parser.add_argument("--first-token-ms", type=float, default=150.0)
+    parser.add_argument("--token-interval-ms", type=float, default=15.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=2.0)
+    parser.add_argument("--tpm", type=int, default=0, help="tokens per minute (0=off)")
+    parser.add_argument("--reply", help="fixed reply text instead of an echo")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = MockProviderServer(
+        args.host,
+        args.port,
+        latency=args.latency,
+        first_token_ms=args.first_token_ms,
+        token_interval_ms=args.token_interval_ms,
+        rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+        tokens_per_minute=args.tpm,
+        reply=args.reply,
+        seed=args.seed,
+    )
+    logging.info("Mock provider listening on %s", server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    logging.info("Mock provider stats: %s", server.state.snapshot())
+
+
+if __name__ == "__main__":
+    main()
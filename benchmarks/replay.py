@@ -0,0 +1,466 @@
+"""Replay recorded frames through the real OCR monitor and translation worker.
+
+A replay source stands in for the screen capture function: it returns the
+frame of a video file, a directory of PNG frames or a synthetic subtitle
+track at the current replay time. The real AutoOCRMonitor (OCR, stability
+and debounce logic) and TranslationWorker run against it, with a mock
+translation service, and every subtitle is reported with its appearance
+-> emission -> translation latency.
+
+Usage:
+    python -m benchmarks.replay --synthetic 6
+    python -m benchmarks.replay --video clip.mp4 --subtitles clip.srt --speed 2
+    python -m benchmarks.replay --frames-dir dump/ --fps 10 --subtitles dump.srt
+"""
+
+import abc
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import random
+import statistics
+import sys
+import threading
+import time
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from benchmarks.frames import SAMPLE_LINES, make_subtitle_frame
+from benchmarks.isolated_config import isolated_config
+
+
+class Subtitle:
+    """Ground-truth subtitle with media times in seconds."""
+
+    __slots__ = ("text", "start", "end")
+
+    def __init__(self, text: str, start: float, end: float):
+        self.text = text
+        self.start = start
+        self.end = end
+
+
+_SRT_TIME = re.compile(r"(\d+):(\d+):(\d+)[,.](\d+)\s*-->\s*(\d+):(\d+):(\d+)[,.](\d+)")
+
+
+def load_srt(path: str) -> List[Subtitle]:
+    """Parse an .srt file into subtitles."""
+    with open(path, "r", encoding="utf-8-sig") as handle:
+        blocks = re.split(r"\n\s*\n", handle.read().strip())
+
+    subtitles = []
+    for block in blocks:
+        lines = block.strip().splitlines()
+        for index, line in enumerate(lines):
+            match = _SRT_TIME.search(line)
+            if not match:
+                continue
+            h1, m1, s1, ms1, h2, m2, s2, ms2 = (int(v) for v in match.groups())
+            start = h1 * 3600 + m1 * 60 + s1 + ms1 / 1000
+            end = h2 * 3600 + m2 * 60 + s2 + ms2 / 1000
+            text = "\n".join(lines[index + 1 :]).strip()
+            subtitles.append(Subtitle(text, start, end))
+            break
+    return subtitles
+
+
+class ReplaySource(abc.ABC):
+    """Frames addressed by media time; ``frame_at`` returns RGB arrays."""
+
+    duration = 0.0
+    subtitles: List[Subtitle] = []
+
+    @abc.abstractmethod
+    def frame_at(self, media_time: float) -> Optional[np.ndarray]:
+        """Return the frame shown at media_time, or None past the end."""
+
+    def close(self) -> None:
+        pass
+
+
+class VideoReplaySource(ReplaySource):
+    """Decodes a video file forward, using the container's frame timestamps."""
+
+    def __init__(self, path: str):
+        self._capture = cv2.VideoCapture(path)
+        if not self._capture.isOpened():
+            raise ValueError(f"Cannot open video: {path}")
+        fps = self._capture.get(cv2.CAP_PROP_FPS) or 30.0
+        frames = self._capture.get(cv2.CAP_PROP_FRAME_COUNT)
+        self.duration = frames / fps if frames > 0 else float("inf")
+        self._current: Optional[np.ndarray] = None
+        self._next: Optional[np.ndarray] = None
+        self._next_time = 0.0
+        self._read_next()
+
+    def _read_next(self) -> None:
+        ok, frame = self._capture.read()
+        if not ok:
+            self._next = None
+            return
+        self._next_time = self._capture.get(cv2.CAP_PROP_POS_MSEC) / 1000
+        self._next = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    def frame_at(self, media_time: float) -> Optional[np.ndarray]:
+        while self._next is not None and self._next_time <= media_time:
+            self._current = self._next
+            self._read_next()
+        if self._next is None and self._current is None:
+            return None
+        return self._current if self._current is not None else self._next
+
+    def close(self) -> None:
+        self._capture.release()
+
+
+class FrameDirReplaySource(ReplaySource):
+    """PNG frames from a directory, in name order, at a fixed frame rate."""
+
+    def __init__(self, path: str, fps: float = 10.0):
+        self._paths = sorted(glob.glob(os.path.join(path, "*.png")))
+        if not self._paths:
+            raise ValueError(f"No PNG frames in {path}")
+        self.fps = fps
+        self.duration = len(self._paths) / fps
+        self._loaded_index = -1
+        self._frame: Optional[np.ndarray] = None
+
+    def frame_at(self, media_time: float) -> Optional[np.ndarray]:
+        index = min(len(self._paths) - 1, int(media_time * self.fps))
+        if index != self._loaded_index:
+            frame = cv2.imread(self._paths[index], cv2.IMREAD_COLOR)
+            self._frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            self._loaded_index = index
+        return self._frame
+
+
+class SyntheticReplaySource(ReplaySource):
+    """Rendered subtitles with known timings, for runs without recordings."""
+
+    def __init__(self, count: int = 6, shown: float = 2.5, gap: float = 0.5):
+        self.subtitles = []
+        media_time = gap
+        for index in range(count):
+            text = SAMPLE_LINES[index % len(SAMPLE_LINES)]
+            self.subtitles.append(Subtitle(text, media_time, media_time + shown))
+            media_time += shown + gap
+        self.duration = media_time
+        self._blank = make_subtitle_frame([], seed=0)
+        self._rendered = {}
+
+    def frame_at(self, media_time: float) -> Optional[np.ndarray]:
+        for index, subtitle in enumerate(self.subtitles):
+            if subtitle.start <= media_time < subtitle.end:
+                if index not in self._rendered:
+                    self._rendered[index] = make_subtitle_frame(
+                        [subtitle.text], seed=index
+                    )
+                return self._rendered[index]
+        return self._blank
+
+
+class ReplayCapture:
+    """Capture function for AutoOCRMonitor backed by a replay source.
+
+    Media time advances with the wall clock multiplied by ``speed``. The
+    region is interpreted in source-frame pixels, so a monitor that narrows
+    its capture region (auto band) gets the matching crop.
+    """
+
+    def __init__(self, source: ReplaySource, speed: float = 1.0):
+        self.source = source
+        self.speed = speed
+        self.started: Optional[float] = None
+        self.finished = threading.Event()
+        self.frames = 0
+
+    def media_time(self, wall_time: float) -> float:
+        return (wall_time - self.started) * self.speed
+
+    def wall_time(self, media_time: float) -> float:
+        return self.started + media_time / self.speed
+
+    def __call__(self, region) -> Optional[np.ndarray]:
+        now = time.time()
+        if self.started is None:
+            self.started = now
+        media_time = self.media_time(now)
+        if media_time >= self.source.duration:
+            self.finished.set()
+            return None
+
+        frame = self.source.frame_at(media_time)
+        if frame is None:
+            self.finished.set()
+            return None
+        self.frames += 1
+        left, top, width, height = (int(v) for v in region)
+        return frame[top : top + height, left : left + width]
+
+
+class MockTranslationService:
+    """Stand-in provider with the get_or_translate contract and fake latency."""
+
+    def __init__(self, latency_ms: float = 400.0, jitter_ms: float = 100.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.calls = 0
+
+    def get_or_translate(
+        self,
+        region,
+        history=None,
+        last_hash=None,
+        cache=None,
+        screenshot_np=None,
+        precomputed_ocr=None,
+    ):
+        self.calls += 1
+        delay = max(0.0, random.gauss(self.latency_ms, self.jitter_ms)) / 1000
+        time.sleep(delay)
+        text = precomputed_ocr[0] if precomputed_ocr else ""
+        return (f"[translated] {text}" if text else "__NO_TEXT__"), None
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def run(
+    source: ReplaySource,
+    subtitles: List[Subtitle],
+    speed: float = 1.0,
+    source_lang: str = "en",
+    interval: float = 0.15,
+    stability_frames: int = 3,
+    latency_ms: float = 400.0,
+    jitter_ms: float = 100.0,
+    monitor_options: Optional[dict] = None,
+) -> dict:
+    """Replay a source through the monitor and worker; return the latency report."""
+    from PyQt5.QtCore import QCoreApplication, Qt
+
+    from core.tracing import finish_trace
+    from subtitle.ocr_engines import select_engine
+    from subtitle.subtitle_ocr import warm_up_ocr
+    from threads.auto_ocr_monitor import AutoOCRMonitor
+    from threads.translation_worker import TranslationWorker
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+
+    service = MockTranslationService(latency_ms, jitter_ms)
+
+    class ReplayWorker(TranslationWorker):
+        def _refresh_service(self):
+            self.service = service
+
+    first_frame = source.frame_at(0.0)
+    if first_frame is None:
+        raise ValueError("Replay source has no frames")
+    region = (0, 0, first_frame.shape[1], first_frame.shape[0])
+
+    # A real config (isolated from the repo .env) so the worker reads the
+    # same settings it would in the app.
+    with isolated_config(TRANSLATION_SERVICE="mock", HOT_PATH_LOG_RATE=2.0) as config:
+        capture = ReplayCapture(source, speed)
+        worker = ReplayWorker(config)
+        monitor = AutoOCRMonitor(
+            region=region,
+            capture_func=capture,
+            source_lang=source_lang,
+            # Keep frames and debounce per second of media constant across speeds.
+            interval=interval / speed,
+            sim_thresh=0.85,
+            duplicate_ratio=0.95,
+            debounce_seconds=0.2 / speed,
+            stability_frames=stability_frames,
+            **(monitor_options or {}),
+        )
+
+        lock = threading.Lock()
+        emissions = []
+        translations = {}
+
+        def on_change(frame, ocr_data, trace_id=None):
+            now = time.time()
+            with lock:
+                emissions.append((now, ocr_data[0] if ocr_data else ""))
+            worker.translate_frame(
+                frame,
+                region,
+                precomputed_ocr=ocr_data,
+                timestamp=now,
+                trace_id=trace_id,
+            )
+
+        def on_speculation(frame, ocr_data):
+            worker.speculate(frame, region, ocr_data)
+
+        def on_finished(text, timestamp, _image_hash, trace_id=None):
+            finish_trace(trace_id)
+            with lock:
+                translations.setdefault(timestamp, (time.time(), text))
+
+        monitor.change_detected.connect(on_change, Qt.DirectConnection)
+        monitor.speculation_requested.connect(on_speculation, Qt.DirectConnection)
+        worker.translation_finished.connect(on_finished, Qt.DirectConnection)
+
+        # Load the OCR engine now: a cold start inside the first timed frame
+        # would run the media clock while nothing is captured.
+        engine = select_engine(source_lang)
+        if engine is not None:
+            warm_up_ocr(lang=source_lang, **engine.ocr_kwargs)
+
+        monitor.start()
+        try:
+            while not capture.finished.wait(0.05):
+                app.processEvents()
+        finally:
+            monitor.stop()
+            monitor.wait(5000)
+        # Let in-flight translations finish.
+        deadline = time.time() + (latency_ms + 4 * jitter_ms) / 1000 + 1.0
+        while time.time() < deadline:
+            with lock:
+                if len(translations) >= len(emissions):
+                    break
+            time.sleep(0.05)
+        worker.shutdown()
+        source.close()
+
+    rows = []
+    claimed = set()
+    for subtitle in subtitles:
+        appeared = capture.wall_time(subtitle.start)
+        row = {
+            "text": subtitle.text,
+            "start": round(subtitle.start, 3),
+            "end": round(subtitle.end, 3),
+            "ocr_text": None,
+            "emission_ms": None,
+            "translation_ms": None,
+        }
+        for index, (emitted, ocr_text) in enumerate(emissions):
+            if index in claimed:
+                continue
+            # An emission belongs to the subtitle on screen when it was captured.
+            if appeared <= emitted <= capture.wall_time(subtitle.end) + 1.0:
+                claimed.add(index)
+                row["ocr_text"] = ocr_text
+                row["emission_ms"] = round((emitted - appeared) * 1000, 1)
+                finished = translations.get(emitted)
+                if finished is not None:
+                    row["translation_ms"] = round((finished[0] - appeared) * 1000, 1)
+                break
+        rows.append(row)
+
+    emission_ms = [row["emission_ms"] for row in rows if row["emission_ms"] is not None]
+    translation_ms = [
+        row["translation_ms"] for row in rows if row["translation_ms"] is not None
+    ]
+    return {
+        "speed": speed,
+        "frames_captured": capture.frames,
+        "subtitles": len(rows),
+        "detected": len(emission_ms),
+        "missed": len(rows) - len(emission_ms),
+        "extra_emissions": len(emissions) - len(claimed),
+        "provider_calls": service.calls,
+        "emission_ms": {
+            "p50": _percentile(emission_ms, 0.5),
+            "p95": _percentile(emission_ms, 0.95),
+            "mean": round(statistics.mean(emission_ms), 1) if emission_ms else 0.0,
+        },
+        "translation_ms": {
+            "p50": _percentile(translation_ms, 0.5),
+            "p95": _percentile(translation_ms, 0.95),
+            "mean": (
+                round(statistics.mean(translation_ms), 1) if translation_ms else 0.0
+            ),
+        },
+        "rows": rows,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--video", help="video file to replay")
+    group.add_argument("--frames-dir", help="directory of PNG frames")
+    group.add_argument("--synthetic", type=int, help="render N synthetic subtitles")
+    parser.add_argument("--subtitles", help=".srt with ground-truth subtitle timings")
+    parser.add_argument("--fps", type=float, default=10.0, help="frame rate of PNGs")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed")
+    parser.add_argument("--lang", default="en", help="source language")
+    parser.add_argument("--interval", type=float, default=0.15)
+    parser.add_argument("--stability-frames", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=400.0)
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--speculative", action="store_true")
+    parser.add_argument("--line-incremental", action="store_true")
+    parser.add_argument("--auto-band", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.synthetic:
+        source = SyntheticReplaySource(args.synthetic)
+    elif args.video:
+        source = VideoReplaySource(args.video)
+    else:
+        source = FrameDirReplaySource(args.frames_dir, args.fps)
+    subtitles = load_srt(args.subtitles) if args.subtitles else source.subtitles
+    if not subtitles:
+        parser.error("--subtitles is required for video and frame replays")
+
+    results = run(
+        source,
+        subtitles,
+        speed=args.speed,
+        source_lang=args.lang,
+        interval=args.interval,
+        stability_frames=args.stability_frames,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        monitor_options={
+            "speculative": args.speculative,
+            "line_incremental": args.line_incremental,
+            "auto_band": args.auto_band,
+        },
+    )
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"Replay: {results['subtitles']} subtitles, {results['detected']} detected, "
+        f"{results['missed']} missed, {results['extra_emissions']} extra emissions "
+        f"(speed {args.speed}x, {results['frames_captured']} frames)"
+    )
+    for row in results["rows"]:
+        emission = "-" if row["emission_ms"] is None else f"{row['emission_ms']:.0f}"
+        translation = (
+            "-" if row["translation_ms"] is None else f"{row['translation_ms']:.0f}"
+        )
+        print(
+            f"  {row['start']:>8.2f}s  emit {emission:>6} ms  "
+            f"translated {translation:>6} ms  {row['text'][:40]!r}"
+        )
+    for key in ("emission_ms", "translation_ms"):
+        stats = results[key]
+        print(
+            f"  {key:<15} p50={stats['p50']:.0f}  p95={stats['p95']:.0f}  mean={stats['mean']:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
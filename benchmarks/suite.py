@@ -0,0 +1,389 @@
+"""Hot-path latency benchmark suite with baseline comparison.
+
+Each case times one hot path of the capture -> OCR -> translate pipeline and
+reports median/p95/min milliseconds per call. Cases whose dependencies are
+missing on this machine (PyQt5, imagehash, openai, ...) are reported as
+skipped rather than failing the run.
+
+Usage:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --tolerance 0.25
+
+With --baseline, the exit status is 1 when any case's median is slower than
+the baseline median by more than the tolerance (a per-case "tolerance" in
+the baseline file overrides the command-line value).
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import platform
+import statistics
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.frames import SAMPLE_LINES, make_line_crops, make_subtitle_frame
+
+CASES: Dict[str, Callable[[], Callable[[], None]]] = {}
+
+
+def case(name: str):
+    """Register a case; the decorated setup function returns the timed callable."""
+
+    def register(setup):
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+@case("capture_to_array")
+def _capture_to_array():
+    from PIL import Image
+
+    screenshot = Image.fromarray(make_subtitle_frame(SAMPLE_LINES[:2]))
+    return lambda: np.array(screenshot)
+
+
+@case("preprocess_winocr")
+def _preprocess_winocr():
+    from subtitle.ocr_preprocess import OCRPreprocessor
+
+    preprocessor = OCRPreprocessor()
+    frame = make_subtitle_frame(SAMPLE_LINES[:2])
+    return lambda: preprocessor.prepare_winocr(frame)
+
+
+@case("preprocess_rapidocr")
+def _preprocess_rapidocr():
+    from subtitle.ocr_preprocess import OCRPreprocessor
+
+    preprocessor = OCRPreprocessor()
+    frame = make_subtitle_frame(SAMPLE_LINES[:2])
+    return lambda: preprocessor.prepare_rapidocr(frame)
+
+
+@case("rapidocr_recognition")
+def _rapidocr_recognition():
+    from subtitle.subtitle_ocr import (
+        RAPIDOCR_REC_MODEL_PATH,
+        _recognize_text_lines_local,
+    )
+
+    crops = make_line_crops(4)
+    # The in-process path times the engine, not the OCR result cache.
+    _recognize_text_lines_local(crops[:1], rec_model_path=RAPIDOCR_REC_MODEL_PATH)
+    return lambda: _recognize_text_lines_local(
+        crops, rec_model_path=RAPIDOCR_REC_MODEL_PATH
+    )
+
+
+@case("check_stability")
+def _check_stability():
+    from threads.auto_ocr_monitor import AutoOCRMonitor
+
+    monitor = SimpleNamespace(
+        stability_frames=3,
+        sim_thresh=0.85,
+        _text_history=[SAMPLE_LINES[0], SAMPLE_LINES[0] + ".", SAMPLE_LINES[0]],
+    )
+    return lambda: AutoOCRMonitor._check_stability(monitor)
+
+
+@case("text_cache_similarity")
+def _text_cache_similarity():
+    import collections
+
+    from threads.translation_worker import TranslationWorker
+
+    from core.log_sampling import RateLimitedLogger
+
+    worker = SimpleNamespace(
+        duplicate_ratio=0.92,
+        _hot_log=RateLimitedLogger(),
+        text_cache=collections.OrderedDict(
+            (f"{SAMPLE_LINES[i % len(SAMPLE_LINES)]} #{i}", f"translation {i}")
+            for i in range(50)
+        ),
+    )
+    # A miss scans the full cache, which is the expensive case.
+    return lambda: TranslationWorker._check_text_cache(worker, "An unseen line")
+
+
+def _frame_log_fixture():
+    """A buffered logger at INFO plus one frame's worth of monitor state."""
+    from core.log_buffer import MemoryLogHandler
+
+    logger = logging.getLogger("benchmarks.frame_logging")
+    logger.handlers[:] = [MemoryLogHandler(capacity=1000)]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    now = time.time()
+    frame = SimpleNamespace(
+        engine="RapidOCR",
+        text=SAMPLE_LINES[0],
+        conf=0.93,
+        sims=[0.71, 0.96],
+        times=(now, now + 0.004, now + 0.031, now + 0.032),
+        last_change=now - 1.5,
+    )
+    return logger, frame
+
+
+@case("frame_logging_eager")
+def _frame_logging_eager():
+    logger, f = _frame_log_fixture()
+
+    def log_frame():
+        # The monitor's per-frame logging before rate limiting.
+        t0, t1, t2, t3 = f.times
+        logger.info("OCR Monitor [%s]: '%s' (conf=%.2f)", f.engine, f.text[:50], f.conf)
+        timing_log = (
+            f"Timings(ms): Capture={int((t1 - t0) * 1000)}, "
+            f"OCR={int((t2 - t1) * 1000)}, Logic={int((t3 - t2) * 1000)}. "
+            f"Since change: {time.time() - f.last_change:.2f}s"
+        )
+        logger.info(
+            "Chain below threshold (sims=%s). %s",
+            [f"{s:.2f}" for s in f.sims],
+            timing_log,
+        )
+
+    return log_frame
+
+
+@case("frame_logging_sampled")
+def _frame_logging_sampled():
+    from core.log_sampling import RateLimitedLogger
+
+    logger, f = _frame_log_fixture()
+    hot_log = RateLimitedLogger(logger, max_per_second=2)
+
+    def log_frame():
+        t0, t1, t2, t3 = f.times
+        hot_log.info(
+            "ocr_result",
+            "OCR Monitor [%s]: '%s' (conf=%.2f)",
+            lambda: (f.engine, f.text[:50], f.conf),
+        )
+        hot_log.info(
+            "unstable",
+            "Chain below threshold (sims=%s). %s",
+            lambda: (
+                [f"{s:.2f}" for s in f.sims],
+                f"Timings(ms): Capture={int((t1 - t0) * 1000)}, "
+                f"OCR={int((t2 - t1) * 1000)}, Logic={int((t3 - t2) * 1000)}. "
+                f"Since change: {time.time() - f.last_change:.2f}s",
+            ),
+        )
+
+    return log_frame
+
+
+@case("phash")
+def _phash():
+    import imagehash
+    from PIL import Image
+
+    frame = make_subtitle_frame(SAMPLE_LINES[:2])
+    return lambda: imagehash.phash(Image.fromarray(frame))
+
+
+@case("jpeg_base64")
+def _jpeg_base64():
+    from subtitle.utils import encode_image_to_base64
+
+    frame = make_subtitle_frame(SAMPLE_LINES[:2])
+    return lambda: encode_image_to_base64(frame)
+
+
+@case("worker_round_trip")
+def _worker_round_trip():
+    from PyQt5.QtCore import Qt
+
+    from benchmarks.isolated_config import isolated_config
+    from benchmarks.mock_provider import MockProviderServer
+    from threads.translation_worker import TranslationWorker
+
+    # Server and config (environment included) are undone by close().
+    resources = contextlib.ExitStack()
+    server = MockProviderServer(latency="fixed:20").start()
+    resources.callback(server.stop)
+    try:
+        config = resources.enter_context(
+            isolated_config(
+                TRANSLATION_SERVICE="groq",
+                GROQ_API_KEY="mock-key",
+                GROQ_API_KEY_POOL="",
+                GROQ_BASE_URL=f"{server.url}/v1",
+            )
+        )
+        worker = TranslationWorker(config)
+        resources.callback(worker.shutdown)
+        if worker.get_service() is None:
+            raise RuntimeError("translation service could not be created")
+    except Exception:
+        resources.close()
+        raise
+
+    done = threading.Event()
+    worker.translation_finished.connect(lambda *args: done.set(), Qt.DirectConnection)
+    worker.translation_error.connect(lambda *args: done.set(), Qt.DirectConnection)
+    frames = [
+        make_subtitle_frame([line], seed=i) for i, line in enumerate(SAMPLE_LINES)
+    ]
+    counter = iter(range(sys.maxsize))
+
+    def round_trip():
+        index = next(counter)
+        # Fresh caches so every call reaches the provider.
+        worker.cache.clear()
+        worker.text_cache.clear()
+        done.clear()
+        text = f"{SAMPLE_LINES[index % len(SAMPLE_LINES)]} {index}"
+        worker.translate_frame(
+            frames[index % len(frames)], (0, 0, 960, 140), (text, 0.99, 10.0)
+        )
+        if not done.wait(10):
+            raise TimeoutError("worker round trip timed out")
+
+    round_trip.close = resources.close
+    return round_trip
+
+
+def _time_case(func: Callable[[], None], repeats: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        func()
+    samples: List[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    ordered = sorted(samples)
+    return {
+        "runs": repeats,
+        "median_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 4),
+        "min_ms": round(ordered[0], 4),
+    }
+
+
+def run(names: Optional[List[str]] = None, repeats: int = 50, warmup: int = 3) -> dict:
+    results = {}
+    for name, setup in CASES.items():
+        if names and name not in names:
+            continue
+        try:
+            func = setup()
+        except Exception as exc:
+            results[name] = {"skipped": f"{type(exc).__name__}: {exc}"}
+            continue
+        try:
+            results[name] = _time_case(func, repeats, warmup)
+        except Exception as exc:
+            results[name] = {"skipped": f"{type(exc).__name__}: {exc}"}
+        finally:
+            close = getattr(func, "close", None)
+            if close is not None:
+                close()
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[dict]:
+    """Return one row per case present in both runs, flagging regressions."""
+    rows = []
+    for name, current in results["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if not reference or "median_ms" not in reference or "median_ms" not in current:
+            continue
+        allowed = reference.get("tolerance", tolerance)
+        ratio = (
+            current["median_ms"] / reference["median_ms"]
+            if reference["median_ms"]
+            else 1.0
+        )
+        rows.append(
+            {
+                "name": name,
+                "baseline_ms": reference["median_ms"],
+                "current_ms": current["median_ms"],
+                "ratio": round(ratio, 3),
+                "tolerance": allowed,
+                "regression": ratio > 1.0 + allowed,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="*", choices=sorted(CASES), help="cases")
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", help="write results as a new baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown of the median vs baseline (0.25 = 25%%)",
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = parser.parse_args()
+
+    results = run(args.only, args.repeats, args.warmup)
+
+    comparison = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            comparison = compare(results, json.load(handle), args.tolerance)
+        results["comparison"] = comparison
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump(results, handle, indent=2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Benchmark suite ({results['meta']['platform']})")
+        for name, stats in results["results"].items():
+            if "skipped" in stats:
+                print(f"  {name:<24} skipped ({stats['skipped']})")
+                continue
+            print(
+                f"  {name:<24} median {stats['median_ms']:>10.3f} ms  "
+                f"p95 {stats['p95_ms']:>10.3f} ms"
+            )
+        for row in comparison or []:
+            status = "REGRESSION" if row["regression"] else "ok"
+            print(
+                f"  {row['name']:<24} {row['baseline_ms']:>10.3f} -> "
+                f"{row['current_ms']:>10.3f} ms ({row['ratio']:.2f}x) {status}"
+            )
+
+    if comparison and any(row["regression"] for row in comparison):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,37 @@
+import atexit
 import logging
 import os
 import threading
+import time
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+
+
+class ConfigSnapshot:
+    """Read-only copy of every ConfigManager setting at one version.
+
+    Worker threads take one snapshot per request, so a request sees
+    consistent settings while the UI thread changes them, and can compare
+    version to decide whether derived state (prompts, clients) is stale.
+    """
+
+    __slots__ = ("version", "_values")
+
+    def __init__(self, version: int, values: Dict[str, object]):
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "_values", MappingProxyType(values))
+
+    def __getattr__(self, name: str):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("ConfigSnapshot is read-only")
 
 
 class ConfigManager:
@@ -14,9 +41,35 @@ class ConfigManager:
         self._env_path = env_path
         load_dotenv(env_path)
         self._write_lock = threading.Lock()
+        # Write-behind state: setters record dirty keys, a timer thread writes
+        # them in one atomic rewrite of the .env file.
+        self._flush_lock = threading.Lock()
+        self._dirty: Dict[str, str] = {}
+        self._dirty_since = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._write_delay = float(os.getenv("CONFIG_WRITE_DELAY", "1.0"))
+        # Seconds between .env mtime checks for hot reload (0 disables)
+        self._watch_interval = float(os.getenv("CONFIG_WATCH_INTERVAL", "1.0"))
+        atexit.register(self.flush)
+        # Raw .env values and mtime as last read, for reload_if_modified().
+        self._file_values = self._read_env_file()
+        self._env_mtime = self._stat_env_file()
+
+        self._load_values()
+        # Setters run on the UI thread, the flush timer and translation
+        # threads (API key rotation); versions must not be skipped or reused.
+        self._publish_lock = threading.Lock()
+        self._version = 0
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._publish_snapshot()
+
+    def _load_values(self) -> None:
+        """Parse every setting from the environment."""
         self._translation_service = os.getenv("TRANSLATION_SERVICE", "gemini")
         self._gemini_api_key = os.getenv("GEMINI_API_KEY", "")
         self._gemini_model = os.getenv("GEMINI_MODEL", "gemini-flash-lite-latest")
+        # Empty uses the SDK's default endpoint
+        self._gemini_base_url = os.getenv("GEMINI_BASE_URL", "")
         self._openrouter_api_key = os.getenv("OPENROUTER_API_KEY", "")
         self._openrouter_model = os.getenv("OPENROUTER_MODEL", "")
         self._openrouter_base_url = os.getenv(
@@ -73,6 +126,11 @@ class ConfigManager:
             if item.strip()
         )
         self._font_size = int(os.getenv("FONT_SIZE", "22"))
+        # Lines (text blocks) kept in the overlay; older ones are dropped
+        self._transcript_max_lines = int(os.getenv("TRANSCRIPT_MAX_LINES", "500"))
+        self._transcript_archive_enabled = self._get_bool(
+            "TRANSCRIPT_ARCHIVE_ENABLED", True
+        )
         self._overlay_width = int(os.getenv("OVERLAY_WIDTH", "300"))
         self._overlay_height = int(os.getenv("OVERLAY_HEIGHT", "700"))
         self._overlay_x = self._parse_optional_int(os.getenv("OVERLAY_X", ""))
@@ -86,10 +144,135 @@ class ConfigManager:
         self._ocr_duplicate_ratio = float(os.getenv("OCR_DUPLICATE_RATIO", "0.95"))
         self._ocr_debounce_seconds = float(os.getenv("OCR_DEBOUNCE_SECONDS", "0.2"))
         self._ocr_stability_frames = int(os.getenv("OCR_STABILITY_FRAMES", "3"))
+        self._ocr_engine_pool_size = int(os.getenv("OCR_ENGINE_POOL_SIZE", "1"))
+        self._ocr_intra_op_threads = int(os.getenv("OCR_INTRA_OP_THREADS", "0"))
+        self._ocr_inter_op_threads = int(os.getenv("OCR_INTER_OP_THREADS", "0"))
+        self._ocr_backend = os.getenv("OCR_BACKEND", "thread").strip().lower()
+        self._ocr_process_workers = int(os.getenv("OCR_PROCESS_WORKERS", "2"))
+        self._ocr_line_incremental = self._get_bool("OCR_LINE_INCREMENTAL", False)
+        self._ocr_line_cache_size = int(os.getenv("OCR_LINE_CACHE_SIZE", "64"))
+        self._ocr_result_cache_size = int(os.getenv("OCR_RESULT_CACHE_SIZE", "128"))
+        self._ocr_language_pack_cache_hours = float(
+            os.getenv("OCR_LANGUAGE_PACK_CACHE_HOURS", "24")
+        )
+        self._tracing_enabled = self._get_bool("TRACING_ENABLED", False)
+        self._trace_buffer_size = int(os.getenv("TRACE_BUFFER_SIZE", "256"))
+        self._trace_export_path = os.getenv(
+            "TRACE_EXPORT_PATH", "translator_trace.json"
+        )
+        # Per-call-site cap on per-frame log records (records per second)
+        self._hot_path_log_rate = float(os.getenv("HOT_PATH_LOG_RATE", "2"))
+        # 0 disables the localhost Prometheus endpoint
+        self._metrics_port = int(os.getenv("METRICS_PORT", "0"))
+        self._ocr_auto_band_enabled = self._get_bool("OCR_AUTO_BAND_ENABLED", False)
+        self._ocr_auto_band_warmup_seconds = float(
+            os.getenv("OCR_AUTO_BAND_WARMUP_SECONDS", "3.0")
+        )
+        self._ocr_auto_band_reexpand_seconds = float(
+            os.getenv("OCR_AUTO_BAND_REEXPAND_SECONDS", "30.0")
+        )
+        self._ocr_cascade_enabled = self._get_bool("OCR_CASCADE_ENABLED", False)
+        self._ocr_cascade_threshold = float(os.getenv("OCR_CASCADE_THRESHOLD", "0.7"))
+        self._ocr_speculative_enabled = self._get_bool("OCR_SPECULATIVE_ENABLED", False)
+        self._ocr_speculative_min_confidence = float(
+            os.getenv("OCR_SPECULATIVE_MIN_CONFIDENCE", "0.8")
+        )
 
         self._source_language = os.getenv("SOURCE_LANGUAGE", "ja").lower()
         self._target_language = os.getenv("TARGET_LANGUAGE", "en").lower()
 
+    def _publish_snapshot(self) -> None:
+        """Build the next snapshot; a single reference swap publishes it."""
+        names = [
+            name
+            for name, member in vars(ConfigManager).items()
+            if isinstance(member, property)
+        ]
+        with self._publish_lock:
+            self._version += 1
+            self._snapshot = ConfigSnapshot(
+                self._version, {name: getattr(self, name) for name in names}
+            )
+
+    def _read_env_file(self) -> Dict[str, Optional[str]]:
+        try:
+            return dict(dotenv_values(self._env_path))
+        except OSError:
+            return {}
+
+    def _stat_env_file(self) -> Optional[int]:
+        try:
+            return self._env_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_if_modified(self) -> Set[str]:
+        """Re-read .env if its mtime changed; return the settings that changed.
+
+        Settings are named like the ConfigManager properties; variables that
+        are read straight from the environment (e.g. GROQ_API_KEY_POOL) are
+        reported by their lower-cased key. Only keys whose value in the file
+        changed since it was last read are copied into the environment, so
+        variables set outside .env keep precedence as they do at startup.
+        Pending in-app changes are flushed first so they are neither lost nor
+        reverted.
+        """
+        if self._stat_env_file() == self._env_mtime:
+            return set()
+        self.flush()
+        self._env_mtime = self._stat_env_file()
+        values = self._read_env_file()
+        changed_keys = {
+            key
+            for key, value in values.items()
+            if value is not None and self._file_values.get(key) != value
+        }
+        self._file_values = values
+        if not changed_keys:
+            return set()
+        for key in changed_keys:
+            os.environ[key] = values[key]
+
+        previous = self._snapshot
+        try:
+            self._load_values()
+        except ValueError as exc:
+            logging.error("Ignoring .env reload, invalid value: %s", exc)
+            self._restore_values(previous)
+            return set()
+        self._publish_snapshot()
+        current = self._snapshot
+        changed = {
+            name
+            for name in current._values
+            if name != "version" and getattr(previous, name) != getattr(current, name)
+        }
+        changed.update(
+            key.lower() for key in changed_keys if key.lower() not in current._values
+        )
+        if changed:
+            logging.info(".env reloaded; changed settings: %s", sorted(changed))
+        return changed
+
+    def _restore_values(self, snapshot: ConfigSnapshot) -> None:
+        """Put back the private attributes behind each snapshotted property."""
+        for name in snapshot._values:
+            attribute = f"_{name}"
+            if name != "version" and hasattr(self, attribute):
+                setattr(self, attribute, getattr(snapshot, name))
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Return the current immutable snapshot (lock-free)."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def config_watch_interval(self) -> float:
+        return max(0.0, self._watch_interval)
+
     def _get_optional_float(self, key: str) -> Optional[float]:
         val = os.getenv(key)
         if val is not None:
@@ -99,6 +282,12 @@ class ConfigManager:
                 return None
         return None
 
+    def _get_bool(self, key: str, default: bool) -> bool:
+        raw = os.getenv(key)
+        if raw is None or raw.strip() == "":
+            return default
+        return raw.strip().lower() not in {"0", "false", "no"}
+
     def _parse_optional_int(self, val: str) -> Optional[int]:
         if val is None or val.strip() == "":
             return None
@@ -118,30 +307,87 @@ class ConfigManager:
         self._write_env_value("TRANSLATION_SERVICE", value)
 
     def _write_env_value(self, key: str, value: str) -> None:
-        try:
+        """Publish the change and mark key dirty; .env is written later."""
+        # A reload re-reads every setting from the environment, so in-app
+        # changes must be there too or an unrelated .env edit reverts them.
+        os.environ[key] = value
+        self._publish_snapshot()
+        with self._write_lock:
+            now = time.monotonic()
+            if not self._dirty:
+                self._dirty_since = now
+            self._dirty[key] = value
+            if self._write_delay <= 0:
+                flush_now = True
+            else:
+                flush_now = False
+                # Debounce, but never hold writes back longer than a few delays.
+                if (
+                    self._flush_timer is not None
+                    and now - self._dirty_since < self._write_delay * 5
+                ):
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if self._flush_timer is None:
+                    self._start_flush_timer(self._write_delay)
+        if flush_now:
+            self.flush()
+
+    def _start_flush_timer(self, delay: float) -> None:
+        """Schedule a flush after delay seconds; caller holds _write_lock."""
+        self._flush_timer = threading.Timer(delay, self.flush)
+        self._flush_timer.name = "ConfigWriter"
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write all dirty keys to .env now (temp file + rename)."""
+        with self._flush_lock:
             with self._write_lock:
-                lines: List[str] = []
-                if self._env_path.exists():
-                    lines = self._env_path.read_text(encoding="utf-8").splitlines()
-
-                key_prefix = f"{key}="
-                replaced = False
-                for index, line in enumerate(lines):
-                    if line.strip().startswith(key_prefix):
-                        lines[index] = f"{key}={value}"
-                        replaced = True
-                        break
-
-                if not replaced:
-                    lines.append(f"{key}={value}")
-
-                new_content = "\n".join(lines)
-                if lines and not new_content.endswith("\n"):
-                    new_content += "\n"
-
-                self._env_path.write_text(new_content, encoding="utf-8")
-        except Exception as exc:
-            logging.error("Failed to persist %s to %s: %s", key, self._env_path, exc)
+                pending, self._dirty = self._dirty, {}
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if not pending:
+                return
+            try:
+                self._rewrite_env(pending)
+            except Exception as exc:
+                logging.error(
+                    "Failed to persist %s to %s: %s",
+                    ", ".join(pending),
+                    self._env_path,
+                    exc,
+                )
+                with self._write_lock:
+                    # Keep values set since this flush started.
+                    self._dirty = {**pending, **self._dirty}
+                    # Retry later; a write made meanwhile may have armed one.
+                    if self._flush_timer is None:
+                        self._start_flush_timer(max(self._write_delay, 1.0))
+            else:
+                # Our own writes are not external edits to hot-reload.
+                self._file_values.update(pending)
+
+    def _rewrite_env(self, values: Dict[str, str]) -> None:
+        lines: List[str] = []
+        if self._env_path.exists():
+            lines = self._env_path.read_text(encoding="utf-8").splitlines()
+
+        remaining = dict(values)
+        for index, line in enumerate(lines):
+            key = line.strip().split("=", 1)[0]
+            if "=" in line and key in remaining:
+                lines[index] = f"{key}={remaining.pop(key)}"
+        lines.extend(f"{key}={value}" for key, value in remaining.items())
+
+        new_content = "\n".join(lines)
+        if lines and not new_content.endswith("\n"):
+            new_content += "\n"
+
+        temp_path = self._env_path.with_name(self._env_path.name + ".tmp")
+        temp_path.write_text(new_content, encoding="utf-8")
+        os.replace(temp_path, self._env_path)
 
     @property
     def gemini_api_key(self) -> str:
@@ -157,6 +403,10 @@ class ConfigManager:
     def gemini_model(self) -> str:
         return self._gemini_model
 
+    @property
+    def gemini_base_url(self) -> str:
+        return self._gemini_base_url
+
     @property
     def openrouter_api_key(self) -> str:
         return self._openrouter_api_key
@@ -295,6 +545,14 @@ class ConfigManager:
     def subtitle_ocr_max_lines(self) -> int:
         return self._subtitle_ocr_max_lines
 
+    @property
+    def transcript_max_lines(self) -> int:
+        return max(1, self._transcript_max_lines)
+
+    @property
+    def transcript_archive_enabled(self) -> bool:
+        return self._transcript_archive_enabled
+
     @property
     def font_size(self) -> int:
         return self._font_size
@@ -360,6 +618,90 @@ class ConfigManager:
     def ocr_stability_frames(self) -> int:
         return max(2, min(4, self._ocr_stability_frames))
 
+    @property
+    def ocr_engine_pool_size(self) -> int:
+        return max(1, self._ocr_engine_pool_size)
+
+    @property
+    def ocr_intra_op_threads(self) -> int:
+        return max(0, self._ocr_intra_op_threads)
+
+    @property
+    def ocr_inter_op_threads(self) -> int:
+        return max(0, self._ocr_inter_op_threads)
+
+    @property
+    def ocr_backend(self) -> str:
+        return self._ocr_backend
+
+    @property
+    def ocr_process_workers(self) -> int:
+        return max(1, self._ocr_process_workers)
+
+    @property
+    def ocr_line_incremental(self) -> bool:
+        return self._ocr_line_incremental
+
+    @property
+    def ocr_line_cache_size(self) -> int:
+        return max(1, self._ocr_line_cache_size)
+
+    @property
+    def ocr_result_cache_size(self) -> int:
+        return max(0, self._ocr_result_cache_size)
+
+    @property
+    def ocr_language_pack_cache_hours(self) -> float:
+        return max(0.0, self._ocr_language_pack_cache_hours)
+
+    @property
+    def tracing_enabled(self) -> bool:
+        return self._tracing_enabled
+
+    @property
+    def trace_buffer_size(self) -> int:
+        return self._trace_buffer_size
+
+    @property
+    def trace_export_path(self) -> str:
+        return self._trace_export_path
+
+    @property
+    def hot_path_log_rate(self) -> float:
+        return max(0.0, self._hot_path_log_rate)
+
+    @property
+    def metrics_port(self) -> int:
+        return max(0, self._metrics_port)
+
+    @property
+    def ocr_auto_band_enabled(self) -> bool:
+        return self._ocr_auto_band_enabled
+
+    @property
+    def ocr_auto_band_warmup_seconds(self) -> float:
+        return self._ocr_auto_band_warmup_seconds
+
+    @property
+    def ocr_auto_band_reexpand_seconds(self) -> float:
+        return self._ocr_auto_band_reexpand_seconds
+
+    @property
+    def ocr_cascade_enabled(self) -> bool:
+        return self._ocr_cascade_enabled
+
+    @property
+    def ocr_cascade_threshold(self) -> float:
+        return self._ocr_cascade_threshold
+
+    @property
+    def ocr_speculative_enabled(self) -> bool:
+        return self._ocr_speculative_enabled
+
+    @property
+    def ocr_speculative_min_confidence(self) -> float:
+        return self._ocr_speculative_min_confidence
+
     @property
     def source_language(self) -> str:
         return self._source_language
@@ -1,83 +1,248 @@
-"""In-memory logging handler that flushes to disk on demand."""
+"""Bounded in-memory logging handler with a background file writer.
+
+Each application session logs to its own segment file (see LogSegments).
+"""
 
 from __future__ import annotations
 
 import atexit
+import collections
+import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
 from typing import List, Optional
 
 
 class MemoryLogHandler(logging.Handler):
-    """Collect log records in memory until explicitly flushed."""
+    """Buffer log records in a ring buffer and append them to a file in batches.
+
+    emit() only appends the record to a bounded deque; formatting and file
+    I/O happen on a daemon writer thread, which wakes when batch_size records
+    are pending or every flush_interval seconds. When the writer falls behind
+    by more than capacity records, the oldest are dropped and counted.
+
+    Args:
+        level: Minimum level handled
+        formatter: Formatter applied by the writer thread
+        capacity: Records kept in memory before the oldest are dropped
+        batch_size: Pending records that wake the writer early
+        flush_interval: Seconds between periodic flushes
+    """
 
-    def __init__(self, level: int = logging.INFO, formatter: Optional[logging.Formatter] = None) -> None:
+    def __init__(
+        self,
+        level: int = logging.INFO,
+        formatter: Optional[logging.Formatter] = None,
+        capacity: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+    ) -> None:
         super().__init__(level)
         if formatter is None:
-            formatter = logging.Formatter(
-                "%(asctime)s - %(levelname)s: %(message)s")
+            formatter = logging.Formatter("%(asctime)s - %(levelname)s: %(message)s")
         self.setFormatter(formatter)
-        self._records: List[str] = []
+        self.capacity = max(1, capacity)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._records: "collections.deque[logging.LogRecord]" = collections.deque(
+            maxlen=self.capacity
+        )
+        self._path: Optional[Path] = None
+        # Serializes drains so the writer and an explicit flush keep file order.
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+
+    def emit(
+        self, record: logging.LogRecord
+    ) -> None:  # pragma: no cover - relies on logging framework
+        records = self._records
+        if len(records) == self.capacity:
+            self.dropped += 1
+        records.append(record)
+        if len(records) >= self.batch_size:
+            self._wake.set()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # emit() is lock-free (deque.append is atomic), so skip the handler
+        # lock that logging.Handler.handle would take around it.
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def set_target(self, path: Path) -> None:
+        """Write buffered records to path, starting the writer thread if needed."""
+        with self._write_lock:
+            self._path = path
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run_writer, name="LogWriter", daemon=True
+            )
+            self._writer.start()
 
-    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - relies on logging framework
+    def _run_writer(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self._drain()
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+    def _format_safely(self, record: logging.LogRecord) -> str:
         try:
-            message = self.format(record)
+            return self.format(record)
         except Exception:  # pylint: disable=broad-except
-            message = record.getMessage()
-        self.acquire()
-        try:
-            self._records.append(message)
-        finally:
-            self.release()
+            return str(record.msg)
+
+    def _drain(self, path: Optional[Path] = None) -> int:
+        """Format and append every pending record; return how many were written."""
+        with self._write_lock:
+            path = path or self._path
+            records = self._records
+            if path is None or not records:
+                return 0
+            lines = []
+            while records:
+                try:
+                    lines.append(self._format_safely(records.popleft()))
+                except IndexError:
+                    break
+            if self.dropped:
+                lines.append(
+                    f"... {self.dropped} log records dropped (buffer capacity "
+                    f"{self.capacity})"
+                )
+                self.dropped = 0
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines))
+                handle.write("\n")
+            return len(lines)
+
+    def flush(self) -> None:
+        self._drain()
 
     def write_to_file(self, path: Path) -> None:
-        if not self._records:
-            return
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write("\n".join(self._records))
-            handle.write("\n")
-        self.clear()
+        self._drain(path)
 
     def clear(self) -> None:
-        self.acquire()
+        self._records.clear()
+        self.dropped = 0
+
+    def close(self) -> None:
+        self._stopping = True
+        self._wake.set()
+        if self._writer is not None and self._writer is not threading.current_thread():
+            self._writer.join(timeout=2)
         try:
-            self._records.clear()
+            self._drain()
         finally:
-            self.release()
+            super().close()
 
 
 _memory_handler: Optional[MemoryLogHandler] = None
 _log_path: Optional[Path] = None
 
 
-def prune_translator_log(log_path: Path, max_sessions: int = 3) -> None:
-    """Prune log file to keep only the last N sessions."""
-    if not log_path.exists():
-        return
+class LogSegments:
+    """One log file per session in a directory, tracked by a small JSON index.
 
-    try:
-        data = log_path.read_text(encoding="utf-8")
-    except Exception:
-        return
+    Starting a session appends an entry to the index and deletes the oldest
+    segments beyond max_sessions or beyond max_bytes in total, so rotation
+    only touches the index and a few stat/unlink calls, never old log text.
 
-    lines = data.splitlines()
-    session_starts = [i for i, line in enumerate(lines)
-                      if "Application started successfully" in line]
+    Args:
+        directory: Where segments and the index live
+        prefix: Segment file name prefix
+        max_sessions: Segments kept, including the new one
+        max_bytes: Total size kept across older segments (0 = unlimited)
+        suffix: Segment file extension
+        index_name: Index file name; series sharing a directory need their own
+    """
 
-    if len(session_starts) < max_sessions:
-        return
+    INDEX_NAME = "index.json"
+
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str = "translator",
+        max_sessions: int = 3,
+        max_bytes: int = 50 * 1024 * 1024,
+        suffix: str = ".log",
+        index_name: str = INDEX_NAME,
+    ) -> None:
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.max_sessions = max(1, max_sessions)
+        self.max_bytes = max(0, max_bytes)
+        self.suffix = suffix
+        self.index_name = index_name
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / self.index_name
+
+    def _load_index(self) -> List[dict]:
+        try:
+            entries = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        return [
+            entry
+            for entry in entries
+            if isinstance(entry, dict) and isinstance(entry.get("file"), str)
+        ]
+
+    def _save_index(self, entries: List[dict]) -> None:
+        temp_path = self.index_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(entries, indent=1), encoding="utf-8")
+        os.replace(temp_path, self.index_path)
+
+    def _delete(self, entry: dict) -> None:
+        try:
+            (self.directory / entry["file"]).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logging.getLogger(__name__).debug("Could not delete %s", entry["file"])
+
+    def start_session(self) -> Path:
+        """Register a new segment, prune old ones and return the new path."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        started = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{self.prefix}-{started}-{os.getpid()}{self.suffix}"
+        entries = self._load_index()
+        entries.append({"file": name, "started": started})
 
-    keep_idx = session_starts[-max_sessions]
-    trimmed_lines = lines[keep_idx:]
-    new_content = "\n".join(trimmed_lines)
-    if trimmed_lines:
-        new_content += "\n"
+        expired = entries[: -self.max_sessions]
+        kept = entries[-self.max_sessions :]
+        if self.max_bytes:
+            # Newest first; the new (empty) segment is always kept.
+            total = 0
+            for position in range(len(kept) - 2, -1, -1):
+                try:
+                    total += (self.directory / kept[position]["file"]).stat().st_size
+                except OSError:
+                    continue
+                if total > self.max_bytes:
+                    expired.extend(kept[: position + 1])
+                    kept = kept[position + 1 :]
+                    break
 
-    try:
-        log_path.write_text(new_content, encoding="utf-8")
-    except Exception:
-        pass
+        for entry in expired:
+            self._delete(entry)
+        try:
+            self._save_index(kept)
+        except OSError:
+            pass
+        return self.directory / name
 
 
 def init_memory_logging(log_path: Path, level: int = logging.INFO) -> MemoryLogHandler:
@@ -87,11 +252,12 @@ def init_memory_logging(log_path: Path, level: int = logging.INFO) -> MemoryLogH
         _memory_handler = MemoryLogHandler(level=level)
         atexit.register(flush_logs)
     _log_path = log_path
+    _memory_handler.set_target(log_path)
     return _memory_handler
 
 
 def flush_logs() -> None:
-    """Flush buffered log lines to disk if possible."""
+    """Write all buffered log lines to disk now."""
     if _memory_handler is None or _log_path is None:
         return
     _memory_handler.write_to_file(_log_path)
@@ -0,0 +1,88 @@
+"""Rate-limited logging for hot loops.
+
+The OCR monitor logs several lines per frame. RateLimitedLogger lets each
+call site emit at most max_per_second records; the rest are counted and the
+count is reported on the next record that gets through. Arguments can be
+passed as a single callable that is only invoked when the record is emitted,
+so disabled or suppressed records cost a level check and a counter:
+
+    hot_log.info("ocr_result", "OCR: %s (conf=%.2f)", lambda: (text[:50], conf))
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+
+class _Site:
+    __slots__ = ("window_start", "count", "suppressed")
+
+    def __init__(self):
+        self.window_start = 0.0
+        self.count = 0
+        self.suppressed = 0
+
+
+class RateLimitedLogger:
+    """Per-call-site rate limiter in front of a logging.Logger.
+
+    Args:
+        logger: Logger records are sent to (the root logger by default)
+        max_per_second: Records emitted per call site per one-second window
+    """
+
+    def __init__(
+        self, logger: Optional[logging.Logger] = None, max_per_second: float = 2.0
+    ):
+        self.logger = logger or logging.getLogger()
+        self.max_per_second = max_per_second
+        self._sites: Dict[str, _Site] = {}
+        self._lock = threading.Lock()
+
+    def _admit(self, site: str) -> int:
+        """Consume site's budget; return suppressed count, or -1 if rate-limited."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._sites.get(site)
+            if state is None:
+                state = self._sites[site] = _Site()
+            if now - state.window_start >= 1.0:
+                state.window_start = now
+                state.count = 0
+            if state.count >= self.max_per_second:
+                state.suppressed += 1
+                return -1
+            state.count += 1
+            suppressed, state.suppressed = state.suppressed, 0
+            return suppressed
+
+    def log(self, level: int, site: str, msg: str, *args) -> None:
+        """Log msg unless the level is off or site is over its rate.
+
+        A single callable argument is called to produce the arguments, only
+        when the record is actually emitted.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        suppressed = self._admit(site)
+        if suppressed < 0:
+            return
+        if len(args) == 1 and callable(args[0]):
+            args = tuple(args[0]())
+        if suppressed:
+            msg = f"{msg} (+{suppressed} suppressed)"
+        self.logger.log(level, msg, *args)
+
+    def debug(self, site: str, msg: str, *args) -> None:
+        self.log(logging.DEBUG, site, msg, *args)
+
+    def info(self, site: str, msg: str, *args) -> None:
+        self.log(logging.INFO, site, msg, *args)
+
+    def suppressed_counts(self) -> Dict[str, int]:
+        """Records suppressed per site since each site last emitted."""
+        with self._lock:
+            return {site: state.suppressed for site, state in self._sites.items()}
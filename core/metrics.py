@@ -0,0 +1,430 @@
+"""In-process metrics: counters, gauges and latency histograms.
+
+Metrics are identified by a family name plus optional labels, e.g.
+histogram("provider_request_ms", service="groq"). Children are created on
+first use and cached, so hot paths can bind them once and only pay for an
+increment or a bucket update per observation.
+
+Histograms use HDR-style log-linear buckets (a fixed number of linear
+sub-buckets per power of two), giving a bounded relative error across
+microseconds to minutes without configuring bucket edges per metric.
+
+The registry can be rendered in the Prometheus text exposition format and
+served on a localhost endpoint (start_metrics_server), and summarized for the
+overlay's stats panel.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+PREFIX = "translator_"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (
+        name
+        + '="'
+        + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        + '"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Gauge:
+    """Value that can go up and down, or be read from a callback."""
+
+    __slots__ = ("_value", "_func")
+
+    def __init__(self):
+        self._value = 0.0
+        self._func: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._value -= amount
+
+    def set_function(self, func: Callable[[], float]) -> None:
+        """Read the value from func at collection time instead of set()."""
+        self._func = func
+
+    @property
+    def value(self) -> float:
+        if self._func is not None:
+            try:
+                return float(self._func())
+            except Exception:
+                return math.nan
+        return self._value
+
+
+class Histogram:
+    """Log-linear bucketed histogram.
+
+    Args:
+        lowest: Upper edge of the first bucket; smaller values land there
+        octaves: Powers of two covered above lowest; larger values land in
+            the overflow bucket
+        sub_buckets: Linear buckets per power of two (16 = ~6% bucket width)
+    """
+
+    __slots__ = (
+        "lowest",
+        "sub_buckets",
+        "_counts",
+        "_count",
+        "_sum",
+        "_min",
+        "_max",
+        "_lock",
+    )
+
+    def __init__(self, lowest: float = 0.01, octaves: int = 24, sub_buckets: int = 16):
+        self.lowest = lowest
+        self.sub_buckets = sub_buckets
+        # Bucket 0 holds values <= lowest, the last one overflow.
+        self._counts = [0] * (octaves * sub_buckets + 2)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._lock = threading.Lock()
+
+    def _index(self, value: float) -> int:
+        if value <= self.lowest:
+            return 0
+        mantissa, exponent = math.frexp(value / self.lowest)
+        # value / lowest = mantissa * 2**exponent with mantissa in [0.5, 1).
+        sub = int((mantissa * 2 - 1) * self.sub_buckets)
+        index = 1 + (exponent - 1) * self.sub_buckets + sub
+        return min(index, len(self._counts) - 1)
+
+    def upper_bound(self, index: int) -> float:
+        """Largest value that falls into bucket index."""
+        if index == 0:
+            return self.lowest
+        if index >= len(self._counts) - 1:
+            return math.inf
+        exponent, sub = divmod(index - 1, self.sub_buckets)
+        return self.lowest * (2**exponent) * (1 + (sub + 1) / self.sub_buckets)
+
+    def observe(self, value: float) -> None:
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def quantile(self, q: float) -> float:
+        """Return the q-quantile (0..1), accurate to one bucket width."""
+        with self._lock:
+            if not self._count:
+                return 0.0
+            rank = max(1, math.ceil(q * self._count))
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank:
+                    return min(self.upper_bound(index), self._max)
+            return self._max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Cumulative (upper bound, count) pairs for non-empty buckets."""
+        with self._lock:
+            counts = list(self._counts)
+        cumulative = []
+        seen = 0
+        for index, count in enumerate(counts):
+            if count:
+                seen += count
+                cumulative.append((self.upper_bound(index), seen))
+        return cumulative
+
+    def summary(self) -> dict:
+        return {
+            "count": self._count,
+            "avg": self._sum / self._count if self._count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self._max if self._count else 0.0,
+        }
+
+
+_KINDS = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+
+class _Family:
+    __slots__ = ("name", "kind", "help", "children")
+
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.children: Dict[LabelKey, object] = {}
+
+
+class MetricsRegistry:
+    """Named metric families with labelled children."""
+
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, kind: str, name: str, help_text: str, labels: dict):
+        key = _label_key(labels)
+        family = self._families.get(name)
+        if family is not None:
+            child = family.children.get(key)
+            if child is not None and family.kind == kind:
+                return child
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = _Family(name, kind, help_text)
+            elif family.kind != kind:
+                raise ValueError(f"metric {name} is a {family.kind}, not a {kind}")
+            if help_text and not family.help:
+                family.help = help_text
+            child = family.children.get(key)
+            if child is None:
+                child = family.children[key] = _KINDS[kind]()
+            return child
+
+    def counter(self, name: str, help_text: str = "", **labels) -> Counter:
+        return self._get("counter", name, help_text, labels)
+
+    def gauge(self, name: str, help_text: str = "", **labels) -> Gauge:
+        return self._get("gauge", name, help_text, labels)
+
+    def histogram(self, name: str, help_text: str = "", **labels) -> Histogram:
+        return self._get("histogram", name, help_text, labels)
+
+    def collect(self, name: str) -> List[Tuple[Dict[str, str], object]]:
+        """Return (labels, metric) pairs of one family."""
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                return []
+            children = list(family.children.items())
+        return [(dict(key), child) for key, child in children]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._families.clear()
+
+    def render_prometheus(self) -> str:
+        """Render every family in the Prometheus text exposition format."""
+        with self._lock:
+            families = [
+                (family, list(family.children.items()))
+                for family in self._families.values()
+            ]
+        lines: List[str] = []
+        for family, children in sorted(families, key=lambda item: item[0].name):
+            name = PREFIX + family.name
+            if family.kind == "counter":
+                name += "_total"
+            if family.help:
+                lines.append(f"# HELP {name} {family.help}")
+            lines.append(f"# TYPE {name} {family.kind}")
+            for key, child in children:
+                if family.kind != "histogram":
+                    lines.append(
+                        f"{name}{_format_labels(key)} {_format_value(child.value)}"
+                    )
+                    continue
+                buckets = child.buckets()
+                if not buckets or buckets[-1][0] != math.inf:
+                    buckets.append((math.inf, child.count))
+                for bound, count in buckets:
+                    le = ("le", _format_value(round(bound, 6)))
+                    lines.append(f"{name}_bucket{_format_labels(key, le)} {count}")
+                lines.append(
+                    f"{name}_sum{_format_labels(key)} {_format_value(child.sum)}"
+                )
+                lines.append(f"{name}_count{_format_labels(key)} {child.count}")
+        return "\n".join(lines) + "\n"
+
+
+class ProviderMetrics:
+    """Metrics of one translation provider, bound once per service instance."""
+
+    def __init__(self, service: str, registry: Optional[MetricsRegistry] = None):
+        registry = registry or _registry
+        self.request_ms = registry.histogram(
+            "provider_request_ms", "Provider API call time per attempt", service=service
+        )
+        self.requests_ok = registry.counter(
+            "provider_requests", "Provider API attempts", service=service, outcome="ok"
+        )
+        self.requests_failed = registry.counter(
+            "provider_requests",
+            "Provider API attempts",
+            service=service,
+            outcome="error",
+        )
+        self.key_cooldowns = registry.counter(
+            "api_key_cooldowns", "API keys put on cooldown", service=service
+        )
+        self.keys_removed = registry.counter(
+            "api_keys_removed", "API keys dropped after auth errors", service=service
+        )
+        self.image_cache_hits = registry.counter(
+            "image_cache_hits", "Translations served by image hash", service=service
+        )
+
+    @contextlib.contextmanager
+    def request(self) -> Iterator[None]:
+        """Time one API attempt and count it as ok or failed."""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.requests_failed.inc()
+            raise
+        else:
+            self.requests_ok.inc()
+        finally:
+            self.request_ms.observe((time.perf_counter() - started) * 1000)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer:
+    """Serves a registry at http://host:port/metrics on a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port=0):
+        self._server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.registry = registry
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="MetricsServer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+
+_registry = MetricsRegistry()
+_server: Optional[MetricsServer] = None
+
+
+def registry() -> MetricsRegistry:
+    return _registry
+
+
+def counter(name: str, help_text: str = "", **labels) -> Counter:
+    return _registry.counter(name, help_text, **labels)
+
+
+def gauge(name: str, help_text: str = "", **labels) -> Gauge:
+    return _registry.gauge(name, help_text, **labels)
+
+
+def histogram(name: str, help_text: str = "", **labels) -> Histogram:
+    return _registry.histogram(name, help_text, **labels)
+
+
+def render_prometheus() -> str:
+    return _registry.render_prometheus()
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> MetricsServer:
+    """Start (or restart) the scrape endpoint; returns the running server."""
+    global _server
+    stop_metrics_server()
+    _server = MetricsServer(_registry, host, port).start()
+    return _server
+
+
+def stop_metrics_server() -> None:
+    global _server
+    if _server is not None:
+        _server.stop()
+        _server = None
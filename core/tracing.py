@@ -0,0 +1,240 @@
+"""Lightweight per-frame tracing.
+
+A trace follows one frame (or manual request) from capture through OCR,
+emission, the worker queue, the provider call and the overlay update. Each
+stage is a span with perf_counter timestamps and the name of the thread it
+ran on. Finished traces are kept in a bounded ring buffer and can be
+exported as Chrome trace-event JSON (chrome://tracing, Perfetto).
+
+Tracing is off by default; while disabled, start_trace returns None and
+every helper that takes a trace id accepts None as a no-op.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+class Trace:
+    """Spans recorded for one frame or request."""
+
+    __slots__ = ("id", "name", "args", "started", "last", "spans", "complete")
+
+    def __init__(self, trace_id: int, name: str, args: dict):
+        self.id = trace_id
+        self.name = name
+        self.args = args
+        self.started = time.perf_counter()
+        # End of the latest span; the default start of the next one, so gaps
+        # such as queue waits can be recorded without extra bookkeeping.
+        self.last = self.started
+        self.spans: List[tuple] = []
+        self.complete = False
+
+    def add_span(
+        self,
+        name: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        **args,
+    ) -> None:
+        """Record a span; start defaults to the previous span's end, end to now."""
+        end = time.perf_counter() if end is None else end
+        start = self.last if start is None else start
+        self.spans.append(
+            (name, start, end, threading.current_thread().name, args or None)
+        )
+        self.last = max(self.last, end)
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, start, **args)
+
+
+class Tracer:
+    """Keeps in-flight traces by id and finished traces in a ring buffer.
+
+    Args:
+        capacity: Finished traces kept; also bounds in-flight traces, which
+            are moved to the buffer as incomplete when the bound is exceeded
+        enabled: Whether start_trace creates traces
+    """
+
+    def __init__(self, capacity: int = 256, enabled: bool = False):
+        self.enabled = enabled
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._active: "collections.OrderedDict[int, Trace]" = collections.OrderedDict()
+        self._finished: "collections.deque[Trace]" = collections.deque(
+            maxlen=max(1, capacity)
+        )
+
+    def configure(self, enabled: bool, capacity: Optional[int] = None) -> None:
+        with self._lock:
+            self.enabled = enabled
+            if capacity is not None and capacity != self._finished.maxlen:
+                self._finished = collections.deque(
+                    self._finished, maxlen=max(1, capacity)
+                )
+
+    def start(self, name: str, **args) -> Optional[Trace]:
+        """Create a trace that is not yet visible to other threads."""
+        if not self.enabled:
+            return None
+        return Trace(next(self._ids), name, args)
+
+    def publish(self, trace: Optional[Trace]) -> Optional[int]:
+        """Make a trace reachable by id (e.g. before emitting it in a signal)."""
+        if trace is None:
+            return None
+        with self._lock:
+            self._active[trace.id] = trace
+            while len(self._active) > self._finished.maxlen:
+                _, stale = self._active.popitem(last=False)
+                self._finished.append(stale)
+        return trace.id
+
+    def get(self, trace_id: Optional[int]) -> Optional[Trace]:
+        if trace_id is None:
+            return None
+        with self._lock:
+            return self._active.get(trace_id)
+
+    def finish(self, trace_id: Optional[int]) -> None:
+        if trace_id is None:
+            return
+        with self._lock:
+            trace = self._active.pop(trace_id, None)
+            if trace is not None:
+                trace.complete = True
+                self._finished.append(trace)
+
+    def traces(self) -> List[Trace]:
+        with self._lock:
+            return list(self._finished)
+
+    def chrome_trace(self) -> dict:
+        """Return finished traces as a Chrome trace-event document."""
+        traces = self.traces()
+        pid = os.getpid()
+        thread_ids: Dict[str, int] = {}
+        events = []
+
+        def tid(thread_name: str) -> int:
+            return thread_ids.setdefault(thread_name, len(thread_ids) + 1)
+
+        for trace in traces:
+            end = max((span[2] for span in trace.spans), default=trace.started)
+            common = {"cat": trace.name, "pid": pid, "id": trace.id}
+            # The whole trace as an async slice, so one frame reads as one row.
+            events.append(
+                dict(
+                    common,
+                    name=f"{trace.name} #{trace.id}",
+                    ph="b",
+                    ts=trace.started * 1e6,
+                    tid=0,
+                    args=dict(trace.args, complete=trace.complete),
+                )
+            )
+            events.append(
+                dict(
+                    common,
+                    name=f"{trace.name} #{trace.id}",
+                    ph="e",
+                    ts=end * 1e6,
+                    tid=0,
+                )
+            )
+            for name, start, span_end, thread_name, args in trace.spans:
+                events.append(
+                    {
+                        "name": name,
+                        "cat": trace.name,
+                        "ph": "X",
+                        "ts": start * 1e6,
+                        "dur": max(0.0, span_end - start) * 1e6,
+                        "pid": pid,
+                        "tid": tid(thread_name),
+                        "args": dict(args or {}, trace_id=trace.id),
+                    }
+                )
+
+        for thread_name, thread_id in thread_ids.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": thread_id,
+                    "args": {"name": thread_name},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: Path) -> int:
+        """Write finished traces to path; return the number of traces written."""
+        document = self.chrome_trace()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(document, handle)
+        return len(self.traces())
+
+
+_tracer = Tracer()
+
+
+def configure_tracing(enabled: bool, capacity: Optional[int] = None) -> None:
+    _tracer.configure(enabled, capacity)
+
+
+def tracing_enabled() -> bool:
+    return _tracer.enabled
+
+
+def start_trace(name: str, **args) -> Optional[Trace]:
+    return _tracer.start(name, **args)
+
+
+def publish_trace(trace: Optional[Trace]) -> Optional[int]:
+    return _tracer.publish(trace)
+
+
+def get_trace(trace_id: Optional[int]) -> Optional[Trace]:
+    return _tracer.get(trace_id)
+
+
+def finish_trace(trace_id: Optional[int]) -> None:
+    _tracer.finish(trace_id)
+
+
+def add_span(trace_id: Optional[int], name: str, **args) -> None:
+    """Record a span from the trace's previous span end until now."""
+    trace = _tracer.get(trace_id)
+    if trace is not None:
+        trace.add_span(name, **args)
+
+
+def trace_span(trace_id: Optional[int], name: str, **args):
+    """Context manager timing a block as a span of trace_id (no-op for None)."""
+    trace = _tracer.get(trace_id)
+    if trace is None:
+        return contextlib.nullcontext()
+    return trace.span(name, **args)
+
+
+def export_chrome_trace(path: Path) -> int:
+    return _tracer.export_chrome_trace(path)
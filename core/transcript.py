@@ -0,0 +1,142 @@
+"""Streaming archive of the translations shown in the overlay.
+
+The overlay keeps only the last few hundred lines in its QTextDocument
+(maximumBlockCount); every translation is also appended here, so the full
+session history survives without the document growing. Writes happen on a
+daemon thread, so the UI thread only enqueues.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from core.log_buffer import LogSegments
+
+_STOP = object()
+
+
+class TranscriptArchive:
+    """Append-only transcript file written by a background thread.
+
+    The file is registered with segments and opened on the first append, so
+    sessions that translate nothing leave no file behind.
+
+    Args:
+        segments: Rotation of transcript files; one is started per session
+    """
+
+    def __init__(self, segments: LogSegments):
+        self.segments = segments
+        self.path: Optional[Path] = None
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    @classmethod
+    def start_session(
+        cls,
+        directory: Path,
+        prefix: str = "transcript",
+        max_sessions: int = 20,
+        max_bytes: int = 50 * 1024 * 1024,
+    ):
+        """Archive to <prefix>-<start time>-<pid>.txt in directory.
+
+        Keeps the newest max_sessions transcripts and at most max_bytes of
+        older ones, tracked in their own index next to the log segments.
+        """
+        segments = LogSegments(
+            directory,
+            prefix=prefix,
+            max_sessions=max_sessions,
+            max_bytes=max_bytes,
+            suffix=".txt",
+            index_name=f"{prefix}-index.json",
+        )
+        return cls(segments)
+
+    def append(self, text: str, timestamp: Optional[float] = None) -> None:
+        """Queue one translation; returns immediately."""
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="TranscriptWriter", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put((timestamp or time.time(), text))
+
+    def mark(self, note: str) -> None:
+        """Queue a separator line, e.g. when the session is cleared."""
+        # A marker alone does not start a transcript file.
+        if self._thread is not None:
+            self._queue.put((time.time(), f"--- {note} ---"))
+
+    def _open(self):
+        """Open the session's transcript, starting it on first use."""
+        if self.path is None:
+            self.path = self.segments.start_session()
+        return open(self.path, "a", encoding="utf-8")
+
+    def _run(self) -> None:
+        handle = None
+        failing = False
+        while True:
+            item = self._queue.get()
+            # Write everything queued meanwhile, then flush once.
+            batch = []
+            while item is not _STOP:
+                batch.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    if handle is None:
+                        handle = self._open()
+                    for timestamp, text in batch:
+                        stamp = time.strftime(
+                            "%Y-%m-%d %H:%M:%S", time.localtime(timestamp)
+                        )
+                        handle.write(f"[{stamp}] {text.strip()}\n\n")
+                    handle.flush()
+                except OSError as exc:
+                    # Drop the batch and reopen for the next one (disk full,
+                    # file locked or deleted), logging once per failure streak.
+                    if not failing:
+                        logging.error(
+                            "Transcript archive write failed; dropping entries "
+                            "until it recovers: %s",
+                            exc,
+                        )
+                    failing = True
+                    self._close_handle(handle)
+                    handle = None
+                else:
+                    if failing:
+                        logging.info("Transcript archive writes recovered")
+                    failing = False
+            if item is _STOP:
+                self._close_handle(handle)
+                return
+
+    @staticmethod
+    def _close_handle(handle) -> None:
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Write pending entries and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
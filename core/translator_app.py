@@ -1,4 +1,3 @@
-import pyautogui
 import numpy as np
 from PyQt5.QtWidgets import (
     QApplication,
@@ -22,14 +21,45 @@ import logging
 import ctypes
 from ctypes import wintypes
 import collections
+import threading
 import time
+from pathlib import Path
 
 from core.config_manager import ConfigManager
 from core.log_buffer import flush_logs
+from core.metrics import (
+    counter,
+    gauge,
+    histogram,
+    registry as metrics_registry,
+    start_metrics_server,
+    stop_metrics_server,
+)
+from core.transcript import TranscriptArchive
+from core.tracing import (
+    add_span,
+    configure_tracing,
+    export_chrome_trace,
+    finish_trace,
+    publish_trace,
+    start_trace,
+    trace_span,
+)
 from .ui.draggable_text_edit import DraggableTextEdit
 from .ui.region_selector import select_screen_region
 from threads.translation_worker import TranslationWorker
 from threads.auto_ocr_monitor import AutoOCRMonitor
+from subtitle.language_pack_manager import configure_language_pack_cache
+from subtitle.ocr_engines import select_engine
+from subtitle.subtitle_ocr import (
+    clear_ocr_result_cache,
+    configure_engine_pool,
+    configure_ocr_result_cache,
+    ocr_result_cache_stats,
+    set_ocr_backend,
+    shutdown_ocr_backend,
+    warm_up_ocr,
+)
 
 user32 = ctypes.WinDLL("user32", use_last_error=True)
 WM_HOTKEY = 0x0312
@@ -43,6 +73,7 @@ VK_K = 0x4B
 VK_L = 0x4C
 VK_S = 0x53
 VK_C = 0x43
+VK_M = 0x4D
 ALT_T_HOTKEY_ID = 1
 ALT_Q_HOTKEY_ID = 2
 TILDE_HOTKEY_ID = 3
@@ -52,6 +83,7 @@ ALT_L_HOTKEY_ID = 7
 ALT_S_HOTKEY_ID = 9
 ALT_TILDE_HOTKEY_ID = 10
 ALT_C_HOTKEY_ID = 11
+ALT_M_HOTKEY_ID = 12
 # Window positioning flags for no-activate topmost overlay
 SWP_NOSIZE = 0x0001
 SWP_NOMOVE = 0x0002
@@ -67,6 +99,44 @@ class TranslatorApp(QMainWindow):
     """Topmost, draggable overlay that displays live translations."""
 
     translate_requested = pyqtSignal(object)
+    # (status message, finished) from the background warm-up thread
+    warm_up_progress = pyqtSignal(str, bool)
+
+    # Config settings applied to a running OCR monitor in place
+    MONITOR_LIVE_SETTINGS = {
+        "ocr_monitor_interval": "interval",
+        "ocr_similarity_threshold": "sim_thresh",
+        "ocr_duplicate_ratio": "duplicate_ratio",
+        "ocr_debounce_seconds": "debounce_seconds",
+        "subtitle_ocr_min_confidence": "min_confidence",
+        "subtitle_ocr_max_lines": "max_lines",
+        "ocr_stability_frames": "stability_frames",
+        "ocr_speculative_enabled": "speculative",
+        "ocr_speculative_min_confidence": "speculative_min_confidence",
+    }
+    # Config settings that need a new OCR monitor
+    MONITOR_RESTART_SETTINGS = {
+        "source_language",
+        "ocr_line_incremental",
+        "ocr_line_cache_size",
+        "ocr_cascade_enabled",
+        "ocr_cascade_threshold",
+        "ocr_auto_band_enabled",
+        "ocr_auto_band_warmup_seconds",
+        "ocr_auto_band_reexpand_seconds",
+        "hot_path_log_rate",
+    }
+    # Config settings only read at startup
+    RESTART_REQUIRED_SETTINGS = {
+        "ocr_engine_pool_size",
+        "ocr_intra_op_threads",
+        "ocr_inter_op_threads",
+        "ocr_backend",
+        "ocr_process_workers",
+        "config_write_delay",
+        "config_watch_interval",
+        "transcript_archive_enabled",
+    }
 
     def __init__(self):
         super().__init__()
@@ -99,6 +169,13 @@ class TranslatorApp(QMainWindow):
         self.last_translation_result = None
         self.last_update_timestamp = 0.0
         self.translation_history = collections.deque(maxlen=3)
+        # Full history goes to the archive; the overlay keeps the last lines.
+        self.transcript = None
+        if self.config.transcript_archive_enabled:
+            # The file is only created once the first translation is shown.
+            self.transcript = TranscriptArchive.start_session(
+                Path(__file__).resolve().parent.parent / "logs"
+            )
         self.history_enabled = False
         self.last_processed_hash = None
         self.pending_translations = 0
@@ -127,14 +204,59 @@ class TranslatorApp(QMainWindow):
         self.translation_worker.translation_error.connect(self.on_translation_error)
         self.translation_worker_thread.start()
 
+        configure_tracing(self.config.tracing_enabled, self.config.trace_buffer_size)
+
+        self._pending_gauge = gauge(
+            "pending_translations", "Requests awaiting a result"
+        )
+        self._end_to_end_ms = histogram(
+            "translation_end_to_end_ms", "Request to overlay update time"
+        )
+        self._displayed = counter("translations_displayed", "Translations shown")
+        self._timeouts = counter("translation_timeouts", "Requests that timed out")
+        gauge("ocr_result_cache_hit_rate", "OCR result cache hit rate").set_function(
+            lambda: ocr_result_cache_stats()["hit_rate"]
+        )
+        if self.config.metrics_port:
+            try:
+                server = start_metrics_server(self.config.metrics_port)
+                logging.info("Metrics endpoint: %s", server.url)
+            except OSError as exc:
+                logging.error("Failed to start metrics endpoint: %s", exc)
+
         # OCR monitor for auto mode (created on demand, works with any OCR engine)
         self.ocr_monitor = None
+        configure_engine_pool(
+            size=self.config.ocr_engine_pool_size,
+            intra_op_threads=self.config.ocr_intra_op_threads,
+            inter_op_threads=self.config.ocr_inter_op_threads,
+        )
+        configure_ocr_result_cache(self.config.ocr_result_cache_size)
+        configure_language_pack_cache(self.config.ocr_language_pack_cache_hours * 3600)
+        try:
+            set_ocr_backend(
+                self.config.ocr_backend, workers=self.config.ocr_process_workers
+            )
+        except Exception as exc:
+            logging.error(
+                "Failed to start %s OCR backend: %s", self.config.ocr_backend, exc
+            )
 
         self.status_label = None
         self.status_timer = QTimer(self)
         self.status_timer.setSingleShot(True)
         self.status_timer.timeout.connect(self.clear_status)
 
+        self.stats_label = None
+        self.stats_timer = QTimer(self)
+        self.stats_timer.timeout.connect(self._refresh_stats_panel)
+
+        # Poll .env for edits and apply them without a restart
+        self.config_watch_timer = QTimer(self)
+        self.config_watch_timer.timeout.connect(self._check_config_file)
+        if self.config.config_watch_interval > 0:
+            self.config_watch_timer.start(int(self.config.config_watch_interval * 1000))
+
         self.placeholder_text = (
             "Transgemi - Subtitle Translator\n\n"
             "Press 'Alt+Q' to select subtitle area\n"
@@ -145,6 +267,7 @@ class TranslatorApp(QMainWindow):
             "Press '+' or '-' to change font size\n\n"
             "Press 'Alt+S' to switch translation service\n\n"
             "Press 'Alt+C' to clear session\n\n"
+            "Press 'Alt+M' to show or hide live stats\n\n"
             "Press 'Alt+T' to show or hide window\n\n"
             "Press 'Esc' to close"
         )
@@ -153,6 +276,9 @@ class TranslatorApp(QMainWindow):
         self.setup_hotkeys()
         self.show_placeholder()
         QTimer.singleShot(100, self.register_global_hotkeys)
+        self.warm_up_progress.connect(self._on_warm_up_progress)
+        # Runs once the overlay is shown
+        QTimer.singleShot(0, self._start_warm_up)
         self._refresh_auto_status_label()
 
         self.installEventFilter(self)
@@ -180,6 +306,7 @@ class TranslatorApp(QMainWindow):
             (ALT_K_HOTKEY_ID, MOD_ALT | MOD_NOREPEAT, VK_K, "Alt+K"),
             (ALT_S_HOTKEY_ID, MOD_ALT | MOD_NOREPEAT, VK_S, "Alt+S"),
             (ALT_C_HOTKEY_ID, MOD_ALT | MOD_NOREPEAT, VK_C, "Alt+C"),
+            (ALT_M_HOTKEY_ID, MOD_ALT | MOD_NOREPEAT, VK_M, "Alt+M"),
         ]
 
         failed = []
@@ -231,6 +358,14 @@ class TranslatorApp(QMainWindow):
         )
         main_layout.addWidget(self.auto_status_label, 0)
 
+        self.stats_label = QLabel(self)
+        self.stats_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self.stats_label.setStyleSheet(
+            "QLabel { background-color: #202020; color: #C0C0C0; font-family: Consolas, monospace; font-size: 9pt; padding: 4px; }"
+        )
+        self.stats_label.hide()
+        main_layout.addWidget(self.stats_label, 0)
+
         text_container = QWidget(self)
         text_container_layout = QGridLayout(text_container)
         text_container_layout.setContentsMargins(0, 0, 0, 0)
@@ -297,6 +432,8 @@ class TranslatorApp(QMainWindow):
         """)
 
     def show_placeholder(self):
+        # The line cap applies to translations only, not the help text.
+        self.text_edit.document().setMaximumBlockCount(0)
         self.text_edit.setText(self.placeholder_text)
         self.placeholder_active = True
 
@@ -345,6 +482,8 @@ class TranslatorApp(QMainWindow):
         self.selecting = False
         self.active_region_selector = None
         if region:
+            if region != self.selected_region:
+                clear_ocr_result_cache()
             self.selected_region = region
             self.show_status(
                 f"Region selected: {region[2]}x{region[3]} - Press '~' to translate"
@@ -362,6 +501,10 @@ class TranslatorApp(QMainWindow):
             )
             return None
         try:
+            # Imported on first capture; it pulls in PIL and its screenshot
+            # backends, which the overlay does not need to appear.
+            import pyautogui
+
             screenshot = pyautogui.screenshot(region=region)
             return np.array(screenshot)
         except Exception as exc:
@@ -402,6 +545,8 @@ class TranslatorApp(QMainWindow):
 
         try:
             # Capture frame
+            import pyautogui
+
             screenshot_np = pyautogui.screenshot(region=self.selected_region)
             screenshot_np = np.array(screenshot_np)
 
@@ -416,15 +561,32 @@ class TranslatorApp(QMainWindow):
             timer.start(30000)  # 30 seconds timeout
             self.active_requests[timestamp] = timer
 
+            trace = start_trace("manual")
+            if trace is not None:
+                trace.add_span("capture")
             self.translation_worker.translate_frame(
-                screenshot_np, self.selected_region, manual=True, timestamp=timestamp
+                screenshot_np,
+                self.selected_region,
+                manual=True,
+                timestamp=timestamp,
+                trace_id=publish_trace(trace),
             )
 
         except Exception as exc:
             logging.error("Manual translation failed: %s", exc)
             self.show_status(f"Error: {exc}")
 
-    def on_translation_finished(self, translation_text, timestamp, image_hash):
+    def on_translation_finished(
+        self, translation_text, timestamp, image_hash, trace_id=None
+    ):
+        add_span(trace_id, "ui_queue")
+        try:
+            with trace_span(trace_id, "ui_paint"):
+                self._show_translation(translation_text, timestamp, image_hash)
+        finally:
+            finish_trace(trace_id)
+
+    def _show_translation(self, translation_text, timestamp, image_hash):
         # Check if request is still active (hasn't timed out)
         if timestamp in self.active_requests:
             timer = self.active_requests.pop(timestamp)
@@ -439,6 +601,7 @@ class TranslatorApp(QMainWindow):
             return
         self.last_update_timestamp = timestamp
 
+        self._end_to_end_ms.observe((time.time() - timestamp) * 1000)
         if translation_text:
             cleaned_text = translation_text.strip()
             last_text = (self.last_translation_result or "").strip()
@@ -449,11 +612,18 @@ class TranslatorApp(QMainWindow):
             if self.placeholder_active:
                 self.text_edit.setText(translation_text)
                 self.placeholder_active = False
-            elif self.text_edit.toPlainText().strip():
+                self.text_edit.document().setMaximumBlockCount(
+                    self.config.transcript_max_lines
+                )
+            elif not self.text_edit.document().isEmpty():
+                # O(1) emptiness check; the block cap drops the oldest lines.
                 self.text_edit.append("\n" + translation_text)
             else:
                 self.text_edit.setText(translation_text)
+            if self.transcript is not None:
+                self.transcript.append(translation_text)
             self.last_translation_result = translation_text
+            self._displayed.inc()
 
             if self.history_enabled:
                 self.translation_history.append(translation_text)
@@ -582,6 +752,10 @@ class TranslatorApp(QMainWindow):
                 f"Source: {source_labels[source_combo.currentIndex()]}, Target: {target_labels[target_combo.currentIndex()]}"
             )
 
+            if source_changed:
+                clear_ocr_result_cache()
+                self._prewarm_ocr_engines()
+
             if (
                 source_changed
                 and self.auto_translation_enabled
@@ -620,6 +794,8 @@ class TranslatorApp(QMainWindow):
         self.last_translation_result = None
         self.last_processed_hash = None
         self.translation_history.clear()
+        if self.transcript is not None:
+            self.transcript.mark("session cleared")
         self.show_status("Session cleared")
 
     def _reload_translation_service(self):
@@ -638,6 +814,140 @@ class TranslatorApp(QMainWindow):
         if hasattr(self, "translation_worker") and self.translation_worker:
             self.translation_worker.refresh_service()
 
+    def _check_config_file(self) -> None:
+        try:
+            changed = self.config.reload_if_modified()
+        except Exception as exc:
+            logging.error("Failed to reload .env: %s", exc)
+            return
+        if changed:
+            self._apply_config_changes(changed)
+
+    def _apply_config_changes(self, changed) -> None:
+        """Apply settings changed in .env to the running components."""
+        config = self.config
+
+        if "source_language" in changed:
+            clear_ocr_result_cache()
+            self._prewarm_ocr_engines()
+        if "ocr_result_cache_size" in changed:
+            configure_ocr_result_cache(config.ocr_result_cache_size)
+        if "ocr_language_pack_cache_hours" in changed:
+            configure_language_pack_cache(config.ocr_language_pack_cache_hours * 3600)
+
+        if self.ocr_monitor is not None:
+            if changed & self.MONITOR_RESTART_SETTINGS:
+                self._start_auto_translation()
+            else:
+                live = {
+                    attribute: getattr(config, name)
+                    for name, attribute in self.MONITOR_LIVE_SETTINGS.items()
+                    if name in changed
+                }
+                if live:
+                    self.ocr_monitor.update_settings(**live)
+
+        # Rebuild the service only for its own settings; worker caches survive.
+        prefix = config.translation_service + "_"
+        if "translation_service" in changed or any(
+            name.startswith(prefix) for name in changed
+        ):
+            self._refresh_worker_services()
+
+        if "transcript_max_lines" in changed and not self.placeholder_active:
+            self.text_edit.document().setMaximumBlockCount(config.transcript_max_lines)
+        if "font_size" in changed:
+            closest_size = min(
+                self.font_sizes, key=lambda size: abs(size - config.font_size)
+            )
+            self.font_size_index = self.font_sizes.index(closest_size)
+            self.update_font_size()
+        if changed & {"overlay_x", "overlay_y", "overlay_width", "overlay_height"}:
+            x = config.overlay_x if config.overlay_x is not None else self.x()
+            y = config.overlay_y if config.overlay_y is not None else self.y()
+            self.setGeometry(x, y, config.overlay_width, config.overlay_height)
+
+        if changed & {"tracing_enabled", "trace_buffer_size"}:
+            configure_tracing(config.tracing_enabled, config.trace_buffer_size)
+        if "metrics_port" in changed:
+            stop_metrics_server()
+            if config.metrics_port:
+                try:
+                    server = start_metrics_server(config.metrics_port)
+                    logging.info("Metrics endpoint: %s", server.url)
+                except OSError as exc:
+                    logging.error("Failed to start metrics endpoint: %s", exc)
+
+        pending = sorted(changed & self.RESTART_REQUIRED_SETTINGS)
+        if pending:
+            logging.warning("Restart to apply .env changes: %s", ", ".join(pending))
+            self.show_status(
+                f"Settings reloaded; restart to apply {', '.join(pending)}"
+            )
+        else:
+            self.show_status("Settings reloaded from .env")
+
+    def toggle_stats_panel(self):
+        if self.stats_label.isVisible():
+            self.stats_timer.stop()
+            self.stats_label.hide()
+        else:
+            self._refresh_stats_panel()
+            self.stats_label.show()
+            self.stats_timer.start(1000)
+
+    def _refresh_stats_panel(self) -> None:
+        self.stats_label.setText(self._format_stats())
+
+    def _format_stats(self) -> str:
+        """Summarize the metrics registry for the stats panel."""
+        registry = metrics_registry()
+        lines = []
+
+        def latency(label, metric):
+            summary = metric.summary()
+            if summary["count"]:
+                lines.append(
+                    f"{label}: p50 {summary['p50']:.0f} ms, "
+                    f"p95 {summary['p95']:.0f} ms (n={summary['count']})"
+                )
+
+        for labels, metric in registry.collect("ocr_duration_ms"):
+            latency(f"OCR {labels['engine']}", metric)
+        for labels, metric in registry.collect("translation_latency_ms"):
+            latency(f"Translate {labels['service']}", metric)
+        latency("End to end", self._end_to_end_ms)
+
+        def hit_rate(name, hit, miss):
+            counts = {
+                labels.get("result") or labels.get("outcome"): metric.value
+                for labels, metric in registry.collect(name)
+            }
+            resolved = counts.get(hit, 0) + counts.get(miss, 0)
+            return counts.get(hit, 0) / resolved if resolved else None
+
+        rates = [
+            ("text cache", hit_rate("text_cache_lookups", "hit", "miss")),
+            ("speculation", hit_rate("speculations", "hit", "miss")),
+        ]
+        ocr_cache = ocr_result_cache_stats()
+        if ocr_cache["hits"] or ocr_cache["misses"]:
+            rates.insert(0, ("OCR cache", ocr_cache["hit_rate"]))
+        rate_text = ", ".join(
+            f"{name} {rate:.0%}" for name, rate in rates if rate is not None
+        )
+        if rate_text:
+            lines.append(f"Hit rates: {rate_text}")
+
+        cooldowns = ", ".join(
+            f"{labels['service']} {metric.value:.0f}"
+            for labels, metric in registry.collect("api_key_cooldowns")
+            if metric.value
+        )
+        if cooldowns:
+            lines.append(f"Key cooldowns: {cooldowns}")
+        return "\n".join(lines) or "No metrics recorded yet"
+
     def toggle_visibility(self):
         if self.isVisible():
             self.hide()
@@ -692,29 +1002,106 @@ class TranslatorApp(QMainWindow):
             stability_frames=self.config.ocr_stability_frames,
             min_confidence=self.config.subtitle_ocr_min_confidence,
             max_lines=self.config.subtitle_ocr_max_lines,
+            speculative=self.config.ocr_speculative_enabled,
+            speculative_min_confidence=self.config.ocr_speculative_min_confidence,
+            line_incremental=self.config.ocr_line_incremental,
+            line_cache_size=self.config.ocr_line_cache_size,
+            cascade=self.config.ocr_cascade_enabled,
+            cascade_threshold=self.config.ocr_cascade_threshold,
+            auto_band=self.config.ocr_auto_band_enabled,
+            band_warmup_seconds=self.config.ocr_auto_band_warmup_seconds,
+            band_reexpand_seconds=self.config.ocr_auto_band_reexpand_seconds,
+            log_rate=self.config.hot_path_log_rate,
         )
         self.ocr_monitor.change_detected.connect(self._on_ocr_change_detected)
+        self.ocr_monitor.speculation_requested.connect(self._on_ocr_speculation)
         self.ocr_monitor.start()
         logging.info("Auto-translation OCR monitor started")
 
+    def _warm_up_ocr(self) -> None:
+        """Load the source language's OCR engine and run a dummy inference.
+
+        For WinOCR this also checks the language pack.
+        """
+        lang = self.config.source_language
+        engine = select_engine(lang)
+        if engine is None:
+            return
+        started = time.perf_counter()
+        try:
+            name = warm_up_ocr(lang=lang, **engine.ocr_kwargs)
+            logging.info(
+                "%s warmed up for %s in %.0f ms",
+                name,
+                lang,
+                (time.perf_counter() - started) * 1000,
+            )
+        except Exception as exc:
+            logging.warning("OCR warm-up failed: %s", exc)
+
+    def _prewarm_ocr_engines(self) -> None:
+        """Warm the OCR engine for the source language off the UI thread."""
+        threading.Thread(
+            target=self._warm_up_ocr, name="OCRWarmup", daemon=True
+        ).start()
+
+    def _start_warm_up(self) -> None:
+        """Warm the cold paths of the first translation in the background.
+
+        Loads the OCR engine (language pack check and dummy inference), then
+        builds the translation service and opens its connection. Requests
+        made meanwhile wait on the same engine/service locks instead of
+        repeating the work.
+        """
+        steps = [
+            ("OCR engine", self._warm_up_ocr),
+            (self.config.translation_service, self.translation_worker.warm_up),
+        ]
+
+        def run():
+            started = time.perf_counter()
+            for index, (label, step) in enumerate(steps, 1):
+                self.warm_up_progress.emit(
+                    f"Warming up {label} ({index}/{len(steps)})...", False
+                )
+                try:
+                    step()
+                except Exception as exc:
+                    logging.warning("Warm-up of %s failed: %s", label, exc)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            logging.info("Warm-up finished in %.0f ms", elapsed_ms)
+            self.warm_up_progress.emit(f"Ready (warm-up {elapsed_ms:.0f} ms)", True)
+
+        threading.Thread(target=run, name="WarmUp", daemon=True).start()
+
+    def _on_warm_up_progress(self, message: str, finished: bool) -> None:
+        # Do not overwrite the status of a translation in flight.
+        if self.pending_translations > 0:
+            return
+        self.show_status(message, persistent=not finished)
+
     def _stop_auto_translation(self) -> None:
         if self.ocr_monitor is not None:
             self.ocr_monitor.stop()
             self.ocr_monitor = None
             logging.info("Auto-translation OCR monitor stopped")
 
-    def _on_ocr_change_detected(self, frame, ocr_data=None):
+    def _on_ocr_change_detected(self, frame, ocr_data=None, trace_id=None):
         """Handle change_detected signal from OCR monitor (text stabilized)."""
+        add_span(trace_id, "ui_queue")
         if not self.auto_translation_enabled or self.auto_translation_paused:
+            finish_trace(trace_id)
             return
 
         try:
             screenshot_np = frame
             if screenshot_np is None:
+                finish_trace(trace_id)
                 return
 
             if not self._reserve_translation_slot():
                 logging.debug("Skipping auto-translation: max pending requests reached")
+                finish_trace(trace_id)
                 return
 
             timestamp = time.time()
@@ -729,10 +1116,20 @@ class TranslatorApp(QMainWindow):
                 self.selected_region,
                 precomputed_ocr=ocr_data,
                 timestamp=timestamp,
+                trace_id=trace_id,
             )
 
         except Exception as exc:
             logging.error("Auto translation failed: %s", exc)
+            finish_trace(trace_id)
+
+    def _on_ocr_speculation(self, frame, ocr_data=None):
+        """Handle speculation_requested: pre-translate text that may stabilize."""
+        if not self.auto_translation_enabled or self.auto_translation_paused:
+            return
+        if frame is None:
+            return
+        self.translation_worker.speculate(frame, self.selected_region, ocr_data)
 
     def increase_font_size(self):
         if self.font_size_index < len(self.font_sizes) - 1:
@@ -789,6 +1186,7 @@ class TranslatorApp(QMainWindow):
     def _update_pending_after_completion(self, success_message: str | None = None):
         if self.pending_translations > 0:
             self.pending_translations -= 1
+        self._pending_gauge.set(self.pending_translations)
         if self.pending_translations > 0:
             self._update_translating_status()
         else:
@@ -801,6 +1199,7 @@ class TranslatorApp(QMainWindow):
         if self.pending_translations >= 4:
             return False
         self.pending_translations += 1
+        self._pending_gauge.set(self.pending_translations)
         self._update_translating_status()
         QApplication.processEvents()
         return True
@@ -811,6 +1210,7 @@ class TranslatorApp(QMainWindow):
             timer.stop()
             timer.deleteLater()
             logging.warning(f"Translation request {timestamp} timed out after 30s")
+            self._timeouts.inc()
             self._update_pending_after_completion("Translation timed out")
 
     def eventFilter(self, obj, event):
@@ -871,6 +1271,8 @@ class TranslatorApp(QMainWindow):
                     self.change_service()
                 elif msg.wParam == ALT_C_HOTKEY_ID:
                     self.clear_session()
+                elif msg.wParam == ALT_M_HOTKEY_ID:
+                    self.toggle_stats_panel()
         return super().nativeEvent(eventType, message)
 
     def closeEvent(self, event):
@@ -883,16 +1285,25 @@ class TranslatorApp(QMainWindow):
             user32.UnregisterHotKey(self.hwnd, ALT_L_HOTKEY_ID)
             user32.UnregisterHotKey(self.hwnd, ALT_TILDE_HOTKEY_ID)
             user32.UnregisterHotKey(self.hwnd, ALT_C_HOTKEY_ID)
+            user32.UnregisterHotKey(self.hwnd, ALT_M_HOTKEY_ID)
         except Exception:
             pass
 
         # Stop auto translation monitor
         self._stop_auto_translation()
+        shutdown_ocr_backend()
+        self.stats_timer.stop()
+        self.config_watch_timer.stop()
+        stop_metrics_server()
 
         # Ensure any pending geometry save is completed
         if self.geometry_save_timer.isActive():
             self.geometry_save_timer.stop()
             self._save_window_geometry()
+        # Persist settings still waiting in the config write-behind buffer
+        self.config.flush()
+        if self.transcript is not None:
+            self.transcript.close()
 
         # Cleanup translation worker thread
         if hasattr(self, "translation_worker") and self.translation_worker:
@@ -904,12 +1315,14 @@ class TranslatorApp(QMainWindow):
             self.translation_worker_thread.quit()
             self.translation_worker_thread.wait(2000)
 
-        # Prune old log sessions (keep last 3) before flushing
-        from core.log_buffer import prune_translator_log
-        from pathlib import Path
-
-        log_path = Path("translator.log")
-        prune_translator_log(log_path, max_sessions=3)
+        if self.config.tracing_enabled:
+            try:
+                count = export_chrome_trace(Path(self.config.trace_export_path))
+                logging.info(
+                    "Exported %d traces to %s", count, self.config.trace_export_path
+                )
+            except Exception as exc:
+                logging.warning("Trace export failed: %s", exc)
 
         flush_logs()
 
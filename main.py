@@ -1,15 +1,19 @@
 import sys
 import logging
+import time
+import multiprocessing
 from pathlib import Path
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtNetwork import QLocalServer, QLocalSocket
-from core.log_buffer import init_memory_logging
+from core.log_buffer import LogSegments, init_memory_logging
+from core.metrics import gauge
 
 
 def setup_logging():
     """Configure logging for the application"""
     project_dir = Path(__file__).resolve().parent
-    log_file = project_dir / "translator.log"
+    log_file = LogSegments(project_dir / "logs", max_sessions=3).start_session()
     formatter = logging.Formatter("%(asctime)s - %(levelname)s: %(message)s")
 
     root_logger = logging.getLogger()
@@ -25,8 +29,15 @@ def setup_logging():
     root_logger.addHandler(memory_handler)
 
 
+def _report_startup(started: float) -> None:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    gauge("startup_ms", "Time from main() to the first shown overlay").set(elapsed_ms)
+    logging.info("Overlay shown %.0f ms after start", elapsed_ms)
+
+
 def main():
     """Main entry point"""
+    started = time.perf_counter()
     setup_logging()
 
     # Create a dummy app to use QLocalServer
@@ -54,6 +65,8 @@ def main():
         # Create and show the main window
         translator = TranslatorApp()
         translator.show()
+        # Runs once the show event has been processed
+        QTimer.singleShot(0, lambda: _report_startup(started))
 
         logging.info("Application started successfully")
         return app.exec_()
@@ -64,4 +77,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for OCR worker processes in frozen Windows builds
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -1,13 +1,31 @@
-from .gemini_service import GeminiTranslationService
-from .groq_service import GroqTranslationService
-from .openrouter_service import OpenRouterTranslationService
-from .sambanova_service import SambaNovaTranslationService
-from .cerebras_service import CerebrasTranslationService
-
-__all__ = [
-    "GeminiTranslationService",
-    "GroqTranslationService",
-    "OpenRouterTranslationService",
-    "SambaNovaTranslationService",
-    "CerebrasTranslationService",
-]
+"""Translation service implementations.
+
+Provider modules import their SDKs (google-genai, openai, imagehash) at module
+level, so they are loaded on first attribute access (PEP 562) rather than
+when the package is imported; only the selected provider's SDK is loaded.
+"""
+
+import importlib
+
+_SERVICE_MODULES = {
+    "GeminiTranslationService": "gemini_service",
+    "GroqTranslationService": "groq_service",
+    "OpenRouterTranslationService": "openrouter_service",
+    "SambaNovaTranslationService": "sambanova_service",
+    "CerebrasTranslationService": "cerebras_service",
+}
+
+__all__ = list(_SERVICE_MODULES)
+
+
+def __getattr__(name):
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
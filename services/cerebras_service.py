@@ -8,15 +8,18 @@ import numpy as np
 from PIL import Image
 from openai import OpenAI
 
-from core.config_manager import ConfigManager
-from subtitle.utils import build_image_translation_prompt, encode_image_to_base64
+from core.config_manager import ConfigManager, ConfigSnapshot
+from core.metrics import ProviderMetrics
+from subtitle.utils import encode_image_to_base64
 from threads.translation_errors import TranslationServiceError
 from threads.translation_interface import TranslationService
 
 
 class CerebrasTranslationService(TranslationService):
     def __init__(self, config_manager: ConfigManager):
+        super().__init__()
         self.config = config_manager
+        self._metrics = ProviderMetrics("cerebras")
         self._cerebras_api_keys = self._initialize_api_keys()
         if not self._cerebras_api_keys:
             raise ValueError("No Cerebras API keys available for translation service")
@@ -49,15 +52,26 @@ class CerebrasTranslationService(TranslationService):
             return api_key
         return f"{api_key[:4]}...{api_key[-4:]}"
 
-    def _set_client_api_key(self, api_key: str) -> None:
-        if api_key != self.config.cerebras_api_key:
-            self.config.cerebras_api_key = api_key
+    def _set_client_api_key(
+        self, api_key: str, config: Optional[ConfigSnapshot] = None
+    ) -> OpenAI:
+        config = config or self.config.snapshot()
+        if self._active_api_key is not None and api_key != self._active_api_key:
             logging.info("Cerebras API key rotated to %s", self._mask_key(api_key))
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url=self.config.cerebras_base_url,
-            max_retries=0,
-        )
+            # Persist the working key so the next launch starts with it.
+            self.config.cerebras_api_key = api_key
+        self._active_api_key = api_key
+        client_key = (api_key, config.cerebras_base_url)
+        client = self._clients.get(client_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                base_url=config.cerebras_base_url,
+                max_retries=0,
+            )
+            self._clients[client_key] = client
+        self.client = client
+        return client
 
     def _keys_rotation_order(self) -> List[str]:
         if not self._cerebras_api_keys:
@@ -78,6 +92,7 @@ class CerebrasTranslationService(TranslationService):
 
     def _mark_key_cooldown(self, api_key: str) -> None:
         self._key_cooldowns[api_key] = time.time() + self.config.cooldown_seconds
+        self._metrics.key_cooldowns.inc()
 
     def _advance_index(self, api_key: str) -> None:
         if api_key in self._cerebras_api_keys:
@@ -92,6 +107,7 @@ class CerebrasTranslationService(TranslationService):
                 self._mask_key(api_key),
             )
             self._cerebras_api_keys.remove(api_key)
+            self._metrics.keys_removed.inc()
             self._key_cooldowns.pop(api_key, None)
             if not self._cerebras_api_keys:
                 raise ValueError("All Cerebras API keys are invalid or unavailable")
@@ -111,6 +127,7 @@ class CerebrasTranslationService(TranslationService):
     ) -> Tuple[str, Optional[Any]]:
         if cache is None:
             cache = {}
+        config = self.config.snapshot()
 
         if screenshot_np is None:
             logging.error(
@@ -124,6 +141,7 @@ class CerebrasTranslationService(TranslationService):
             if current_hash == last_hash:
                 return "", None
             if current_hash in cache:
+                self._metrics.image_cache_hits.inc()
                 return cache[current_hash], current_hash
         except Exception as exc:
             logging.error("Failed to hash image: %s", exc)
@@ -146,7 +164,7 @@ class CerebrasTranslationService(TranslationService):
         translate_start = time.perf_counter()
         try:
             image_b64 = encode_image_to_base64(screenshot_np)
-            result = self._translate_image(image_b64, history)
+            result = self._translate_image(image_b64, history, config)
         except TranslationServiceError:
             raise
         except Exception as exc:
@@ -163,7 +181,7 @@ class CerebrasTranslationService(TranslationService):
             )
             if current_hash:
                 cache[current_hash] = result
-                if len(cache) > self.config.max_cache_size:
+                if len(cache) > config.max_cache_size:
                     oldest_key = next(iter(cache))
                     del cache[oldest_key]
             return result, current_hash
@@ -176,18 +194,18 @@ class CerebrasTranslationService(TranslationService):
         return result, current_hash
 
     def _translate_image(
-        self, image_b64: str, history: Optional[List[str]] = None
+        self,
+        image_b64: str,
+        history: Optional[List[str]] = None,
+        config: Optional[ConfigSnapshot] = None,
     ) -> str:
         if not image_b64:
             return ""
 
-        prompt = build_image_translation_prompt(
-            target_lang=self.config.target_language,
-            source_lang=self.config.source_language,
-            history=history,
-        )
+        config = config or self.config.snapshot()
+        prompt = self._build_prompt(config, history)
 
-        model_name = self.config.cerebras_model
+        model_name = config.cerebras_model
         keys_to_try = [
             key for key in self._keys_rotation_order() if self._is_key_available(key)
         ]
@@ -212,17 +230,18 @@ class CerebrasTranslationService(TranslationService):
                     ],
                 }
             ],
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-            "top_p": self.config.top_p,
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+            "top_p": config.top_p,
             "stream": False,
         }
 
         for api_key in keys_to_try:
-            self._set_client_api_key(api_key)
+            client = self._set_client_api_key(api_key, config)
             masked_key = self._mask_key(api_key)
             try:
-                response = self.client.chat.completions.create(**request_kwargs)
+                with self._metrics.request():
+                    response = client.chat.completions.create(**request_kwargs)
                 content = (
                     response.choices[0].message.content if response.choices else ""
                 )
@@ -250,6 +269,13 @@ class CerebrasTranslationService(TranslationService):
     def switch_service(self, service_name: str) -> bool:
         return service_name == "cerebras"
 
+    def warm_up(self) -> None:
+        """Open the HTTPS connection (DNS, TCP, TLS) before the first request."""
+        try:
+            self.client.models.list()
+        except Exception as exc:
+            logging.debug("Cerebras warm-up request failed: %s", exc)
+
     def _handle_provider_error(self, api_key: str, exc: Exception) -> None:
         detail = str(exc).lower()
         if not detail:
@@ -8,15 +8,18 @@ import imagehash
 from google import genai
 from google.genai import types
 
-from core.config_manager import ConfigManager
-from subtitle.utils import build_image_translation_prompt, encode_image_to_bytes
+from core.config_manager import ConfigManager, ConfigSnapshot
+from core.metrics import ProviderMetrics
+from subtitle.utils import encode_image_to_bytes
 from threads.translation_errors import TranslationServiceError
 from threads.translation_interface import TranslationService
 
 
 class GeminiTranslationService(TranslationService):
     def __init__(self, config_manager: ConfigManager):
+        super().__init__()
         self.config = config_manager
+        self._metrics = ProviderMetrics("gemini")
         configured_model = (self.config.gemini_model or "").strip()
         self.model_name = configured_model
         self.model_capabilities: Dict[str, bool] = {}
@@ -50,11 +53,27 @@ class GeminiTranslationService(TranslationService):
             return api_key
         return f"{api_key[:4]}...{api_key[-4:]}"
 
-    def _set_client_api_key(self, api_key: str) -> None:
-        if api_key != self.config.gemini_api_key:
-            self.config.gemini_api_key = api_key
+    def _set_client_api_key(
+        self, api_key: str, config: Optional[ConfigSnapshot] = None
+    ) -> genai.Client:
+        config = config or self.config.snapshot()
+        if self._active_api_key is not None and api_key != self._active_api_key:
             logging.info("Gemini API key rotated to %s", self._mask_key(api_key))
-        self.client = genai.Client(api_key=api_key)
+            # Persist the working key so the next launch starts with it.
+            self.config.gemini_api_key = api_key
+        self._active_api_key = api_key
+        base_url = (config.gemini_base_url or "").strip()
+        client = self._clients.get((api_key, base_url))
+        if client is None:
+            if base_url:
+                client = genai.Client(
+                    api_key=api_key, http_options=types.HttpOptions(base_url=base_url)
+                )
+            else:
+                client = genai.Client(api_key=api_key)
+            self._clients[(api_key, base_url)] = client
+        self.client = client
+        return client
 
     def _keys_rotation_order(self) -> List[str]:
         if not self._gemini_api_keys:
@@ -75,6 +94,7 @@ class GeminiTranslationService(TranslationService):
 
     def _mark_key_cooldown(self, api_key: str) -> None:
         self._key_cooldowns[api_key] = time.time() + self.config.cooldown_seconds
+        self._metrics.key_cooldowns.inc()
 
     def _advance_index(self, api_key: str) -> None:
         if api_key in self._gemini_api_keys:
@@ -89,25 +109,26 @@ class GeminiTranslationService(TranslationService):
                 self._mask_key(api_key),
             )
             self._gemini_api_keys.remove(api_key)
+            self._metrics.keys_removed.inc()
             self._key_cooldowns.pop(api_key, None)
             if not self._gemini_api_keys:
                 raise ValueError("All Gemini API keys are invalid or unavailable")
             self._current_key_index %= len(self._gemini_api_keys)
 
     def _translate_image(
-        self, image: np.ndarray, history: Optional[List[str]] = None
+        self,
+        image: np.ndarray,
+        history: Optional[List[str]],
+        config: ConfigSnapshot,
+        client: genai.Client,
     ) -> str:
-        prompt = build_image_translation_prompt(
-            target_lang=self.config.target_language,
-            source_lang=self.config.source_language,
-            history=history,
-        )
+        prompt = self._build_prompt(config, history)
 
         model_name = self.model_name
         try:
             cfg_kwargs = {
-                "max_output_tokens": self.config.max_tokens,
-                "temperature": self.config.temperature,
+                "max_output_tokens": config.max_tokens,
+                "temperature": config.temperature,
             }
 
             # Disable safety settings to reduce latency
@@ -127,14 +148,15 @@ class GeminiTranslationService(TranslationService):
             img_bytes = encode_image_to_bytes(image)
 
             gen_config = types.GenerateContentConfig(**cfg_kwargs)
-            response = self.client.models.generate_content(
-                model=model_name,
-                contents=[
-                    prompt,
-                    types.Part.from_bytes(data=img_bytes, mime_type="image/jpeg"),
-                ],
-                config=gen_config,
-            )
+            with self._metrics.request():
+                response = client.models.generate_content(
+                    model=model_name,
+                    contents=[
+                        prompt,
+                        types.Part.from_bytes(data=img_bytes, mime_type="image/jpeg"),
+                    ],
+                    config=gen_config,
+                )
             result = (response.text or "").strip()
             if not result:
                 return ""
@@ -154,6 +176,7 @@ class GeminiTranslationService(TranslationService):
     ) -> Tuple[str, Optional[Any]]:
         if cache is None:
             cache = {}
+        config = self.config.snapshot()
 
         if screenshot_np is None:
             logging.error(
@@ -177,6 +200,7 @@ class GeminiTranslationService(TranslationService):
             if current_hash == last_hash:
                 return "", None
             if current_hash in cache:
+                self._metrics.image_cache_hits.inc()
                 return cache[current_hash], current_hash
         except Exception as e:
             logging.error(f"Failed to hash image: {e}")
@@ -188,7 +212,7 @@ class GeminiTranslationService(TranslationService):
         # Perform image-based translation
         translate_start = time.perf_counter()
         try:
-            result = self._translate_with_failover(screenshot_np, history)
+            result = self._translate_with_failover(screenshot_np, history, config)
         except TranslationServiceError:
             translation_duration_ms = (time.perf_counter() - translate_start) * 1000
             raise
@@ -208,7 +232,7 @@ class GeminiTranslationService(TranslationService):
 
         if current_hash and result and result != "__NO_TEXT__":
             cache[current_hash] = result
-            if len(cache) > self.config.max_cache_size:
+            if len(cache) > config.max_cache_size:
                 oldest_key = next(iter(cache))
                 del cache[oldest_key]
 
@@ -218,11 +242,18 @@ class GeminiTranslationService(TranslationService):
         # This service only handles Gemini, so switching is not applicable
         return service_name == "gemini"
 
+    def warm_up(self) -> None:
+        """Open the HTTPS connection (DNS, TCP, TLS) before the first request."""
+        try:
+            self.client.models.get(model=self.model_name)
+        except Exception as exc:
+            logging.debug("Gemini warm-up request failed: %s", exc)
+
     # ------------------------------------------------------------------
     # Error handling helpers
     # ------------------------------------------------------------------
     def _translate_with_failover(
-        self, image: np.ndarray, history: Optional[List[str]]
+        self, image: np.ndarray, history: Optional[List[str]], config: ConfigSnapshot
     ) -> str:
         keys_to_try = self._keys_rotation_order()
         if not keys_to_try:
@@ -236,10 +267,10 @@ class GeminiTranslationService(TranslationService):
                 continue
 
             self._current_key_index = self._gemini_api_keys.index(api_key)
-            self._set_client_api_key(api_key)
+            client = self._set_client_api_key(api_key, config)
 
             try:
-                return self._translate_image(image, history)
+                return self._translate_image(image, history, config, client)
             except TranslationServiceError as exc:
                 last_error = exc
                 self._handle_provider_error(api_key, exc)
@@ -9,15 +9,18 @@ import numpy as np
 from PIL import Image
 from openai import OpenAI
 
-from core.config_manager import ConfigManager
-from subtitle.utils import build_image_translation_prompt, encode_image_to_base64
+from core.config_manager import ConfigManager, ConfigSnapshot
+from core.metrics import ProviderMetrics
+from subtitle.utils import encode_image_to_base64
 from threads.translation_errors import TranslationServiceError
 from threads.translation_interface import TranslationService
 
 
 class GroqTranslationService(TranslationService):
     def __init__(self, config_manager: ConfigManager):
+        super().__init__()
         self.config = config_manager
+        self._metrics = ProviderMetrics("groq")
         self._groq_api_keys = self._initialize_api_keys()
         if not self._groq_api_keys:
             raise ValueError("No Groq API keys available for translation service")
@@ -47,15 +50,26 @@ class GroqTranslationService(TranslationService):
             return api_key
         return f"{api_key[:4]}...{api_key[-4:]}"
 
-    def _set_client_api_key(self, api_key: str) -> None:
-        if api_key != self.config.groq_api_key:
-            self.config.groq_api_key = api_key
+    def _set_client_api_key(
+        self, api_key: str, config: Optional[ConfigSnapshot] = None
+    ) -> OpenAI:
+        config = config or self.config.snapshot()
+        if self._active_api_key is not None and api_key != self._active_api_key:
             logging.info("Groq API key rotated to %s", self._mask_key(api_key))
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url=self.config.groq_base_url,
-            max_retries=0,
-        )
+            # Persist the working key so the next launch starts with it.
+            self.config.groq_api_key = api_key
+        self._active_api_key = api_key
+        client_key = (api_key, config.groq_base_url)
+        client = self._clients.get(client_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                base_url=config.groq_base_url,
+                max_retries=0,
+            )
+            self._clients[client_key] = client
+        self.client = client
+        return client
 
     def _keys_rotation_order(self) -> List[str]:
         if not self._groq_api_keys:
@@ -87,6 +101,7 @@ class GroqTranslationService(TranslationService):
 
     def _mark_key_cooldown(self, api_key: str) -> None:
         self._key_cooldowns[api_key] = time.time() + self.config.cooldown_seconds
+        self._metrics.key_cooldowns.inc()
 
     def _advance_index(self, api_key: str) -> None:
         if api_key in self._groq_api_keys:
@@ -105,6 +120,7 @@ class GroqTranslationService(TranslationService):
 
     def _mark_key_daily_exhausted(self, api_key: str, seconds: float) -> None:
         self._key_daily_exhausted[api_key] = time.time() + seconds
+        self._metrics.key_cooldowns.inc()
         hours = seconds / 3600
         logging.warning(
             "Groq key %s hit daily token limit (TPD), cooling down for %.1f hours",
@@ -119,6 +135,7 @@ class GroqTranslationService(TranslationService):
                 self._mask_key(api_key),
             )
             self._groq_api_keys.remove(api_key)
+            self._metrics.keys_removed.inc()
             self._key_cooldowns.pop(api_key, None)
             self._key_daily_exhausted.pop(api_key, None)
             if not self._groq_api_keys:
@@ -126,16 +143,16 @@ class GroqTranslationService(TranslationService):
             self._current_key_index %= len(self._groq_api_keys)
 
     def _translate_image(
-        self, image_b64: str, history: Optional[List[str]] = None
+        self,
+        image_b64: str,
+        history: Optional[List[str]] = None,
+        config: Optional[ConfigSnapshot] = None,
     ) -> str:
         if not image_b64:
             return ""
 
-        prompt = build_image_translation_prompt(
-            target_lang=self.config.target_language,
-            source_lang=self.config.source_language,
-            history=history,
-        )
+        config = config or self.config.snapshot()
+        prompt = self._build_prompt(config, history)
 
         messages: List[Dict[str, Any]] = [
             {
@@ -150,7 +167,7 @@ class GroqTranslationService(TranslationService):
             }
         ]
 
-        model_name = self.config.groq_model
+        model_name = config.groq_model
         keys_to_try = [
             key for key in self._keys_rotation_order() if self._is_key_available(key)
         ]
@@ -162,18 +179,19 @@ class GroqTranslationService(TranslationService):
         last_error = None
 
         for api_key in keys_to_try:
-            self._set_client_api_key(api_key)
+            client = self._set_client_api_key(api_key, config)
             try:
-                response = self.client.chat.completions.create(
-                    model=model_name,
-                    messages=messages,
-                    max_tokens=self.config.max_tokens,
-                    temperature=self.config.temperature,
-                    top_p=self.config.top_p,
-                    frequency_penalty=self.config.frequency_penalty,
-                    presence_penalty=self.config.presence_penalty,
-                    stream=False,
-                )
+                with self._metrics.request():
+                    response = client.chat.completions.create(
+                        model=model_name,
+                        messages=messages,
+                        max_tokens=config.max_tokens,
+                        temperature=config.temperature,
+                        top_p=config.top_p,
+                        frequency_penalty=config.frequency_penalty,
+                        presence_penalty=config.presence_penalty,
+                        stream=False,
+                    )
                 content = (
                     response.choices[0].message.content if response.choices else ""
                 )
@@ -201,6 +219,7 @@ class GroqTranslationService(TranslationService):
     ) -> Tuple[str, Optional[Any]]:
         if cache is None:
             cache = {}
+        config = self.config.snapshot()
 
         if screenshot_np is None:
             logging.error("Groq service requires a pre-captured frame for translation.")
@@ -213,6 +232,7 @@ class GroqTranslationService(TranslationService):
             if current_hash == last_hash:
                 return "", None
             if current_hash in cache:
+                self._metrics.image_cache_hits.inc()
                 return cache[current_hash], current_hash
         except Exception as exc:
             logging.error("Failed to hash image: %s", exc)
@@ -234,7 +254,7 @@ class GroqTranslationService(TranslationService):
         translate_start = time.perf_counter()
         try:
             image_b64 = encode_image_to_base64(screenshot_np)
-            result = self._translate_image(image_b64, history)
+            result = self._translate_image(image_b64, history, config)
         except TranslationServiceError:
             raise
         except Exception as exc:
@@ -251,7 +271,7 @@ class GroqTranslationService(TranslationService):
             )
             if current_hash:
                 cache[current_hash] = result
-                if len(cache) > self.config.max_cache_size:
+                if len(cache) > config.max_cache_size:
                     oldest_key = next(iter(cache))
                     del cache[oldest_key]
             return result, current_hash
@@ -266,6 +286,13 @@ class GroqTranslationService(TranslationService):
     def switch_service(self, service_name: str) -> bool:
         return service_name == "groq"
 
+    def warm_up(self) -> None:
+        """Open the HTTPS connection (DNS, TCP, TLS) before the first request."""
+        try:
+            self.client.models.list()
+        except Exception as exc:
+            logging.debug("Groq warm-up request failed: %s", exc)
+
     def _handle_provider_error(self, api_key: str, exc: Exception) -> None:
         detail = str(exc).lower()
         if not detail:
@@ -6,15 +6,18 @@ from PIL import Image
 import numpy as np
 import imagehash
 from openai import OpenAI
-from core.config_manager import ConfigManager
-from subtitle.utils import build_image_translation_prompt, encode_image_to_base64
+from core.config_manager import ConfigManager, ConfigSnapshot
+from core.metrics import ProviderMetrics
+from subtitle.utils import encode_image_to_base64
 from threads.translation_errors import TranslationServiceError
 from threads.translation_interface import TranslationService
 
 
 class OpenRouterTranslationService(TranslationService):
     def __init__(self, config_manager: ConfigManager):
+        super().__init__()
         self.config = config_manager
+        self._metrics = ProviderMetrics("openrouter")
         self._openrouter_api_keys = self._initialize_api_keys()
         if not self._openrouter_api_keys:
             raise ValueError("No OpenRouter API keys available for translation service")
@@ -44,15 +47,26 @@ class OpenRouterTranslationService(TranslationService):
             return api_key
         return f"{api_key[:4]}...{api_key[-4:]}"
 
-    def _set_client_api_key(self, api_key: str) -> None:
-        if api_key != self.config.openrouter_api_key:
-            self.config.openrouter_api_key = api_key
+    def _set_client_api_key(
+        self, api_key: str, config: Optional[ConfigSnapshot] = None
+    ) -> OpenAI:
+        config = config or self.config.snapshot()
+        if self._active_api_key is not None and api_key != self._active_api_key:
             logging.info("OpenRouter API key rotated to %s", self._mask_key(api_key))
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url=self.config.openrouter_base_url,
-            max_retries=0,
-        )
+            # Persist the working key so the next launch starts with it.
+            self.config.openrouter_api_key = api_key
+        self._active_api_key = api_key
+        client_key = (api_key, config.openrouter_base_url)
+        client = self._clients.get(client_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key,
+                base_url=config.openrouter_base_url,
+                max_retries=0,
+            )
+            self._clients[client_key] = client
+        self.client = client
+        return client
 
     def _keys_rotation_order(self) -> List[str]:
         if not self._openrouter_api_keys:
@@ -73,6 +87,7 @@ class OpenRouterTranslationService(TranslationService):
 
     def _mark_key_cooldown(self, api_key: str) -> None:
         self._key_cooldowns[api_key] = time.time() + self.config.cooldown_seconds
+        self._metrics.key_cooldowns.inc()
 
     def _advance_index(self, api_key: str) -> None:
         if api_key in self._openrouter_api_keys:
@@ -87,6 +102,7 @@ class OpenRouterTranslationService(TranslationService):
                 self._mask_key(api_key),
             )
             self._openrouter_api_keys.remove(api_key)
+            self._metrics.keys_removed.inc()
             self._key_cooldowns.pop(api_key, None)
             if not self._openrouter_api_keys:
                 raise ValueError("All OpenRouter API keys are invalid or unavailable")
@@ -129,6 +145,7 @@ class OpenRouterTranslationService(TranslationService):
     ) -> Tuple[str, Optional[Any]]:
         if cache is None:
             cache = {}
+        config = self.config.snapshot()
 
         if screenshot_np is None:
             logging.error(
@@ -143,6 +160,7 @@ class OpenRouterTranslationService(TranslationService):
             if current_hash == last_hash:
                 return "", None
             if current_hash in cache:
+                self._metrics.image_cache_hits.inc()
                 return cache[current_hash], current_hash
         except Exception as e:
             logging.error(f"Failed to hash image: {e}")
@@ -164,7 +182,7 @@ class OpenRouterTranslationService(TranslationService):
         translate_start = time.perf_counter()
         try:
             image_b64 = encode_image_to_base64(screenshot_np)
-            result = self._translate_image(image_b64, history)
+            result = self._translate_image(image_b64, history, config)
         except TranslationServiceError:
             raise
         except Exception as exc:
@@ -181,7 +199,7 @@ class OpenRouterTranslationService(TranslationService):
             )
             if current_hash:
                 cache[current_hash] = result
-                if len(cache) > self.config.max_cache_size:
+                if len(cache) > config.max_cache_size:
                     oldest_key = next(iter(cache))
                     del cache[oldest_key]
             return result, current_hash
@@ -194,18 +212,18 @@ class OpenRouterTranslationService(TranslationService):
         return result, current_hash
 
     def _translate_image(
-        self, image_b64: str, history: Optional[List[str]] = None
+        self,
+        image_b64: str,
+        history: Optional[List[str]] = None,
+        config: Optional[ConfigSnapshot] = None,
     ) -> str:
         if not image_b64:
             return ""
 
-        prompt = build_image_translation_prompt(
-            target_lang=self.config.target_language,
-            source_lang=self.config.source_language,
-            history=history,
-        )
+        config = config or self.config.snapshot()
+        prompt = self._build_prompt(config, history)
 
-        model_name = self.config.openrouter_model
+        model_name = config.openrouter_model
         disable_reasoning = self._should_disable_reasoning(model_name)
 
         request_kwargs = {
@@ -222,11 +240,11 @@ class OpenRouterTranslationService(TranslationService):
                     ],
                 }
             ],
-            "max_tokens": self.config.max_tokens,
-            "temperature": self.config.temperature,
-            "top_p": self.config.top_p,
-            "frequency_penalty": self.config.frequency_penalty,
-            "presence_penalty": self.config.presence_penalty,
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+            "top_p": config.top_p,
+            "frequency_penalty": config.frequency_penalty,
+            "presence_penalty": config.presence_penalty,
             "stream": False,
         }
         if disable_reasoning:
@@ -243,7 +261,7 @@ class OpenRouterTranslationService(TranslationService):
         last_error = None
 
         for api_key in keys_to_try:
-            self._set_client_api_key(api_key)
+            client = self._set_client_api_key(api_key, config)
             masked_key = self._mask_key(api_key)
             try:
                 logging.debug(
@@ -251,7 +269,8 @@ class OpenRouterTranslationService(TranslationService):
                     model_name,
                     masked_key,
                 )
-                response = self.client.chat.completions.create(**request_kwargs)
+                with self._metrics.request():
+                    response = client.chat.completions.create(**request_kwargs)
                 content = (
                     response.choices[0].message.content if response.choices else ""
                 )
@@ -279,6 +298,13 @@ class OpenRouterTranslationService(TranslationService):
         # This service only handles OpenRouter, so switching is not applicable
         return service_name == "openrouter"
 
+    def warm_up(self) -> None:
+        """Open the HTTPS connection (DNS, TCP, TLS) before the first request."""
+        try:
+            self.client.models.list()
+        except Exception as exc:
+            logging.debug("OpenRouter warm-up request failed: %s", exc)
+
     def _handle_provider_error(self, api_key: str, exc: Exception) -> None:
         detail = str(exc).lower()
         if not detail:
@@ -0,0 +1,149 @@
+"""Automatic subtitle-band detection.
+
+Users usually select a generous region. While the monitor captures the full
+region, per-frame text-presence masks (edge density) are accumulated into a
+heatmap; after a warm-up period the rows that showed text in several
+frames give a tighter capture band inside the selected region. Subtitle
+lines vary in length, so the band keeps the region's full width. The
+full region is restored periodically and whenever text touches the edge of
+the tight rectangle, after which a new band is learned.
+"""
+
+import logging
+import time
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+Region = Tuple[int, int, int, int]
+
+
+class SubtitleBandDetector:
+    """Learns which rows subtitles appear in and proposes a tighter capture band.
+
+    Args:
+        region: Selected screen region (left, top, width, height)
+        warmup_seconds: How long to accumulate the heatmap before tightening
+        reexpand_seconds: How long a tight band is used before re-learning
+        margin: Minimum screen pixels of padding kept around the detected text
+        downsample: Factor frames are shrunk by before edge detection
+        min_hits: Frames a heatmap cell must show text in to count as subtitle area
+        edge_density: Fraction of edge pixels around a cell that marks text
+    """
+
+    def __init__(
+        self,
+        region: Region,
+        warmup_seconds: float = 3.0,
+        reexpand_seconds: float = 30.0,
+        margin: int = 16,
+        downsample: int = 4,
+        min_hits: int = 2,
+        edge_density: float = 0.12,
+    ):
+        self.full_region: Region = tuple(int(v) for v in region)
+        self.region: Region = self.full_region
+        self.warmup_seconds = warmup_seconds
+        self.reexpand_seconds = reexpand_seconds
+        self.margin = margin
+        self.downsample = max(1, int(downsample))
+        self.min_hits = max(1, int(min_hits))
+        self.edge_density = edge_density
+        self._heat: Optional[np.ndarray] = None
+        self._frames = 0
+        self._learn_started: Optional[float] = None
+        self._tight_since = 0.0
+        self.stats = {"tightened": 0, "expanded": 0}
+
+    @property
+    def tightened(self) -> bool:
+        return self.region != self.full_region
+
+    def _text_mask(self, frame: np.ndarray) -> np.ndarray:
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY) if frame.ndim == 3 else frame
+        height, width = gray.shape[:2]
+        small = cv2.resize(
+            gray,
+            (max(1, width // self.downsample), max(1, height // self.downsample)),
+            interpolation=cv2.INTER_AREA,
+        )
+        edges = cv2.Canny(small, 80, 200)
+        density = cv2.boxFilter(edges, cv2.CV_32F, (5, 5), normalize=True) / 255.0
+        return density >= self.edge_density
+
+    def _reset_learning(self, now: float) -> None:
+        self._heat = None
+        self._frames = 0
+        self._learn_started = now
+
+    def _expand(self, reason: str, now: float) -> None:
+        logging.info("Subtitle band: restoring full region (%s)", reason)
+        self.region = self.full_region
+        self.stats["expanded"] += 1
+        self._reset_learning(now)
+
+    def _propose(self, frame_shape: Tuple[int, ...], now: float) -> None:
+        hot = self._heat >= self.min_hits
+        self._reset_learning(now)
+        if not hot.any():
+            return
+
+        rows = np.flatnonzero(hot.any(axis=1))
+        left, top, width, height = self.full_region
+        # Frames can be larger than the region on scaled displays.
+        scale_y = height / frame_shape[0] * self.downsample
+
+        text_top = int(rows[0] * scale_y)
+        text_bottom = int((rows[-1] + 1) * scale_y)
+        # Leave room for roughly one more line so a subtitle that grows a
+        # line reaches the band edge instead of being cut off unseen.
+        pad = max(self.margin, text_bottom - text_top)
+        y0 = max(0, text_top - pad)
+        y1 = min(height, text_bottom + pad)
+        if y1 - y0 >= 0.8 * height:
+            return
+
+        self.region = (left, top + y0, width, y1 - y0)
+        self._tight_since = now
+        self.stats["tightened"] += 1
+        logging.info(
+            "Subtitle band: capturing %s inside %s (%.0f%% of the area)",
+            self.region,
+            self.full_region,
+            100.0 * (y1 - y0) / height,
+        )
+
+    def _text_at_inner_edge(self, mask: np.ndarray) -> bool:
+        # Edges shared with the selected region cannot be expanded past.
+        _, top, _, height = self.region
+        _, full_top, _, full_height = self.full_region
+        return bool(
+            (top > full_top and mask[0].any())
+            or (top + height < full_top + full_height and mask[-1].any())
+        )
+
+    def observe(self, frame: np.ndarray, now: Optional[float] = None) -> None:
+        """Feed a frame captured from the current ``region``."""
+        if frame is None or frame.size == 0:
+            return
+        now = time.time() if now is None else now
+        mask = self._text_mask(frame)
+
+        if self.tightened:
+            if now - self._tight_since >= self.reexpand_seconds:
+                self._expand("periodic re-check", now)
+            elif self._text_at_inner_edge(mask):
+                self._expand("text at the band edge", now)
+            return
+
+        if self._learn_started is None:
+            self._learn_started = now
+        if self._heat is None or self._heat.shape != mask.shape:
+            self._heat = np.zeros(mask.shape, dtype=np.uint16)
+            self._frames = 0
+        self._heat += mask
+        self._frames += 1
+
+        if now - self._learn_started >= self.warmup_seconds and self._frames >= 3:
+            self._propose(frame.shape, now)
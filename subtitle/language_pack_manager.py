@@ -1,12 +1,19 @@
 """Language pack manager for Windows OCR.
 
-Automatically detects and installs missing Windows OCR language packs
-via PowerShell commands.
+Detects missing Windows OCR language packs via PowerShell. The PowerShell
+query takes seconds, so its per-language results are cached on disk with a
+TTL and the query itself runs on a background thread: ensure_language_pack
+only reads the cache and never blocks the caller.
 """
 
+import json
 import logging
+import os
 import subprocess
-from typing import Dict, List
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
 
 # Mapping from common language codes to Windows OCR capability names
@@ -36,6 +43,139 @@ LANG_TO_CAPABILITY: Dict[str, str] = {
 }
 
 
+# Project root, next to .env
+DEFAULT_CACHE_PATH = (
+    Path(__file__).resolve().parent.parent / ".cache" / "ocr_language_packs.json"
+)
+
+
+class LanguagePackCache:
+    """Per-capability install status persisted as JSON, with a TTL.
+
+    Each entry maps a capability name to {"installed": bool or None,
+    "checked_at": epoch seconds}; None records a query that could not tell
+    (e.g. no permission), so it is not retried until the entry expires.
+
+    Args:
+        path: JSON file the cache is stored in
+        ttl_seconds: Age after which an entry is probed again
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl_seconds: float = 86400):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = self._load()
+        self._probe: Optional[threading.Thread] = None
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return {
+                name: entry
+                for name, entry in data.get("capabilities", {}).items()
+                if isinstance(entry, dict)
+            }
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save(self, entries: Dict[str, dict]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            temp_path.write_text(
+                json.dumps({"capabilities": entries}, indent=2), encoding="utf-8"
+            )
+            os.replace(temp_path, self.path)
+        except OSError as exc:
+            logging.debug("Failed to write language pack cache: %s", exc)
+
+    def lookup(self, capability: str) -> Optional[dict]:
+        """Return the entry for capability if it has not expired."""
+        entry = self._entries.get(capability)
+        if entry is None:
+            return None
+        if time.time() - entry.get("checked_at", 0) >= self.ttl_seconds:
+            return None
+        return entry
+
+    def refresh_async(self, then: Optional[Callable[[], None]] = None) -> None:
+        """Query PowerShell on a background thread unless a query is running.
+
+        then is called on that thread after the cache has been updated.
+        """
+
+        def run():
+            self.refresh()
+            if then is not None:
+                then()
+
+        with self._lock:
+            if self._probe is not None and self._probe.is_alive():
+                return
+            self._probe = threading.Thread(
+                target=run, name="LanguagePackProbe", daemon=True
+            )
+            self._probe.start()
+
+    def refresh(self) -> None:
+        """Query installed packs and record every known capability."""
+        started = time.perf_counter()
+        installed = get_installed_ocr_languages()
+        now = time.time()
+        entries = {
+            capability: {
+                "installed": (capability in installed) if installed else None,
+                "checked_at": now,
+            }
+            for capability in set(LANG_TO_CAPABILITY.values())
+        }
+        with self._lock:
+            self._entries = {**self._entries, **entries}
+            snapshot = dict(self._entries)
+        self._save(snapshot)
+        logging.info(
+            "Language pack probe finished in %.0f ms",
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait for a running background query (for tools and benchmarks)."""
+        probe = self._probe
+        if probe is not None:
+            probe.join(timeout)
+
+
+_cache = LanguagePackCache()
+_warned = set()
+# Languages asked for while uncached, re-checked when the probe finishes
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def _check_pending() -> None:
+    with _pending_lock:
+        pending = list(_pending)
+        _pending.clear()
+    for lang_code in pending:
+        ensure_language_pack(lang_code)
+
+
+def configure_language_pack_cache(
+    ttl_seconds: float, path: Optional[Path] = None
+) -> None:
+    """Set how long probe results stay valid and where they are stored."""
+    global _cache
+    if path is not None and Path(path) != _cache.path:
+        _cache = LanguagePackCache(path, ttl_seconds)
+    else:
+        _cache.ttl_seconds = ttl_seconds
+
+
+def language_pack_cache() -> LanguagePackCache:
+    return _cache
+
+
 def get_installed_ocr_languages() -> List[str]:
     """Get list of installed Windows OCR language packs.
 
@@ -74,7 +214,11 @@ def get_installed_ocr_languages() -> List[str]:
 
 
 def ensure_language_pack(lang_code: str) -> bool:
-    """Ensure a language pack is installed (graceful check, no auto-install).
+    """Check a language pack against the cache (graceful, no auto-install).
+
+    Never blocks: when the cached status is missing or expired, a PowerShell
+    query is started in the background and the pack is assumed available
+    until it finishes.
 
     Args:
         lang_code: Language code (e.g., 'zh-CN', 'ja', 'japanese')
@@ -94,28 +238,31 @@ def ensure_language_pack(lang_code: str) -> bool:
         )
         return True
 
-    # Try to check if installed (may fail due to permissions)
-    installed = get_installed_ocr_languages()
+    entry = _cache.lookup(capability_name)
+    if entry is None:
+        logging.debug("Language pack %s not cached; probing in background", lang_code)
+        with _pending_lock:
+            _pending.add(lang_code)
+        _cache.refresh_async(then=_check_pending)
+        return True
 
-    # If query failed (empty list, likely permission error), assume pack is installed
-    if not installed:
+    installed = entry.get("installed")
+    if installed is None:
+        # Query failed (likely no admin rights) - assume the pack is installed
         logging.debug(
             "Cannot verify language pack %s (no admin rights). "
             "Assuming it's installed - WinOCR will fail naturally if not.",
             lang_code,
         )
-        return True
-
-    # If we got a list and pack is in it, confirmed installed
-    if capability_name in installed:
+    elif installed:
         logging.debug("Language pack %s verified as installed", capability_name)
-        return True
-
-    # Pack not in list - warn user but don't block
-    logging.warning(
-        "Language pack %s may not be installed. "
-        "If WinOCR fails, install manually: Add-WindowsCapability -Online -Name '%s'",
-        lang_code,
-        capability_name,
-    )
+    elif capability_name not in _warned:
+        # Pack not in list - warn user but don't block
+        _warned.add(capability_name)
+        logging.warning(
+            "Language pack %s may not be installed. "
+            "If WinOCR fails, install manually: Add-WindowsCapability -Online -Name '%s'",
+            lang_code,
+            capability_name,
+        )
     return True  # Return True anyway, let WinOCR fail naturally if pack missing
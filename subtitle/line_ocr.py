@@ -0,0 +1,207 @@
+"""Line-level incremental OCR.
+
+Subtitles usually change one line at a time. The frame is binarized and
+split into text-line bands with a horizontal projection profile; each band
+is hashed and only bands whose hash has not been seen before are sent to
+the OCR engine (in one batch for RapidOCR). Cached line texts are stitched back in reading order.
+"""
+
+import collections
+import hashlib
+import logging
+from typing import List, Tuple
+
+import cv2
+import numpy as np
+
+from subtitle.subtitle_ocr import extract_subtitle_text, recognize_text_lines
+
+
+def to_gray(frame: np.ndarray) -> np.ndarray:
+    if frame.ndim == 3:
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return frame
+
+
+def binarize_frame(frame: np.ndarray) -> np.ndarray:
+    """Return an Otsu-binarized grayscale copy of the frame."""
+    _, binary = cv2.threshold(
+        to_gray(frame), 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+    )
+    return binary
+
+
+def segment_lines(
+    binary: np.ndarray,
+    min_height: int = 6,
+    min_gap: int = 3,
+    ink_ratio: float = 0.01,
+) -> List[Tuple[int, int]]:
+    """Split a binarized frame into text-line bands using a row projection profile.
+
+    Ink is taken to be the minority value of the binary image, so both light
+    text on dark backgrounds and dark text on light backgrounds work.
+
+    Args:
+        binary: Binarized single-channel image (0/255)
+        min_height: Bands shorter than this (in pixels) are dropped as noise
+        min_gap: Bands separated by fewer blank rows than this are merged
+        ink_ratio: Fraction of a row's pixels that must be ink for it to count
+
+    Returns:
+        List of (y_start, y_end) row ranges, top to bottom
+    """
+    if binary is None or binary.size == 0:
+        return []
+
+    ink = binary > 0
+    if ink.mean() > 0.5:
+        ink = ~ink
+
+    profile = np.count_nonzero(ink, axis=1)
+    text_rows = profile > max(1, int(binary.shape[1] * ink_ratio))
+
+    bands: List[List[int]] = []
+    start = None
+    for row, is_text in enumerate(text_rows):
+        if is_text and start is None:
+            start = row
+        elif not is_text and start is not None:
+            bands.append([start, row])
+            start = None
+    if start is not None:
+        bands.append([start, len(text_rows)])
+
+    merged: List[List[int]] = []
+    for band in bands:
+        if merged and band[0] - merged[-1][1] < min_gap:
+            merged[-1][1] = band[1]
+        else:
+            merged.append(band)
+
+    return [(y0, y1) for y0, y1 in merged if y1 - y0 >= min_height]
+
+
+class IncrementalLineOCR:
+    """OCR front end that re-recognizes only text lines that changed.
+
+    Args:
+        cache_size: Maximum number of cached line results
+        max_bands: Frames that segment into more bands than this fall back
+            to whole-frame OCR (likely not a subtitle layout)
+        margin: Rows of context added above and below each band crop
+    """
+
+    def __init__(self, cache_size: int = 64, max_bands: int = 4, margin: int = 4):
+        self.cache_size = max(max_bands, cache_size)
+        self.max_bands = max_bands
+        self.margin = margin
+        self._cache: "collections.OrderedDict[tuple, Tuple[str, float]]" = (
+            collections.OrderedDict()
+        )
+        self.stats = {"frames": 0, "bands": 0, "recognized": 0, "fallbacks": 0}
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _band_key(self, gray: np.ndarray, y0: int, y1: int) -> bytes:
+        # Binarize each band on its own so a change in another line (which
+        # shifts the frame-wide Otsu threshold) does not alter this band's hash.
+        _, band = cv2.threshold(
+            gray[y0:y1], 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+        )
+        digest = hashlib.blake2b(band.tobytes(), digest_size=12)
+        digest.update(np.asarray(band.shape, dtype=np.int32).tobytes())
+        return digest.digest()
+
+    def _recognize_bands(
+        self, crops: List[np.ndarray], ocr_kwargs: dict
+    ) -> Tuple[List[Tuple[str, float]], str]:
+        if not ocr_kwargs.get("use_winocr", False):
+            # Changed lines go through the RapidOCR recognizer as one batch.
+            results = recognize_text_lines(
+                crops,
+                rec_model_path=ocr_kwargs.get("rec_model_path"),
+                keys_path=ocr_kwargs.get("keys_path"),
+                min_confidence=ocr_kwargs.get("min_confidence", 0.55),
+            )
+            return results, "RapidOCR"
+
+        results = []
+        engine = "None"
+        for crop in crops:
+            text, conf, engine = extract_subtitle_text(
+                crop, **dict(ocr_kwargs, max_lines=1)
+            )
+            results.append((text.strip(), conf))
+        return results, engine
+
+    def extract(self, frame: np.ndarray, **ocr_kwargs) -> Tuple[str, float, str]:
+        """Extract text like extract_subtitle_text, reusing unchanged lines.
+
+        Returns:
+            Tuple of (text, confidence, engine_name); engine_name is
+            "LineCache" when every line came from the cache.
+        """
+        if frame is None or frame.size == 0:
+            return "", 0.0, "None"
+
+        # Cached line texts are only valid for the OCR settings that made them.
+        settings = tuple(sorted(ocr_kwargs.items()))
+
+        self.stats["frames"] += 1
+        gray = to_gray(frame)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        bands = segment_lines(binary)
+        if not bands or len(bands) > self.max_bands:
+            self.stats["fallbacks"] += 1
+            return extract_subtitle_text(frame, **ocr_kwargs)
+
+        height = frame.shape[0]
+        keys = [(settings, self._band_key(gray, y0, y1)) for y0, y1 in bands]
+        missing = []
+        for index, key in enumerate(keys):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            else:
+                missing.append(index)
+        self.stats["bands"] += len(bands)
+
+        engine = "LineCache"
+        if missing:
+            crops = []
+            for index in missing:
+                y0, y1 = bands[index]
+                crops.append(
+                    frame[max(0, y0 - self.margin) : min(height, y1 + self.margin)]
+                )
+            results, engine = self._recognize_bands(crops, ocr_kwargs)
+            for index, result in zip(missing, results):
+                self._cache[keys[index]] = result
+            self.stats["recognized"] += len(missing)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        lines = []
+        confidences = []
+        for key in keys:
+            text, conf = self._cache[key]
+            if text:
+                lines.append(text)
+                confidences.append(conf)
+
+        logging.debug(
+            "Line OCR: %d bands, %d recognized, %d from cache",
+            len(bands),
+            len(missing),
+            len(bands) - len(missing),
+        )
+
+        if not lines:
+            return "", 0.0, engine
+        # Same line limit as whole-frame OCR, which keeps the first max_lines
+        # readable lines from the top.
+        max_lines = max(1, ocr_kwargs.get("max_lines", 2))
+        lines = lines[:max_lines]
+        confidences = confidences[:max_lines]
+        return "\n".join(lines), float(sum(confidences) / len(confidences)), engine
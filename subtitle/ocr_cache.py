@@ -0,0 +1,130 @@
+"""Frame-digest keyed OCR result cache.
+
+Subtitle scenes often flip between the same few frames (blinking cursors,
+fade-ins, menus shown again). A cheap digest of a downsampled, binarized
+frame identifies such repeats so their OCR result can be returned without
+running the engine again.
+"""
+
+import collections
+import hashlib
+import sys
+import threading
+from typing import Hashable, Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speed-up
+    xxhash = None
+
+OCRResult = Tuple[str, float, str]
+
+
+def frame_digest(frame: np.ndarray, downsample: int = 2) -> bytes:
+    """Return a 64-bit digest of a downsampled, Otsu-binarized frame.
+
+    Binarizing first makes the digest insensitive to small compression or
+    anti-aliasing noise that does not change the rendered text.
+    """
+    if frame.ndim == 3:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = frame
+    height, width = gray.shape[:2]
+    if downsample > 1:
+        gray = cv2.resize(
+            gray,
+            (max(1, width // downsample), max(1, height // downsample)),
+            interpolation=cv2.INTER_AREA,
+        )
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    payload = np.ascontiguousarray(binary).tobytes()
+    shape = np.asarray(frame.shape, dtype=np.int32).tobytes()
+
+    if xxhash is not None:
+        hasher = xxhash.xxh3_64()
+    else:
+        hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(shape)
+    hasher.update(payload)
+    return hasher.digest()
+
+
+class OCRResultCache:
+    """Thread-safe LRU cache of (text, conf, engine) keyed by frame digest.
+
+    Args:
+        max_entries: Maximum cached results; 0 disables the cache
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max(0, int(max_entries))
+        self._entries: "collections.OrderedDict[Hashable, OCRResult]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _entry_size(self, key: Hashable, value: OCRResult) -> int:
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        return size + sum(sys.getsizeof(item) for item in value)
+
+    def get(self, key: Hashable) -> Optional[OCRResult]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: OCRResult) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= self._entry_size(key, previous)
+            self._entries[key] = value
+            self._bytes += self._entry_size(key, value)
+            while len(self._entries) > self.max_entries:
+                old_key, old_value = self._entries.popitem(last=False)
+                self._bytes -= self._entry_size(old_key, old_value)
+
+    def resize(self, max_entries: int) -> None:
+        with self._lock:
+            self.max_entries = max(0, int(max_entries))
+            while len(self._entries) > self.max_entries:
+                old_key, old_value = self._entries.popitem(last=False)
+                self._bytes -= self._entry_size(old_key, old_value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Return entries, hit rate and approximate memory per entry."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            entries = len(self._entries)
+            return {
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes": self._bytes,
+                "bytes_per_entry": self._bytes / entries if entries else 0.0,
+                "hasher": "xxh3_64" if xxhash is not None else "blake2b",
+            }
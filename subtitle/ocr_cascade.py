@@ -0,0 +1,143 @@
+"""Confidence-aware OCR engine cascade.
+
+The cheapest engine runs first; a more expensive engine is tried only when
+the result is empty or below the confidence threshold while the frame
+still appears to contain text. Escalation rates and per-tier latency are
+tracked so the cascade's cost can be inspected.
+"""
+
+import logging
+import time
+from typing import Callable, Collection, List, Optional, Tuple
+
+import numpy as np
+
+from subtitle.line_ocr import binarize_frame, segment_lines
+from subtitle.ocr_engines import RAPIDOCR_DET_REC, engines_for_language
+from subtitle.subtitle_ocr import extract_subtitle_text
+
+
+class OCRCascade:
+    """Run OCR tiers in order of cost until one is confident enough.
+
+    Args:
+        tiers: (name, extract_subtitle_text kwargs) pairs, cheapest first
+        threshold: Minimum confidence that stops escalation
+        ocr_func: OCR callable with the extract_subtitle_text signature
+        full_frame_tiers: Tiers that always run extract_subtitle_text on the
+            whole frame, bypassing ocr_func (e.g. det+rec, which line OCR
+            would reduce to recognition-only)
+    """
+
+    def __init__(
+        self,
+        tiers: List[Tuple[str, dict]],
+        threshold: float = 0.7,
+        ocr_func: Optional[Callable[..., Tuple[str, float, str]]] = None,
+        full_frame_tiers: Collection[str] = (),
+    ):
+        if not tiers:
+            raise ValueError("OCR cascade needs at least one tier")
+        self.tiers = tiers
+        self.threshold = threshold
+        self.ocr_func = ocr_func or extract_subtitle_text
+        self.full_frame_tiers = frozenset(full_frame_tiers)
+        self.stats = {
+            name: {"calls": 0, "escalations": 0, "total_ms": 0.0} for name, _ in tiers
+        }
+
+    def _has_text(self, frame: np.ndarray) -> bool:
+        return bool(segment_lines(binarize_frame(frame)))
+
+    def extract(self, frame: np.ndarray, **base_kwargs) -> Tuple[str, float, str]:
+        """OCR a frame, escalating through tiers while confidence is low."""
+        best: Tuple[str, float, str] = ("", 0.0, "None")
+        has_text: Optional[bool] = None
+
+        for position, (name, tier_kwargs) in enumerate(self.tiers):
+            ocr_func = (
+                extract_subtitle_text
+                if name in self.full_frame_tiers
+                else self.ocr_func
+            )
+            started = time.perf_counter()
+            text, conf, engine = ocr_func(frame, **dict(base_kwargs, **tier_kwargs))
+            tier_stats = self.stats[name]
+            tier_stats["calls"] += 1
+            tier_stats["total_ms"] += (time.perf_counter() - started) * 1000
+
+            text = text.strip()
+            if text and conf > best[1]:
+                best = (text, conf, engine)
+            if text and conf >= self.threshold:
+                break
+            if position == len(self.tiers) - 1:
+                break
+
+            # Empty frames are common (no subtitle on screen); only escalate
+            # when there is visible text the cheaper engine failed to read.
+            if has_text is None:
+                has_text = self._has_text(frame)
+            if not has_text:
+                break
+
+            tier_stats["escalations"] += 1
+            logging.debug(
+                "OCR cascade escalating from %s (conf=%.2f, text=%s)",
+                name,
+                conf,
+                "yes" if text else "no",
+            )
+
+        return best
+
+    def report(self) -> dict:
+        """Return escalation rate and average latency per tier."""
+        report = {}
+        for name, tier_stats in self.stats.items():
+            calls = tier_stats["calls"]
+            report[name] = {
+                "calls": calls,
+                "escalation_rate": tier_stats["escalations"] / calls if calls else 0.0,
+                "avg_ms": tier_stats["total_ms"] / calls if calls else 0.0,
+            }
+        return report
+
+
+def build_default_cascade(
+    source_lang: str,
+    threshold: float = 0.7,
+    ocr_func: Optional[Callable[..., Tuple[str, float, str]]] = None,
+) -> Optional[OCRCascade]:
+    """Build the cascade for a source language from the engine registry.
+
+    Tiers are the engines usable here for the language, cheapest first
+    (RapidOCR rec-only or WinOCR, then full det+rec RapidOCR). A custom
+    ocr_func (line-incremental OCR) is used for the cheap tiers only; the
+    det+rec tier always reads the whole frame so escalation can recover text
+    that line segmentation or the cheap recognizer missed.
+
+    Returns None when fewer than two engines apply, since a single tier has
+    nothing to escalate to.
+    """
+    engines = engines_for_language(source_lang)
+    if len(engines) < 2:
+        logging.info(
+            "OCR cascade disabled for '%s': only %s can read it here",
+            source_lang,
+            engines[0].name if engines else "no engine",
+        )
+        return None
+    for engine in engines[:-1]:
+        if not engine.reports_confidence:
+            logging.info(
+                "OCR cascade: %s reports no confidence, so it escalates only "
+                "when it returns no text",
+                engine.name,
+            )
+    return OCRCascade(
+        [(engine.name, engine.ocr_kwargs) for engine in engines],
+        threshold=threshold,
+        ocr_func=ocr_func,
+        full_frame_tiers=(RAPIDOCR_DET_REC,),
+    )
@@ -0,0 +1,185 @@
+"""OCR engine registry.
+
+Each OCR engine registers the Python module it needs, the languages and
+platforms it supports and the extract_subtitle_text arguments that select
+it. Engine modules are imported on first use, so the OCR layer can be
+imported (and the ONNX engines used) on machines without WinOCR.
+"""
+
+import importlib
+import importlib.util
+import logging
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Sequence
+
+WINOCR = "WinOCR"
+RAPIDOCR_REC = "RapidOCR-rec"
+RAPIDOCR_DET_REC = "RapidOCR-det+rec"
+
+RAPIDOCR_REC_MODEL_PATH = "models/ch_PP-OCRv5_rec_infer.onnx"
+
+# Map language codes to WinOCR language tags
+WINOCR_LANG_TAGS: Dict[str, str] = {
+    "zh-CN": "zh-Hans-CN",
+    "zh-cn": "zh-Hans-CN",
+    "chinese": "zh-Hans-CN",
+    "zh-TW": "zh-Hant-TW",
+    "zh-tw": "zh-Hant-TW",
+    "ja": "ja",
+    "ja-JP": "ja",
+    "japanese": "ja",
+    "korean": "ko",
+    "en": "en",
+    "english": "en",
+    "ar": "ar",
+    "arabic": "ar",
+    "fr": "fr",
+    "french": "fr",
+    "de": "de",
+    "german": "de",
+    "es": "es",
+    "spanish": "es",
+    "ru": "ru",
+    "russian": "ru",
+}
+
+
+class OCREngine:
+    """Registry entry for one OCR engine.
+
+    Args:
+        name: Engine name, also used for cascade tiers and logs
+        module: Module imported on first use
+        languages: Supported language codes (None means any)
+        platforms: Supported sys.platform prefixes (None means any)
+        ocr_kwargs: extract_subtitle_text arguments that select this engine
+        cost: Relative per-frame cost; cheaper engines are preferred
+        required_files: Model files that must exist for the engine to work
+        reports_confidence: False if the engine's confidence is a constant,
+            so a cascade cannot escalate on it
+    """
+
+    def __init__(
+        self,
+        name: str,
+        module: str,
+        languages: Optional[Sequence[str]] = None,
+        platforms: Optional[Sequence[str]] = None,
+        ocr_kwargs: Optional[dict] = None,
+        cost: int = 0,
+        required_files: Sequence[str] = (),
+        reports_confidence: bool = True,
+    ):
+        self.name = name
+        self.module = module
+        self.languages = (
+            None if languages is None else {lang.lower() for lang in languages}
+        )
+        self.platforms = None if platforms is None else tuple(platforms)
+        self.ocr_kwargs = dict(ocr_kwargs or {})
+        self.cost = cost
+        self.required_files = tuple(required_files)
+        self.reports_confidence = reports_confidence
+        self._module = None
+        self._available: Optional[bool] = None
+
+    def supports_language(self, lang: str) -> bool:
+        return self.languages is None or lang.lower() in self.languages
+
+    def supports_platform(self, platform: Optional[str] = None) -> bool:
+        platform = platform or sys.platform
+        return self.platforms is None or platform.startswith(self.platforms)
+
+    def available(self) -> bool:
+        """Whether the engine can run here (platform, module and model files)."""
+        if self._available is None:
+            self._available = (
+                self.supports_platform()
+                and importlib.util.find_spec(self.module) is not None
+                and all(os.path.exists(path) for path in self.required_files)
+            )
+        return self._available
+
+    def load(self):
+        """Import and return the engine module."""
+        if self._module is None:
+            with _registry_lock:
+                if self._module is None:
+                    if not self.supports_platform():
+                        raise RuntimeError(
+                            f"{self.name} is not supported on {sys.platform}"
+                        )
+                    self._module = importlib.import_module(self.module)
+                    logging.info("Loaded OCR engine %s", self.name)
+        return self._module
+
+
+_registry_lock = threading.RLock()
+_engines: Dict[str, OCREngine] = {}
+
+
+def register_engine(engine: OCREngine) -> None:
+    """Add or replace an engine in the registry."""
+    with _registry_lock:
+        _engines[engine.name] = engine
+
+
+def get_engine(name: str) -> OCREngine:
+    try:
+        return _engines[name]
+    except KeyError:
+        raise KeyError(f"Unknown OCR engine: {name}") from None
+
+
+def engines_for_language(lang: str) -> List[OCREngine]:
+    """Return the engines usable here for a language, cheapest first."""
+    with _registry_lock:
+        engines = list(_engines.values())
+    usable = [
+        engine
+        for engine in engines
+        if engine.supports_language(lang) and engine.available()
+    ]
+    return sorted(usable, key=lambda engine: engine.cost)
+
+
+def select_engine(lang: str) -> Optional[OCREngine]:
+    """Return the cheapest engine usable here for a language, if any."""
+    engines = engines_for_language(lang)
+    return engines[0] if engines else None
+
+
+register_engine(
+    OCREngine(
+        RAPIDOCR_REC,
+        "rapidocr_onnxruntime",
+        languages=("zh", "chinese"),
+        ocr_kwargs={"use_winocr": False, "rec_model_path": RAPIDOCR_REC_MODEL_PATH},
+        cost=0,
+        required_files=(RAPIDOCR_REC_MODEL_PATH,),
+    )
+)
+register_engine(
+    OCREngine(
+        WINOCR,
+        "winocr",
+        languages=tuple(WINOCR_LANG_TAGS),
+        platforms=("win32",),
+        ocr_kwargs={"use_winocr": True, "rec_model_path": None},
+        cost=1,
+        # WinOCR results carry no score; extract_subtitle_text reports 1.0.
+        reports_confidence=False,
+    )
+)
+register_engine(
+    OCREngine(
+        RAPIDOCR_DET_REC,
+        "rapidocr_onnxruntime",
+        # Languages the bundled default RapidOCR det+rec models can read.
+        languages=("zh", "chinese", "en", "english"),
+        ocr_kwargs={"use_winocr": False, "rec_model_path": None},
+        cost=2,
+    )
+)
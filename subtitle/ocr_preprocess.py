@@ -0,0 +1,160 @@
+"""Allocation-free OCR preprocessing.
+
+Screen captures for a region keep the same size frame after frame, so the
+intermediate images used to prepare them for OCR are allocated once and
+reused. Each thread gets its own preprocessor because the returned images
+are views into that preprocessor's buffers.
+"""
+
+import threading
+import time
+import weakref
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+WINOCR_PADDING = 20
+RAPIDOCR_PADDING = 10
+
+
+class OCRPreprocessor:
+    """Prepares frames for WinOCR and RapidOCR using preallocated buffers.
+
+    WinOCR pipeline: grayscale -> Otsu threshold with THRESH_BINARY_INV written
+    straight into the interior of a pre-padded white canvas -> BGR. This fuses
+    the original threshold/invert/pad steps and allocates nothing per frame.
+
+    RapidOCR pipeline: copy the frame into the interior of a pre-padded white
+    canvas (replaces copyMakeBorder).
+
+    The returned arrays are only valid until the next call on the same
+    preprocessor.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[str, np.ndarray] = {}
+        self.frames = 0
+        self.allocations = 0
+        self.stage_ms: Dict[str, float] = {
+            "gray": 0.0,
+            "threshold": 0.0,
+            "to_bgr": 0.0,
+            "pad": 0.0,
+        }
+
+    def _buffer(
+        self, name: str, shape: Tuple[int, ...], fill: Optional[int] = None
+    ) -> np.ndarray:
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            if fill is None:
+                buffer = np.empty(shape, dtype=np.uint8)
+            else:
+                buffer = np.full(shape, fill, dtype=np.uint8)
+            self._buffers[name] = buffer
+            self.allocations += 1
+        return buffer
+
+    def prepare_winocr(self, image: np.ndarray) -> np.ndarray:
+        """Grayscale, Otsu-binarize (inverted) and pad a frame for WinOCR."""
+        height, width = image.shape[:2]
+        pad = WINOCR_PADDING
+
+        t0 = time.perf_counter()
+        if image.ndim == 3:
+            gray = self._buffer("gray", (height, width))
+            cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=gray)
+        else:
+            gray = image
+        t1 = time.perf_counter()
+
+        padded = self._buffer(
+            "winocr_padded", (height + 2 * pad, width + 2 * pad), fill=255
+        )
+        interior = padded[pad : pad + height, pad : pad + width]
+        _, binary = cv2.threshold(
+            gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU, dst=interior
+        )
+        if binary is not interior:
+            # OpenCV could not write into the view; copy so the border stays intact.
+            np.copyto(interior, binary)
+            self.allocations += 1
+        t2 = time.perf_counter()
+
+        bgr = self._buffer("winocr_bgr", padded.shape + (3,))
+        cv2.cvtColor(padded, cv2.COLOR_GRAY2BGR, dst=bgr)
+        t3 = time.perf_counter()
+
+        self.frames += 1
+        self.stage_ms["gray"] += (t1 - t0) * 1000
+        self.stage_ms["threshold"] += (t2 - t1) * 1000
+        self.stage_ms["to_bgr"] += (t3 - t2) * 1000
+        return bgr
+
+    def prepare_rapidocr(self, image: np.ndarray) -> np.ndarray:
+        """Pad a frame with a white border for the RapidOCR rec-only model."""
+        height, width = image.shape[:2]
+        pad = RAPIDOCR_PADDING
+
+        t0 = time.perf_counter()
+        padded = self._buffer(
+            f"rapidocr_padded_{image.ndim}",
+            (height + 2 * pad, width + 2 * pad) + image.shape[2:],
+            fill=255,
+        )
+        np.copyto(padded[pad : pad + height, pad : pad + width], image)
+        self.frames += 1
+        self.stage_ms["pad"] += (time.perf_counter() - t0) * 1000
+        return padded
+
+    def report(self) -> dict:
+        """Return frame count, buffer allocations and average ms per stage."""
+        frames = self.frames or 1
+        return {
+            "frames": self.frames,
+            "allocations": self.allocations,
+            "buffer_bytes": sum(buf.nbytes for buf in self._buffers.values()),
+            "avg_stage_ms": {
+                stage: round(total / frames, 3)
+                for stage, total in self.stage_ms.items()
+            },
+        }
+
+
+_local = threading.local()
+_registry_lock = threading.Lock()
+# Weak so buffers are released when their thread (e.g. a stopped monitor) exits.
+_preprocessors: "weakref.WeakSet[OCRPreprocessor]" = weakref.WeakSet()
+
+
+def get_preprocessor() -> OCRPreprocessor:
+    """Return the calling thread's preprocessor."""
+    preprocessor = getattr(_local, "preprocessor", None)
+    if preprocessor is None:
+        preprocessor = OCRPreprocessor()
+        _local.preprocessor = preprocessor
+        with _registry_lock:
+            _preprocessors.add(preprocessor)
+    return preprocessor
+
+
+def preprocess_report() -> dict:
+    """Aggregate per-stage timing and allocation counts across all threads."""
+    with _registry_lock:
+        preprocessors = list(_preprocessors)
+
+    frames = sum(p.frames for p in preprocessors)
+    totals: Dict[str, float] = {}
+    for preprocessor in preprocessors:
+        for stage, total in preprocessor.stage_ms.items():
+            totals[stage] = totals.get(stage, 0.0) + total
+    return {
+        "threads": len(preprocessors),
+        "frames": frames,
+        "allocations": sum(p.allocations for p in preprocessors),
+        "avg_stage_ms": {
+            stage: round(total / frames, 3) if frames else 0.0
+            for stage, total in totals.items()
+        },
+    }
@@ -0,0 +1,218 @@
+"""Out-of-process OCR backend.
+
+Runs OCR engines in worker processes so preprocessing, recognition and
+result post-processing do not compete for the GIL with the Qt main thread
+and the translation threads. Frames are copied once into a per-worker
+shared memory segment; only small tuples travel over the pipes.
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+def _worker_main(conn, pool_settings: dict) -> None:
+    """Worker process loop: read images from shared memory and OCR them."""
+    from subtitle.subtitle_ocr import (
+        _extract_subtitle_text_local,
+        _recognize_text_lines_local,
+        configure_engine_pool,
+    )
+
+    operations = {
+        "extract": lambda images, kwargs: _extract_subtitle_text_local(
+            images[0], **kwargs
+        ),
+        "lines": lambda images, kwargs: _recognize_text_lines_local(images, **kwargs),
+    }
+    configure_engine_pool(**pool_settings)
+    segment: Optional[shared_memory.SharedMemory] = None
+
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+            if message is None:
+                break
+
+            operation, shm_name, layout, kwargs = message
+            if segment is None or segment.name != shm_name:
+                if segment is not None:
+                    segment.close()
+                segment = shared_memory.SharedMemory(name=shm_name)
+
+            images = [
+                np.ndarray(
+                    shape, dtype=np.dtype(dtype), buffer=segment.buf, offset=offset
+                )
+                for offset, shape, dtype in layout
+            ]
+            try:
+                conn.send((operations[operation](images, kwargs), None))
+            except Exception as exc:
+                conn.send((None, str(exc)))
+            finally:
+                del images
+    finally:
+        if segment is not None:
+            segment.close()
+        conn.close()
+
+
+class _Worker:
+    """One OCR worker process plus its pipe and shared frame buffer."""
+
+    def __init__(self, context, index: int, pool_settings: dict):
+        self.index = index
+        self.segment: Optional[shared_memory.SharedMemory] = None
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, pool_settings),
+            name=f"OCRWorker-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def ensure_capacity(self, nbytes: int) -> shared_memory.SharedMemory:
+        if self.segment is None or self.segment.size < nbytes:
+            self.release_segment()
+            # Over-allocate so small region changes don't force a new segment.
+            self.segment = shared_memory.SharedMemory(
+                create=True, size=max(nbytes * 2, 1 << 20)
+            )
+        return self.segment
+
+    def release_segment(self) -> None:
+        if self.segment is None:
+            return
+        try:
+            self.segment.close()
+            self.segment.unlink()
+        except FileNotFoundError:
+            pass
+        self.segment = None
+
+    def close(self, timeout: float = 2.0) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout)
+        self.conn.close()
+        self.release_segment()
+
+
+class ProcessOCRBackend:
+    """Pool of OCR worker processes with the extract_subtitle_text contract.
+
+    Args:
+        workers: Number of worker processes (each holds its own OCR engines)
+        pool_settings: RapidOCR pool settings forwarded to configure_engine_pool
+        start_method: multiprocessing start method ("spawn" works everywhere)
+        timeout: Seconds to wait for one result before the worker is killed
+            and restarted; covers the engine build on a worker's first frame
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        pool_settings: Optional[dict] = None,
+        start_method: str = "spawn",
+        timeout: float = 60.0,
+    ):
+        self.timeout = timeout
+        self._context = multiprocessing.get_context(start_method)
+        self._pool_settings = dict(pool_settings or {})
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        # Guards _workers against concurrent respawns and close().
+        self._lock = threading.Lock()
+        self._workers = []
+        for index in range(max(1, int(workers))):
+            worker = _Worker(self._context, index, self._pool_settings)
+            self._workers.append(worker)
+            self._idle.put(worker)
+        logging.info("Started %d OCR worker processes", len(self._workers))
+
+    def _respawn(self, worker: _Worker, reason: str) -> Optional[_Worker]:
+        """Replace worker; None if close() or another respawn removed it."""
+        with self._lock:
+            if worker not in self._workers:
+                worker.close(timeout=0.5)
+                return None
+            logging.warning("OCR worker %d %s; restarting it", worker.index, reason)
+            replacement = _Worker(self._context, worker.index, self._pool_settings)
+            self._workers[self._workers.index(worker)] = replacement
+        worker.close(timeout=0.5)
+        return replacement
+
+    def _run(self, operation: str, images: List[np.ndarray], kwargs: dict):
+        """Copy images into a worker's shared memory and run operation there."""
+        images = [np.ascontiguousarray(image) for image in images]
+        layout = []
+        nbytes = 0
+        for image in images:
+            layout.append((nbytes, image.shape, image.dtype.str))
+            # Keep every image aligned for the worker's ndarray views.
+            nbytes += -(-image.nbytes // 64) * 64
+        worker = self._idle.get()
+        try:
+            segment = worker.ensure_capacity(nbytes)
+            for (offset, _, _), image in zip(layout, images):
+                shared = np.ndarray(
+                    image.shape, dtype=image.dtype, buffer=segment.buf, offset=offset
+                )
+                shared[...] = image
+                del shared
+
+            try:
+                worker.conn.send((operation, segment.name, layout, kwargs))
+                # A hung worker must not block the monitor thread for good.
+                if not worker.conn.poll(self.timeout):
+                    worker = self._respawn(
+                        worker, f"gave no result within {self.timeout:.0f} s"
+                    )
+                    raise RuntimeError("OCR worker process timed out")
+                result, error = worker.conn.recv()
+            except (EOFError, BrokenPipeError, OSError) as exc:
+                worker = self._respawn(worker, "died")
+                raise RuntimeError(f"OCR worker process failed: {exc}") from exc
+        finally:
+            if worker is not None:
+                self._idle.put(worker)
+
+        if error:
+            raise RuntimeError(error)
+        return result
+
+    def extract(self, image: np.ndarray, **kwargs) -> Tuple[str, float, str]:
+        """OCR a frame in a worker process; blocks until a worker is free."""
+        text, conf, engine = self._run("extract", [image], kwargs)
+        return text, float(conf), engine
+
+    def recognize_lines(
+        self, crops: List[np.ndarray], **kwargs
+    ) -> List[Tuple[str, float]]:
+        """Batch-recognize line crops in one worker process."""
+        return self._run("lines", crops, kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+        logging.info("OCR worker processes stopped")
@@ -1,73 +1,193 @@
+import contextlib
 import logging
+import os
+import queue
 import threading
-from typing import Optional, Tuple
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import cv2
-from winocr import recognize_cv2_sync
-
-RapidOCR = None
 
 from subtitle.language_pack_manager import ensure_language_pack
+from subtitle.ocr_cache import OCRResultCache, frame_digest
+from subtitle.ocr_engines import (
+    RAPIDOCR_DET_REC,
+    RAPIDOCR_REC,
+    RAPIDOCR_REC_MODEL_PATH,
+    WINOCR,
+    WINOCR_LANG_TAGS,
+    get_engine,
+)
+from subtitle.ocr_preprocess import RAPIDOCR_PADDING, get_preprocessor
 
 _engine_lock = threading.Lock()
-_engines = {}
-_language_pack_checked = False
+_engine_pools: Dict[Tuple[Optional[str], Optional[str]], "OCREnginePool"] = {}
+_pool_settings = {"size": 1, "intra_op_threads": 0, "inter_op_threads": 0}
+_language_packs_checked = set()
+_process_backend = None
+_result_cache = OCRResultCache()
+_fallback_warned = set()
 
 
 def _ensure_winocr_language_pack(lang: str = "en") -> None:
-    """Ensure Windows OCR language pack is installed for the given language."""
-    global _language_pack_checked
+    """Ensure Windows OCR language pack is installed for the given language.
 
-    if _language_pack_checked:
+    Checked once per language per process; the check reads the on-disk cache
+    and never spawns PowerShell in the calling thread.
+    """
+    if lang in _language_packs_checked:
         return
+    _language_packs_checked.add(lang)
 
-    with _engine_lock:
-        if _language_pack_checked:
-            return
+    logging.info("Checking Windows OCR language pack for: %s", lang)
+    if ensure_language_pack(lang):
+        logging.info("Windows OCR language pack ready for: %s", lang)
+    else:
+        logging.warning(
+            "Failed to ensure language pack for: %s. WinOCR may not work properly.",
+            lang,
+        )
 
-        logging.info("Checking Windows OCR language pack for: %s", lang)
-        if ensure_language_pack(lang):
-            logging.info("Windows OCR language pack ready for: %s", lang)
-        else:
+
+def _create_warmup_image() -> np.ndarray:
+    image = np.full((48, 320, 3), 255, dtype=np.uint8)
+    cv2.putText(
+        image, "Warm up 0123", (8, 34), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2
+    )
+    return image
+
+
+class OCREnginePool:
+    """Fixed-size pool of warmed-up RapidOCR engines for one model configuration.
+
+    Each engine owns its own onnxruntime sessions, so up to ``size`` OCR calls
+    can run in parallel. Engines are created with explicit intra-op/inter-op
+    thread counts (0 keeps the onnxruntime default) and run once on a dummy
+    image so the first real frame does not pay for lazy initialization.
+    """
+
+    def __init__(
+        self,
+        rec_model_path: Optional[str] = None,
+        keys_path: Optional[str] = None,
+        size: int = 1,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+    ):
+        self.rec_model_path = rec_model_path
+        self.keys_path = keys_path
+        self.size = max(1, int(size))
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self._idle: "queue.Queue" = queue.Queue()
+
+        started = time.perf_counter()
+        warmup_image = _create_warmup_image()
+        for _ in range(self.size):
+            engine = self._create_engine()
+            self._warm_up(engine, warmup_image)
+            self._idle.put(engine)
+        logging.info(
+            "RapidOCR pool ready: size=%d, intra_op=%d, inter_op=%d, rec_model=%s (%.0f ms)",
+            self.size,
+            self.intra_op_threads,
+            self.inter_op_threads,
+            self.rec_model_path or "default",
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def _create_engine(self):
+        engine_name = RAPIDOCR_REC if self.rec_model_path else RAPIDOCR_DET_REC
+        RapidOCR = get_engine(engine_name).load().RapidOCR
+
+        kwargs = {}
+        if self.rec_model_path:
+            kwargs.update(
+                rec_model_path=self.rec_model_path,
+                keys_path=self.keys_path,
+                use_det=False,
+            )
+        thread_kwargs = {}
+        if self.intra_op_threads > 0:
+            thread_kwargs["intra_op_num_threads"] = self.intra_op_threads
+        if self.inter_op_threads > 0:
+            thread_kwargs["inter_op_num_threads"] = self.inter_op_threads
+
+        try:
+            return RapidOCR(**kwargs, **thread_kwargs)
+        except (TypeError, KeyError) as exc:
+            if not thread_kwargs:
+                raise
             logging.warning(
-                "Failed to ensure language pack for: %s. WinOCR may not work properly.",
-                lang,
+                "RapidOCR rejected thread settings (%s); using onnxruntime defaults",
+                exc,
             )
+            return RapidOCR(**kwargs)
 
-        _language_pack_checked = True
+    def _warm_up(self, engine, image: np.ndarray) -> None:
+        try:
+            engine(image)
+        except Exception as exc:
+            logging.warning("RapidOCR warm-up inference failed: %s", exc)
 
+    @contextlib.contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator:
+        """Borrow an engine for the duration of one OCR call."""
+        engine = self._idle.get(timeout=timeout)
+        try:
+            yield engine
+        finally:
+            self._idle.put(engine)
 
-def _get_rapidocr_engine(
-    rec_model_path: Optional[str] = None,
-    keys_path: Optional[str] = None,
-):
-    global _engines, RapidOCR
 
-    if RapidOCR is None:
-        from rapidocr_onnxruntime import RapidOCR as _RapidOCR
+def configure_engine_pool(
+    size: int = 1, intra_op_threads: int = 0, inter_op_threads: int = 0
+) -> None:
+    """Set the size and onnxruntime thread counts used for new RapidOCR pools.
 
-        RapidOCR = _RapidOCR
+    Existing pools built with different settings are dropped and rebuilt on
+    next use.
+    """
+    settings = {
+        "size": max(1, int(size)),
+        "intra_op_threads": max(0, int(intra_op_threads)),
+        "inter_op_threads": max(0, int(inter_op_threads)),
+    }
+    with _engine_lock:
+        if settings != _pool_settings:
+            _pool_settings.update(settings)
+            _engine_pools.clear()
 
+
+def get_engine_pool(
+    rec_model_path: Optional[str] = None,
+    keys_path: Optional[str] = None,
+) -> OCREnginePool:
+    """Return the RapidOCR pool for a model configuration, building it on first use."""
     config_key = (rec_model_path, keys_path)
 
-    if config_key not in _engines:
+    pool = _engine_pools.get(config_key)
+    if pool is None:
         with _engine_lock:
-            if config_key not in _engines:
+            pool = _engine_pools.get(config_key)
+            if pool is None:
                 if rec_model_path:
                     logging.info(
-                        "Initializing RapidOCR with Rec model: %s", rec_model_path
-                    )
-                    _engines[config_key] = RapidOCR(
-                        rec_model_path=rec_model_path,
-                        keys_path=keys_path,
-                        use_det=False,
+                        "Initializing RapidOCR pool with Rec model: %s", rec_model_path
                     )
                 else:
-                    logging.info("Initializing default RapidOCR (Det+Rec)")
-                    _engines[config_key] = RapidOCR()
+                    logging.info("Initializing default RapidOCR pool (Det+Rec)")
+                pool = OCREnginePool(
+                    rec_model_path,
+                    keys_path,
+                    size=_pool_settings["size"],
+                    intra_op_threads=_pool_settings["intra_op_threads"],
+                    inter_op_threads=_pool_settings["inter_op_threads"],
+                )
+                _engine_pools[config_key] = pool
 
-    return _engines[config_key]
+    return pool
 
 
 def _extract_with_winocr(image: np.ndarray, lang: str = "en") -> Tuple[str, float]:
@@ -85,33 +205,10 @@ def _extract_with_winocr(image: np.ndarray, lang: str = "en") -> Tuple[str, floa
     _ensure_winocr_language_pack(lang)
 
     try:
-        # Map language codes to WinOCR language tags
-        lang_map = {
-            "zh-CN": "zh-Hans-CN",
-            "zh-cn": "zh-Hans-CN",
-            "chinese": "zh-Hans-CN",
-            "zh-TW": "zh-Hant-TW",
-            "zh-tw": "zh-Hant-TW",
-            "ja": "ja",
-            "ja-JP": "ja",
-            "japanese": "ja",
-            "korean": "ko",
-            "en": "en",
-            "english": "en",
-            "ar": "ar",
-            "arabic": "ar",
-            "fr": "fr",
-            "french": "fr",
-            "de": "de",
-            "german": "de",
-            "es": "es",
-            "spanish": "es",
-            "ru": "ru",
-            "russian": "ru",
-        }
-        winocr_lang = lang_map.get(lang.lower(), "en")
-
-        result = recognize_cv2_sync(image, winocr_lang)
+        winocr_lang = WINOCR_LANG_TAGS.get(lang.lower(), "en")
+        winocr = get_engine(WINOCR).load()
+
+        result = winocr.recognize_cv2_sync(image, winocr_lang)
 
         if isinstance(result, dict):
             text = result.get("text", "").strip()
@@ -127,6 +224,36 @@ def _extract_with_winocr(image: np.ndarray, lang: str = "en") -> Tuple[str, floa
         raise RuntimeError(f"WinOCR failed to process image: {exc}") from exc
 
 
+def _group_boxes_into_lines(entries: List[list]) -> List[List[list]]:
+    """Group det+rec [box, text, confidence] entries into text lines.
+
+    Boxes whose vertical spans overlap by at least half the shorter box
+    belong to one line. Lines are returned top-down, boxes left to right.
+    """
+
+    def span(entry) -> Tuple[float, float]:
+        ys = [float(point[1]) for point in entry[0]]
+        return min(ys), max(ys)
+
+    lines: List[List[list]] = []
+    bounds: List[Tuple[float, float]] = []
+    for entry in sorted(entries, key=lambda item: span(item)[0]):
+        top, bottom = span(entry)
+        if bounds:
+            line_top, line_bottom = bounds[-1]
+            overlap = min(bottom, line_bottom) - max(top, line_top)
+            if overlap >= 0.5 * min(bottom - top, line_bottom - line_top):
+                lines[-1].append(entry)
+                bounds[-1] = (min(top, line_top), max(bottom, line_bottom))
+                continue
+        lines.append([entry])
+        bounds.append((top, bottom))
+
+    for line in lines:
+        line.sort(key=lambda item: min(float(point[0]) for point in item[0]))
+    return lines
+
+
 def _extract_with_rapidocr(
     image: np.ndarray,
     min_confidence: float = 0.55,
@@ -146,8 +273,9 @@ def _extract_with_rapidocr(
     Returns:
         Tuple of (text, confidence)
     """
-    engine = _get_rapidocr_engine(rec_model_path, keys_path)
-    results, _ = engine(image)
+    pool = get_engine_pool(rec_model_path, keys_path)
+    with pool.acquire() as engine:
+        results, _ = engine(image)
 
     if not results:
         return "", 0.0
@@ -173,9 +301,14 @@ def _extract_with_rapidocr(
         ]
         if not usable:
             return "", 0.0
-        usable.sort(key=lambda entry: float(np.mean([pt[1] for pt in entry[0]])))
-        limited = usable[: max(1, max_lines)]
-        lines = [entry[1].strip() for entry in limited if entry[1].strip()]
+        # max_lines counts text lines, and a line often spans several boxes.
+        grouped = _group_boxes_into_lines(usable)[: max(1, max_lines)]
+        limited = [entry for line in grouped for entry in line]
+        lines = [
+            " ".join(entry[1].strip() for entry in line if entry[1].strip())
+            for line in grouped
+        ]
+        lines = [line for line in lines if line]
         if not lines:
             return "", 0.0
         avg_conf = float(sum(entry[2] for entry in limited) / len(limited))
@@ -184,7 +317,151 @@ def _extract_with_rapidocr(
     return text, avg_conf
 
 
-def extract_subtitle_text(
+def _pad_line_crop(crop: np.ndarray) -> np.ndarray:
+    """Convert a line crop to BGR and add the RapidOCR white border."""
+    if crop.ndim == 2:
+        crop = cv2.cvtColor(crop, cv2.COLOR_GRAY2BGR)
+    return cv2.copyMakeBorder(
+        crop,
+        RAPIDOCR_PADDING,
+        RAPIDOCR_PADDING,
+        RAPIDOCR_PADDING,
+        RAPIDOCR_PADDING,
+        cv2.BORDER_CONSTANT,
+        value=[255, 255, 255],
+    )
+
+
+def _fall_back_to_det_rec(
+    use_winocr: bool, rec_model_path: Optional[str]
+) -> Tuple[bool, Optional[str]]:
+    """Swap an engine that cannot run here for RapidOCR det+rec."""
+    if use_winocr:
+        if get_engine(WINOCR).available():
+            return use_winocr, rec_model_path
+        missing = WINOCR
+    elif rec_model_path and not os.path.exists(rec_model_path):
+        missing = RAPIDOCR_REC
+    else:
+        return use_winocr, rec_model_path
+
+    if missing not in _fallback_warned:
+        _fallback_warned.add(missing)
+        logging.warning(
+            "%s is not available on this machine; using %s instead",
+            missing,
+            RAPIDOCR_DET_REC,
+        )
+    return False, None
+
+
+def _recognize_text_lines_local(
+    crops: List[np.ndarray],
+    *,
+    rec_model_path: Optional[str] = RAPIDOCR_REC_MODEL_PATH,
+    keys_path: Optional[str] = None,
+    min_confidence: float = 0.55,
+    max_batch_size: int = 16,
+) -> List[Tuple[str, float]]:
+    """Run batched line recognition in the calling thread (or OCR worker)."""
+    results: List[Tuple[str, float]] = [("", 0.0)] * len(crops)
+    members = [
+        (index, _pad_line_crop(crop))
+        for index, crop in enumerate(crops)
+        if crop is not None and crop.size > 0
+    ]
+    if not members:
+        return results
+
+    # The default det+rec engine carries its own recognizer, so it can stand in.
+    _, rec_model_path = _fall_back_to_det_rec(False, rec_model_path)
+    pool = get_engine_pool(rec_model_path, keys_path)
+    with pool.acquire() as engine:
+        recognizer = engine.text_rec
+        # The recognizer sorts crops by aspect ratio and pads each batch of
+        # rec_batch_num crops to its widest member, one ONNX run per batch.
+        original_batch_num = recognizer.rec_batch_num
+        recognizer.rec_batch_num = max(1, int(max_batch_size))
+        try:
+            rec_res, _ = recognizer([image for _, image in members])
+        finally:
+            recognizer.rec_batch_num = original_batch_num
+
+    for (index, _), entry in zip(members, rec_res):
+        text, conf = str(entry[0]).strip(), float(entry[1])
+        if text and conf >= min_confidence:
+            results[index] = (text, conf)
+    return results
+
+
+def recognize_text_lines(
+    crops: List[np.ndarray],
+    *,
+    rec_model_path: Optional[str] = RAPIDOCR_REC_MODEL_PATH,
+    keys_path: Optional[str] = None,
+    min_confidence: float = 0.55,
+    max_batch_size: int = 16,
+) -> List[Tuple[str, float]]:
+    """Recognize several single-line crops with batched RapidOCR rec inference.
+
+    Crops found in the OCR result cache are returned from it; the rest run
+    in the active backend (see set_ocr_backend), batched so each chunk of up
+    to ``max_batch_size`` crops is one ONNX session run.
+
+    Args:
+        crops: Single text-line images (RGB/BGR or grayscale)
+        rec_model_path: Path to recognition model
+        keys_path: Path to keys file
+        min_confidence: Lines below this confidence are returned as ("", 0.0)
+        max_batch_size: Maximum crops per ONNX run
+
+    Returns:
+        List of (text, confidence) in the same order as ``crops``
+    """
+    results: List[Tuple[str, float]] = [("", 0.0)] * len(crops)
+    cache_keys: Dict[int, tuple] = {}
+    pending: List[int] = []
+    for index, crop in enumerate(crops):
+        if crop is None or crop.size == 0:
+            continue
+        if _result_cache.enabled:
+            key = (
+                frame_digest(crop),
+                "line",
+                rec_model_path,
+                keys_path,
+                min_confidence,
+            )
+            cached = _result_cache.get(key)
+            if cached is not None:
+                results[index] = cached[:2]
+                continue
+            cache_keys[index] = key
+        pending.append(index)
+    if not pending:
+        return results
+
+    kwargs = dict(
+        rec_model_path=rec_model_path,
+        keys_path=keys_path,
+        min_confidence=min_confidence,
+        max_batch_size=max_batch_size,
+    )
+    backend = _process_backend
+    pending_crops = [crops[index] for index in pending]
+    if backend is not None:
+        recognized = backend.recognize_lines(pending_crops, **kwargs)
+    else:
+        recognized = _recognize_text_lines_local(pending_crops, **kwargs)
+
+    for index, (text, conf) in zip(pending, recognized):
+        results[index] = (text, conf)
+        if index in cache_keys:
+            _result_cache.put(cache_keys[index], (text, conf, RAPIDOCR_REC))
+    return results
+
+
+def _extract_subtitle_text_local(
     image: np.ndarray,
     *,
     min_confidence: float = 0.55,
@@ -195,32 +472,19 @@ def extract_subtitle_text(
     keys_path: Optional[str] = None,
     skip_preprocessing: bool = False,
 ) -> Tuple[str, float, str]:
-    """Extract subtitle text from image using WinOCR or RapidOCR.
-
-    Args:
-        image: Image as numpy array
-        min_confidence: Minimum confidence threshold (for RapidOCR only)
-        max_lines: Maximum number of lines to extract (for RapidOCR only)
-        lang: Source language for OCR
-        use_winocr: Whether to use WinOCR as primary engine
-        rec_model_path: Path to recognition model (RapidOCR)
-        keys_path: Path to keys file (RapidOCR)
-        skip_preprocessing: If True, skip image preprocessing
-
-    Returns:
-        Tuple of (text, confidence, engine_name)
-    """
+    """Run OCR in the calling thread (or OCR worker process)."""
     if image is None or image.size == 0:
         return "", 0.0, "None"
 
     logging.debug("OCR input image shape: %s", image.shape)
 
+    preprocessor = get_preprocessor()
+    use_winocr, rec_model_path = _fall_back_to_det_rec(use_winocr, rec_model_path)
+
     if not use_winocr:
         try:
             # White padding preprocessing for v5 rec-only model (fixes edge character detection)
-            padded = cv2.copyMakeBorder(
-                image, 10, 10, 10, 10, cv2.BORDER_CONSTANT, value=[255, 255, 255]
-            )
+            padded = preprocessor.prepare_rapidocr(image)
             text, conf = _extract_with_rapidocr(
                 padded,
                 min_confidence,
@@ -236,25 +500,9 @@ def extract_subtitle_text(
     processed_image = image
     if not skip_preprocessing:
         try:
-            # 1. Convert to grayscale if needed
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image
-
-            # 2. Apply Otsu's binarization to separate text from background
-            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-            # 3. Invert the image
-            inverted = cv2.bitwise_not(binary)
-
-            # 4. Add padding (white border) for WinOCR
-            padded = cv2.copyMakeBorder(
-                inverted, 20, 20, 20, 20, cv2.BORDER_CONSTANT, value=255
-            )
-
-            # 5. Convert back to BGR (3 channels)
-            processed_image = cv2.cvtColor(padded, cv2.COLOR_GRAY2BGR)
+            # Grayscale -> Otsu (inverted) into a pre-padded canvas -> BGR,
+            # reusing buffers across frames of the same size.
+            processed_image = preprocessor.prepare_winocr(image)
 
             logging.debug(
                 "Applied WinOCR preprocessing: Grayscale -> Otsu -> Invert -> Padding"
@@ -273,3 +521,149 @@ def extract_subtitle_text(
     except Exception as exc:
         logging.error("WinOCR failed: %s", exc)
         raise RuntimeError(f"WinOCR failed to process image: {exc}") from exc
+
+
+def extract_subtitle_text(
+    image: np.ndarray,
+    *,
+    min_confidence: float = 0.55,
+    max_lines: int = 2,
+    lang: str = "en",
+    use_winocr: bool = False,
+    rec_model_path: Optional[str] = None,
+    keys_path: Optional[str] = None,
+    skip_preprocessing: bool = False,
+) -> Tuple[str, float, str]:
+    """Extract subtitle text from image using WinOCR or RapidOCR.
+
+    Args:
+        image: Image as numpy array
+        min_confidence: Minimum confidence threshold (for RapidOCR only)
+        max_lines: Maximum number of lines to extract (for RapidOCR only)
+        lang: Source language for OCR
+        use_winocr: Whether to use WinOCR as primary engine
+        rec_model_path: Path to recognition model (RapidOCR)
+        keys_path: Path to keys file (RapidOCR)
+        skip_preprocessing: If True, skip image preprocessing
+
+    Returns:
+        Tuple of (text, confidence, engine_name)
+    """
+    if image is None or image.size == 0:
+        return "", 0.0, "None"
+
+    cache_key = None
+    if _result_cache.enabled:
+        cache_key = (
+            frame_digest(image),
+            lang,
+            use_winocr,
+            rec_model_path,
+            keys_path,
+            min_confidence,
+            max_lines,
+            skip_preprocessing,
+        )
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            logging.debug("OCR result cache hit: '%s'", cached[0][:50])
+            return cached
+
+    backend = _process_backend
+    if backend is not None:
+        result = backend.extract(
+            image,
+            min_confidence=min_confidence,
+            max_lines=max_lines,
+            lang=lang,
+            use_winocr=use_winocr,
+            rec_model_path=rec_model_path,
+            keys_path=keys_path,
+            skip_preprocessing=skip_preprocessing,
+        )
+    else:
+        result = _extract_subtitle_text_local(
+            image,
+            min_confidence=min_confidence,
+            max_lines=max_lines,
+            lang=lang,
+            use_winocr=use_winocr,
+            rec_model_path=rec_model_path,
+            keys_path=keys_path,
+            skip_preprocessing=skip_preprocessing,
+        )
+
+    if cache_key is not None:
+        _result_cache.put(cache_key, result)
+    return result
+
+
+def warm_up_ocr(
+    *,
+    lang: str = "en",
+    use_winocr: bool = False,
+    rec_model_path: Optional[str] = None,
+    keys_path: Optional[str] = None,
+) -> str:
+    """Load the engine for these settings and run one dummy inference.
+
+    Checks the WinOCR language pack or builds the RapidOCR pool, in the
+    active backend, so the first real frame runs at warm latency. The result
+    cache is bypassed. Returns the engine name.
+    """
+    kwargs = dict(
+        lang=lang,
+        use_winocr=use_winocr,
+        rec_model_path=rec_model_path,
+        keys_path=keys_path,
+    )
+    image = _create_warmup_image()
+    backend = _process_backend
+    if backend is not None:
+        return backend.extract(image, **kwargs)[2]
+    return _extract_subtitle_text_local(image, **kwargs)[2]
+
+
+def configure_ocr_result_cache(max_entries: int) -> None:
+    """Set the OCR result cache capacity (0 disables it)."""
+    _result_cache.resize(max_entries)
+
+
+def clear_ocr_result_cache() -> None:
+    """Drop cached OCR results, e.g. after a language or region change."""
+    _result_cache.clear()
+
+
+def ocr_result_cache_stats() -> dict:
+    """Return OCR result cache hit rate and memory usage."""
+    return _result_cache.stats()
+
+
+def set_ocr_backend(mode: str = "thread", workers: int = 2) -> None:
+    """Select where extract_subtitle_text and recognize_text_lines run OCR.
+
+    Args:
+        mode: "thread" runs OCR in the caller's thread; "process" runs it in a
+            pool of worker processes that receive frames via shared memory.
+        workers: Number of worker processes for the "process" backend
+    """
+    global _process_backend
+
+    previous = _process_backend
+    _process_backend = None
+    if previous is not None:
+        previous.close()
+
+    if mode == "process":
+        from subtitle.ocr_process_backend import ProcessOCRBackend
+
+        _process_backend = ProcessOCRBackend(
+            workers=workers, pool_settings=dict(_pool_settings)
+        )
+    elif mode != "thread":
+        logging.warning("Unknown OCR backend '%s', using in-thread OCR", mode)
+
+
+def shutdown_ocr_backend() -> None:
+    """Stop OCR worker processes, if any."""
+    set_ocr_backend("thread")
@@ -0,0 +1,50 @@
+import atexit
+import os
+
+import pytest
+
+from core.config_manager import ConfigManager
+
+
+@pytest.fixture
+def config(tmp_path):
+    saved_environ = dict(os.environ)
+    env_path = tmp_path / ".env"
+    env_path.write_text(
+        "FONT_SIZE=22\nSOURCE_LANGUAGE=ja\nTEMPERATURE=0.1\nCONFIG_WRITE_DELAY=0\n",
+        encoding="utf-8",
+    )
+    for key in ("FONT_SIZE", "SOURCE_LANGUAGE", "TEMPERATURE", "CONFIG_WRITE_DELAY"):
+        os.environ.pop(key, None)
+    manager = ConfigManager(str(env_path))
+    yield manager
+    atexit.unregister(manager.flush)
+    manager.flush()
+    os.environ.clear()
+    os.environ.update(saved_environ)
+
+
+def _touch_later(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+
+def test_setter_values_survive_reload_of_other_key(config):
+    config.font_size = 30
+    config.source_language = "zh"
+    config.flush()
+
+    env_path = config._env_path
+    text = env_path.read_text(encoding="utf-8")
+    env_path.write_text(
+        text.replace("TEMPERATURE=0.1", "TEMPERATURE=0.3"), encoding="utf-8"
+    )
+    _touch_later(env_path)
+
+    changed = config.reload_if_modified()
+
+    assert changed == {"temperature"}
+    assert config.temperature == 0.3
+    assert config.font_size == 30
+    assert config.source_language == "zh"
+    assert "FONT_SIZE=30" in env_path.read_text(encoding="utf-8")
@@ -0,0 +1,37 @@
+import cv2
+import numpy as np
+
+from subtitle.ocr_cascade import OCRCascade, build_default_cascade
+
+
+def _text_frame():
+    frame = np.full((60, 320, 3), 255, dtype=np.uint8)
+    cv2.putText(
+        frame, "Some subtitle", (8, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2
+    )
+    return frame
+
+
+def test_default_language_builds_no_cascade():
+    # "ja" (the SOURCE_LANGUAGE default) has at most one engine, WinOCR.
+    assert build_default_cascade("ja") is None
+
+
+def test_low_confidence_escalates_to_next_tier():
+    calls = []
+
+    def ocr(frame, tier):
+        calls.append(tier)
+        return {"cheap": ("Sone subtitle", 0.4, "cheap")}.get(
+            tier, ("Some subtitle", 0.9, tier)
+        )
+
+    cascade = OCRCascade(
+        [("cheap", {"tier": "cheap"}), ("full", {"tier": "full"})],
+        threshold=0.7,
+        ocr_func=ocr,
+    )
+
+    assert cascade.extract(_text_frame()) == ("Some subtitle", 0.9, "full")
+    assert calls == ["cheap", "full"]
+    assert cascade.report()["cheap"]["escalation_rate"] == 1.0
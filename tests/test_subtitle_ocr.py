@@ -0,0 +1,39 @@
+import contextlib
+
+import numpy as np
+import pytest
+
+from subtitle import subtitle_ocr
+
+
+def _box(left, top, right, bottom):
+    return [[left, top], [right, top], [right, bottom], [left, bottom]]
+
+
+class _FakePool:
+    def __init__(self, results):
+        self.results = results
+
+    @contextlib.contextmanager
+    def acquire(self):
+        yield lambda image: (self.results, None)
+
+
+def test_det_rec_max_lines_counts_lines_not_boxes(monkeypatch):
+    results = [
+        [_box(437, 48, 512, 74), "you", 0.9],
+        [_box(281, 43, 436, 72), "Where did", 0.99],
+        [_box(338, 88, 642, 118), "I left it on the table.", 0.98],
+        [_box(497, 41, 699, 77), "put the key?", 0.97],
+        [_box(300, 130, 400, 160), "Third line", 0.95],
+    ]
+    monkeypatch.setattr(
+        subtitle_ocr, "get_engine_pool", lambda *args: _FakePool(results)
+    )
+
+    text, conf = subtitle_ocr._extract_with_rapidocr(
+        np.zeros((170, 980, 3), dtype=np.uint8), max_lines=2
+    )
+
+    assert text == "Where did you put the key?\nI left it on the table."
+    assert conf == pytest.approx((0.9 + 0.99 + 0.98 + 0.97) / 4)
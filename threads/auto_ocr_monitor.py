@@ -6,7 +6,16 @@ from typing import Optional
 
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from subtitle.subtitle_ocr import extract_subtitle_text
+from core.log_sampling import RateLimitedLogger
+from core.metrics import counter, histogram
+from core.tracing import publish_trace, start_trace
+
+from subtitle.band_detector import SubtitleBandDetector
+from subtitle.line_ocr import IncrementalLineOCR
+from subtitle.ocr_cascade import build_default_cascade
+from subtitle.ocr_engines import RAPIDOCR_DET_REC, get_engine, select_engine
+from subtitle.ocr_preprocess import preprocess_report
+from subtitle.subtitle_ocr import extract_subtitle_text, ocr_result_cache_stats
 
 
 class AutoOCRMonitor(QThread):
@@ -16,11 +25,30 @@ class AutoOCRMonitor(QThread):
     - Requires consecutive frames to be similar.
     - Similarity check must be >= sim_thresh to emit.
     - Debounced by debounce_seconds; near-duplicates (>= duplicate_ratio) are skipped.
+    - With auto_band, only the learned subtitle band of the region is captured.
+    - In speculative mode, the first frame of a new high-confidence text is emitted
+      early via speculation_requested so translation can start before it stabilizes.
 
     OCR engine is configurable via subtitle_ocr.py.
     """
 
-    change_detected = pyqtSignal(object, object)  # (frame, (text, conf, duration_ms))
+    # (frame, (text, conf, duration_ms), trace_id or None)
+    change_detected = pyqtSignal(object, object, object)
+    # Early, unconfirmed text: (frame, (text, conf, duration_ms))
+    speculation_requested = pyqtSignal(object, object)
+
+    # Settings that are read every frame and can change while running.
+    LIVE_SETTINGS = (
+        "interval",
+        "sim_thresh",
+        "duplicate_ratio",
+        "debounce_seconds",
+        "min_confidence",
+        "max_lines",
+        "stability_frames",
+        "speculative",
+        "speculative_min_confidence",
+    )
 
     def __init__(
         self,
@@ -34,6 +62,16 @@ class AutoOCRMonitor(QThread):
         min_confidence: float = 0.55,
         max_lines: int = 2,
         stability_frames: int = 3,
+        speculative: bool = False,
+        speculative_min_confidence: float = 0.8,
+        line_incremental: bool = False,
+        line_cache_size: int = 64,
+        cascade: bool = False,
+        cascade_threshold: float = 0.7,
+        auto_band: bool = False,
+        band_warmup_seconds: float = 3.0,
+        band_reexpand_seconds: float = 30.0,
+        log_rate: float = 2.0,
     ):
         super().__init__()
         self.region = region
@@ -46,18 +84,65 @@ class AutoOCRMonitor(QThread):
         self.min_confidence = min_confidence
         self.max_lines = max_lines
         self.stability_frames = max(2, min(4, stability_frames))
+        self.speculative = speculative
+        self.speculative_min_confidence = speculative_min_confidence
+        self._line_ocr = (
+            IncrementalLineOCR(cache_size=line_cache_size) if line_incremental else None
+        )
+        self._band = (
+            SubtitleBandDetector(
+                region,
+                warmup_seconds=band_warmup_seconds,
+                reexpand_seconds=band_reexpand_seconds,
+            )
+            if auto_band
+            else None
+        )
+        engine = select_engine(self.source_lang)
+        if engine is None:
+            logging.warning(
+                "No OCR engine declares support for '%s' here; trying %s",
+                self.source_lang,
+                RAPIDOCR_DET_REC,
+            )
+            engine = get_engine(RAPIDOCR_DET_REC)
+        self._engine = engine
+        self._cascade = (
+            build_default_cascade(
+                self.source_lang,
+                threshold=cascade_threshold,
+                ocr_func=self._line_ocr.extract if self._line_ocr else None,
+            )
+            if cascade
+            else None
+        )
 
         logging.info(
-            "AutoOCRMonitor initialized: source_lang=%s, interval=%.2fs, sim_thresh=%.2f, stability_frames=%d",
+            "AutoOCRMonitor initialized: source_lang=%s, interval=%.2fs, sim_thresh=%.2f, stability_frames=%d, speculative=%s, line_incremental=%s, engine=%s, cascade=%s, auto_band=%s",
             self.source_lang,
             self.interval,
             self.sim_thresh,
             self.stability_frames,
+            self.speculative,
+            line_incremental,
+            self._engine.name,
+            self._cascade is not None,
+            auto_band,
         )
 
+        # Per-frame messages go through a per-call-site rate limit.
+        self._hot_log = RateLimitedLogger(max_per_second=log_rate)
+        self._capture_ms = histogram("capture_duration_ms", "Region capture time")
+        self._frames = counter("ocr_frames", "Frames OCRed by the auto monitor")
+        self._ocr_errors = counter("ocr_errors", "OCR calls that raised")
+        self._emissions = counter("ocr_emissions", "Stable texts sent for translation")
+        self._duplicates = counter("ocr_duplicates", "Near-duplicate texts skipped")
+        self._speculations = counter("ocr_speculations", "Speculative emissions")
+
         self._running = True
         self._text_history: collections.deque = collections.deque(maxlen=4)
         self._last_emitted_text: Optional[str] = None
+        self._last_speculated_text: Optional[str] = None
         self._recent_appearance = False
         self._last_change_time = time.time()
         self._last_emit_time = 0.0
@@ -65,6 +150,16 @@ class AutoOCRMonitor(QThread):
     def stop(self):
         self._running = False
 
+    def update_settings(self, **settings) -> None:
+        """Change per-frame settings in place (from any thread)."""
+        for name, value in settings.items():
+            if name not in self.LIVE_SETTINGS:
+                raise ValueError(f"{name} cannot be changed while running")
+            if name == "stability_frames":
+                value = max(2, min(4, value))
+            setattr(self, name, value)
+        logging.info("AutoOCRMonitor settings updated: %s", settings)
+
     def _check_stability(self):
         if len(self._text_history) < self.stability_frames:
             return False, []
@@ -79,42 +174,71 @@ class AutoOCRMonitor(QThread):
 
         return True, similarities
 
+    def _timing_log(self, t0, t1, t2, t3) -> str:
+        return (
+            f"Timings(ms): Capture={int((t1 - t0) * 1000)}, "
+            f"OCR={int((t2 - t1) * 1000)}, Logic={int((t3 - t2) * 1000)}. "
+            f"Since change: {time.time() - self._last_change_time:.2f}s"
+        )
+
+    def _should_speculate(self, text: str, conf: float) -> bool:
+        if not self.speculative or conf < self.speculative_min_confidence:
+            return False
+        for previous in (self._last_speculated_text, self._last_emitted_text):
+            if (
+                previous
+                and SequenceMatcher(None, text, previous).ratio() >= self.sim_thresh
+            ):
+                return False
+        return True
+
     def run(self):
         while self._running:
             t0 = time.time()
+            trace = start_trace("frame")
 
-            frame = self.capture_func(self.region)
+            capture_region = self._band.region if self._band else self.region
+            frame = self.capture_func(capture_region)
             if frame is None:
                 time.sleep(self.interval)
                 continue
+            if self._band is not None:
+                self._band.observe(frame)
+            if trace is not None:
+                trace.add_span("capture")
 
             t1 = time.time()
+            self._capture_ms.observe((t1 - t0) * 1000)
 
             try:
-                use_rapidocr = self.source_lang in ("zh", "chinese")
-                use_winocr = not use_rapidocr
-                rec_model_path = (
-                    None if use_winocr else "models/ch_PP-OCRv5_rec_infer.onnx"
-                )
-
-                ocr_lang = self.source_lang
-
-                curr_text, curr_conf, engine = extract_subtitle_text(
-                    frame,
-                    lang=ocr_lang,
-                    use_winocr=use_winocr,
-                    rec_model_path=rec_model_path,
-                    min_confidence=self.min_confidence,
-                    max_lines=self.max_lines,
-                )
+                if self._cascade is not None:
+                    curr_text, curr_conf, engine = self._cascade.extract(
+                        frame,
+                        lang=self.source_lang,
+                        min_confidence=self.min_confidence,
+                        max_lines=self.max_lines,
+                    )
+                else:
+                    ocr = (
+                        self._line_ocr.extract
+                        if self._line_ocr
+                        else extract_subtitle_text
+                    )
+                    curr_text, curr_conf, engine = ocr(
+                        frame,
+                        lang=self.source_lang,
+                        min_confidence=self.min_confidence,
+                        max_lines=self.max_lines,
+                        **self._engine.ocr_kwargs,
+                    )
                 curr_text = curr_text.strip()
-                logging.info(
+                self._hot_log.info(
+                    "ocr_result",
                     "OCR Monitor [%s]: '%s' (conf=%.2f)",
-                    engine,
-                    curr_text[:50] if curr_text else "[empty]",
-                    curr_conf,
+                    lambda: (engine, curr_text[:50] or "[empty]", curr_conf),
                 )
             except Exception as exc:
+                self._ocr_errors.inc()
                 logging.error("OCR Monitor failed: %s", exc)
                 time.sleep(self.interval)
                 continue
@@ -124,6 +248,12 @@ class AutoOCRMonitor(QThread):
 
             t2 = time.time()
             ocr_duration_ms = (t2 - t1) * 1000
+            self._frames.inc()
+            histogram("ocr_duration_ms", "OCR time per frame", engine=engine).observe(
+                ocr_duration_ms
+            )
+            if trace is not None:
+                trace.add_span("ocr", engine=engine)
 
             if not curr_text:
                 self._text_history.append("")
@@ -143,42 +273,66 @@ class AutoOCRMonitor(QThread):
                     is_duplicate = True
 
             t3 = time.time()
-            time_since_change = time.time() - self._last_change_time
-            timing_log = (
-                f"Timings(ms): Capture={int((t1 - t0) * 1000)}, "
-                f"OCR={int(ocr_duration_ms)}, Logic={int((t3 - t2) * 1000)}. "
-                f"Since change: {time_since_change:.2f}s"
-            )
+            if trace is not None:
+                trace.add_span("stability_check", stable=is_stable)
+
+            if (
+                not is_duplicate
+                and not is_stable
+                and self._should_speculate(curr_text, curr_conf)
+            ):
+                self._hot_log.debug(
+                    "speculation",
+                    "Speculative pre-translation: '%s'",
+                    lambda: (curr_text[:50],),
+                )
+                self.speculation_requested.emit(
+                    frame, (curr_text, curr_conf, ocr_duration_ms)
+                )
+                self._last_speculated_text = curr_text
+                self._speculations.inc()
 
             emit = False
             if is_duplicate:
-                logging.debug(
+                self._duplicates.inc()
+                self._hot_log.debug(
+                    "duplicate",
                     "Skipping near-duplicate (ratio %.2f). %s",
-                    dup_ratio,
-                    timing_log,
+                    lambda: (dup_ratio, self._timing_log(t0, t1, t2, t3)),
                 )
             elif is_stable:
                 emit = True
-                logging.info(
+                self._hot_log.info(
+                    "stable",
                     "Stability emission (%d-frame, sims=%s). %s",
-                    self.stability_frames,
-                    [f"{s:.2f}" for s in similarities],
-                    timing_log,
+                    lambda: (
+                        self.stability_frames,
+                        [f"{s:.2f}" for s in similarities],
+                        self._timing_log(t0, t1, t2, t3),
+                    ),
                 )
             else:
-                logging.info(
+                self._hot_log.info(
+                    "unstable",
                     "Chain below threshold (sims=%s). %s",
-                    [f"{s:.2f}" for s in similarities] if similarities else "[]",
-                    timing_log,
+                    lambda: (
+                        [f"{s:.2f}" for s in similarities] if similarities else "[]",
+                        self._timing_log(t0, t1, t2, t3),
+                    ),
                 )
 
             if emit:
                 now = time.time()
                 if now - self._last_emit_time < self.debounce_seconds:
-                    logging.debug("Debounce: Too soon after last emit; skipping.")
+                    self._hot_log.debug(
+                        "debounce", "Debounce: Too soon after last emit; skipping."
+                    )
                 else:
                     ocr_data = (curr_text, curr_conf, ocr_duration_ms)
-                    self.change_detected.emit(frame, ocr_data)
+                    if trace is not None:
+                        trace.args["text"] = curr_text[:40]
+                    self.change_detected.emit(frame, ocr_data, publish_trace(trace))
+                    self._emissions.inc()
                     self._last_emitted_text = curr_text
                     self._last_emit_time = now
                     self._last_change_time = now
@@ -187,3 +341,35 @@ class AutoOCRMonitor(QThread):
             sleep_time = self.interval - elapsed
             if sleep_time > 0:
                 time.sleep(sleep_time)
+
+        if self._line_ocr is not None:
+            logging.info("Line OCR stats: %s", self._line_ocr.stats)
+        if self._band is not None:
+            logging.info("Subtitle band stats: %s", self._band.stats)
+        if self._cascade is not None:
+            for tier, tier_report in self._cascade.report().items():
+                logging.info(
+                    "OCR cascade tier %s: calls=%d, escalation rate=%.0f%%, avg=%.1f ms",
+                    tier,
+                    tier_report["calls"],
+                    tier_report["escalation_rate"] * 100,
+                    tier_report["avg_ms"],
+                )
+
+        cache_stats = ocr_result_cache_stats()
+        if cache_stats["hits"] or cache_stats["misses"]:
+            logging.info(
+                "OCR result cache: entries=%d, hit rate=%.0f%%, ~%.0f bytes/entry",
+                cache_stats["entries"],
+                cache_stats["hit_rate"] * 100,
+                cache_stats["bytes_per_entry"],
+            )
+
+        report = preprocess_report()
+        if report["frames"]:
+            logging.info(
+                "OCR preprocessing: frames=%d, allocations=%d, avg stage ms=%s",
+                report["frames"],
+                report["allocations"],
+                report["avg_stage_ms"],
+            )
@@ -1,8 +1,34 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any, Tuple
 
+from subtitle.utils import build_image_translation_prompt
+
 
 class TranslationService(ABC):
+    def __init__(self):
+        # Clients by (api key, base url) and the prompt of the last config
+        # version, so requests do not rebuild them.
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._active_api_key: Optional[str] = None
+        self._prompt_cache: Tuple[int, str] = (0, "")
+
+    def _build_prompt(self, config, history: Optional[List[str]]) -> str:
+        """Return the prompt for a ConfigSnapshot, cached per config version."""
+        if history:
+            return build_image_translation_prompt(
+                target_lang=config.target_language,
+                source_lang=config.source_language,
+                history=history,
+            )
+        version, prompt = self._prompt_cache
+        if version != config.version:
+            prompt = build_image_translation_prompt(
+                target_lang=config.target_language,
+                source_lang=config.source_language,
+            )
+            self._prompt_cache = (config.version, prompt)
+        return prompt
+
     @abstractmethod
     def get_or_translate(
         self,
@@ -18,3 +44,6 @@ class TranslationService(ABC):
     @abstractmethod
     def switch_service(self, service_name: str) -> bool:
         pass
+
+    def warm_up(self) -> None:
+        """Open provider connections before the first request (optional)."""
@@ -2,29 +2,86 @@ import logging
 import time
 import collections
 import concurrent.futures
+import threading
 from difflib import SequenceMatcher
 
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
+from core.log_sampling import RateLimitedLogger
+from core.metrics import counter, histogram
+from core.tracing import add_span, finish_trace, trace_span
 from services.translation_service_factory import TranslationServiceFactory
 
+# Bounds on how long a confirmed request waits for a running speculation
+# before issuing its own provider call.
+SPECULATION_MIN_WAIT_SECONDS = 0.5
+SPECULATION_MAX_WAIT_SECONDS = 5.0
+
+
+class _Speculation:
+    """A background translation started before its OCR text stabilized."""
+
+    __slots__ = ("text", "future", "started", "finished")
+
+    def __init__(self, text):
+        self.text = text
+        self.future = None
+        self.started = time.time()
+        self.finished = None
+
 
 class TranslationWorker(QObject):
-    translation_finished = pyqtSignal(str, float, object)
+    # (text, timestamp, image_hash, trace_id or None)
+    translation_finished = pyqtSignal(str, float, object, object)
     translation_error = pyqtSignal(str, float)
 
     def __init__(self, config_manager):
         super().__init__()
         self.config = config_manager
+        # Built on first use so the provider SDK is imported off the UI thread
+        # and not at all until a translation is requested.
         self.service = None
+        self._service_lock = threading.Lock()
         self.cache = {}
         self.text_cache = collections.OrderedDict()
         self.max_text_cache_size = 50
         self.duplicate_ratio = 0.92
+        self._hot_log = RateLimitedLogger(
+            max_per_second=config_manager.hot_path_log_rate
+        )
         self.executor = concurrent.futures.ThreadPoolExecutor(
             max_workers=2, thread_name_prefix="Translator"
         )
-        self._refresh_service()
+        # Speculative work gets its own single thread so it never occupies
+        # the main executor; a confirmed request waits on a speculation only
+        # while it is running, and for about one request's latency at most.
+        self.speculation_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="Speculator"
+        )
+        self.max_speculations = 2
+        self._speculations = collections.OrderedDict()
+        self._speculation_lock = threading.Lock()
+        self._speculation_stats = {
+            "started": 0,
+            "hits": 0,
+            "misses": 0,
+            "saved_ms": 0.0,
+        }
+        self._text_cache_hits = counter(
+            "text_cache_lookups", "Worker text cache lookups", result="hit"
+        )
+        self._text_cache_misses = counter(
+            "text_cache_lookups", "Worker text cache lookups", result="miss"
+        )
+        self._speculation_outcomes = {
+            outcome: counter(
+                "speculations", "Speculative translations", outcome=outcome
+            )
+            for outcome in ("started", "hit", "miss")
+        }
+        self._speculation_saved_ms = histogram(
+            "speculation_saved_ms", "Latency saved by speculation hits"
+        )
 
     def _refresh_service(self):
         try:
@@ -36,17 +93,27 @@ class TranslationWorker(QObject):
             logging.error("Failed to initialize translation service: %s", exc)
             self.service = None
 
+    def get_service(self):
+        """Return the translation service, creating it on first use."""
+        service = self.service
+        if service is None:
+            with self._service_lock:
+                if self.service is None:
+                    self._refresh_service()
+                service = self.service
+        return service
+
     def _check_text_cache(self, ocr_text):
         if not ocr_text:
             return None
-        for cached_text, cached_result in reversed(self.text_cache.items()):
+        # Snapshot: translator and speculator threads both read the cache.
+        for cached_text, cached_result in reversed(list(self.text_cache.items())):
             sim = SequenceMatcher(None, ocr_text, cached_text).ratio()
             if sim >= self.duplicate_ratio:
-                logging.info(
+                self._hot_log.info(
+                    "text_cache_hit",
                     "Text cache hit (sim=%.2f): '%s' -> '%s'",
-                    sim,
-                    ocr_text[:30],
-                    cached_result[:30],
+                    lambda: (sim, ocr_text[:30], cached_result[:30]),
                 )
                 return cached_result
         return None
@@ -58,55 +125,199 @@ class TranslationWorker(QObject):
         if len(self.text_cache) > self.max_text_cache_size:
             self.text_cache.popitem(last=False)
 
+    def _discard_speculation(self, spec):
+        spec.future.cancel()
+        self._speculation_stats["misses"] += 1
+        self._speculation_outcomes["miss"].inc()
+
+    def _run_speculation(self, spec, screenshot_np, region, precomputed_ocr):
+        try:
+            # Checked here rather than in speculate, which runs on the
+            # emitting thread; cached text needs no speculative request.
+            if self._check_text_cache(spec.text):
+                return "", None
+            service = self.get_service()
+            if service is None:
+                return "", None
+            return service.get_or_translate(
+                region=region,
+                screenshot_np=screenshot_np,
+                cache={},
+                history=[],
+                last_hash=None,
+                precomputed_ocr=precomputed_ocr,
+            )
+        finally:
+            spec.finished = time.time()
+
+    def _take_speculation(self, ocr_text):
+        """Pop the speculation matching ocr_text and discard all others."""
+        match = None
+        with self._speculation_lock:
+            for text, spec in self._speculations.items():
+                if text == ocr_text or (
+                    SequenceMatcher(None, ocr_text, text).ratio()
+                    >= self.duplicate_ratio
+                ):
+                    match = spec
+                    break
+            for spec in self._speculations.values():
+                if spec is not match:
+                    self._discard_speculation(spec)
+            self._speculations.clear()
+        return match
+
+    def _speculation_wait_seconds(self):
+        """Longest wait for a running speculation: about one direct request."""
+        latency = histogram(
+            "translation_latency_ms",
+            "Service call time per translation, including image cache hits",
+            service=self.config.translation_service,
+        )
+        if not latency.count:
+            return SPECULATION_MAX_WAIT_SECONDS
+        return min(
+            SPECULATION_MAX_WAIT_SECONDS,
+            max(SPECULATION_MIN_WAIT_SECONDS, latency.quantile(0.9) / 1000),
+        )
+
+    def _consume_speculation(self, ocr_text, requested_at):
+        if not ocr_text:
+            return None
+        spec = self._take_speculation(ocr_text)
+        if spec is None:
+            return None
+
+        # Still queued behind a discarded speculation: a direct request on
+        # the main executor is faster than waiting for the speculator thread.
+        if spec.future.cancel():
+            self._hot_log.debug(
+                "speculation_queued", "Speculation not started; translating directly"
+            )
+            with self._speculation_lock:
+                self._speculation_stats["misses"] += 1
+            self._speculation_outcomes["miss"].inc()
+            return None
+
+        try:
+            result, image_hash = spec.future.result(
+                timeout=self._speculation_wait_seconds()
+            )
+        except Exception as exc:
+            self._hot_log.debug(
+                "speculation_error", "Speculative translation unusable: %s", exc
+            )
+            with self._speculation_lock:
+                self._speculation_stats["misses"] += 1
+            self._speculation_outcomes["miss"].inc()
+            return None
+
+        if not result or result == "__NO_TEXT__":
+            with self._speculation_lock:
+                self._speculation_stats["misses"] += 1
+            self._speculation_outcomes["miss"].inc()
+            return None
+
+        # Work already done when the stable request arrived is latency saved.
+        saved_ms = max(0.0, (min(requested_at, spec.finished) - spec.started) * 1000)
+        with self._speculation_lock:
+            stats = self._speculation_stats
+            stats["hits"] += 1
+            stats["saved_ms"] += saved_ms
+            resolved = stats["hits"] + stats["misses"]
+            hit_rate = stats["hits"] / resolved if resolved else 0.0
+        self._speculation_outcomes["hit"].inc()
+        self._speculation_saved_ms.observe(saved_ms)
+        self._hot_log.info(
+            "speculation_hit",
+            "Speculation hit (saved %.0f ms, hit rate %.0f%%): '%s'",
+            lambda: (saved_ms, hit_rate * 100, ocr_text[:30]),
+        )
+        return result, image_hash
+
+    def _emit_error(self, message, timestamp, trace_id):
+        counter(
+            "translation_errors",
+            "Failed or empty translations",
+            service=self.config.translation_service,
+        ).inc()
+        finish_trace(trace_id)
+        self.translation_error.emit(message, timestamp)
+
     def _execute_translation(
-        self, screenshot_np, region, precomputed_ocr, timestamp, manual=False
+        self,
+        screenshot_np,
+        region,
+        precomputed_ocr,
+        timestamp,
+        manual=False,
+        trace_id=None,
     ):
+        add_span(trace_id, "queue_wait")
         if screenshot_np is None:
-            self.translation_error.emit("Screenshot capture failed", timestamp)
+            self._emit_error("Screenshot capture failed", timestamp, trace_id)
             return
 
         ocr_text = precomputed_ocr[0] if precomputed_ocr else None
 
         # Skip text cache check in manual mode
         if not manual:
-            cached_result = self._check_text_cache(ocr_text)
+            with trace_span(trace_id, "text_cache"):
+                cached_result = self._check_text_cache(ocr_text)
             if cached_result:
-                self.translation_finished.emit(cached_result, timestamp, None)
+                self._text_cache_hits.inc()
+                self.translation_finished.emit(cached_result, timestamp, None, trace_id)
                 return
 
-        if self.service is None:
-            self._refresh_service()
-            if self.service is None:
-                self.translation_error.emit(
-                    "Translation service not available", timestamp
-                )
+            if ocr_text:
+                self._text_cache_misses.inc()
+
+            with trace_span(trace_id, "speculation_lookup"):
+                speculative = self._consume_speculation(ocr_text, timestamp)
+            if speculative is not None:
+                result, image_hash = speculative
+                self._add_to_text_cache(ocr_text, result)
+                self.translation_finished.emit(result, timestamp, image_hash, trace_id)
                 return
 
+        service = self.get_service()
+        if service is None:
+            self._emit_error("Translation service not available", timestamp, trace_id)
+            return
+
         try:
             # Use empty cache in manual mode to force fresh translation
             cache_to_use = {} if manual else self.cache
 
-            result, image_hash = self.service.get_or_translate(
-                region=region,
-                screenshot_np=screenshot_np,
-                cache=cache_to_use,
-                history=[],
-                last_hash=None,
-                precomputed_ocr=precomputed_ocr,
-            )
+            service_name = self.config.translation_service
+            started = time.perf_counter()
+            with trace_span(trace_id, "provider_call", service=service_name):
+                result, image_hash = service.get_or_translate(
+                    region=region,
+                    screenshot_np=screenshot_np,
+                    cache=cache_to_use,
+                    history=[],
+                    last_hash=None,
+                    precomputed_ocr=precomputed_ocr,
+                )
+            histogram(
+                "translation_latency_ms",
+                "Service call time per translation, including image cache hits",
+                service=service_name,
+            ).observe((time.perf_counter() - started) * 1000)
 
             if result and result != "__NO_TEXT__":
                 if ocr_text and not manual:
                     self._add_to_text_cache(ocr_text, result)
-                self.translation_finished.emit(result, timestamp, image_hash)
+                self.translation_finished.emit(result, timestamp, image_hash, trace_id)
             else:
-                self.translation_error.emit(
-                    "No text detected in selected area", timestamp
+                self._emit_error(
+                    "No text detected in selected area", timestamp, trace_id
                 )
 
         except Exception as exc:
             logging.error("Translation failed: %s", exc)
-            self.translation_error.emit(f"Translation failed: {exc}", timestamp)
+            self._emit_error(f"Translation failed: {exc}", timestamp, trace_id)
 
     @pyqtSlot(object, object)
     def translate_frame(
@@ -116,9 +327,11 @@ class TranslationWorker(QObject):
         precomputed_ocr=None,
         manual=False,
         timestamp=None,
+        trace_id=None,
     ):
         if timestamp is None:
             timestamp = time.time()
+        add_span(trace_id, "dispatch")
         self.executor.submit(
             self._execute_translation,
             screenshot_np,
@@ -126,10 +339,73 @@ class TranslationWorker(QObject):
             precomputed_ocr,
             timestamp,
             manual,
+            trace_id,
         )
 
+    @pyqtSlot(object, object, object)
+    def speculate(self, screenshot_np, region, precomputed_ocr):
+        """Start translating unconfirmed OCR text in the background.
+
+        The result is only delivered if a later translate_frame call carries the
+        same (or near-identical) text; otherwise it is discarded.
+        """
+        if screenshot_np is None or not precomputed_ocr or not precomputed_ocr[0]:
+            return
+        ocr_text = precomputed_ocr[0]
+
+        with self._speculation_lock:
+            if ocr_text in self._speculations:
+                return
+            while len(self._speculations) >= self.max_speculations:
+                _, oldest = self._speculations.popitem(last=False)
+                self._discard_speculation(oldest)
+
+            spec = _Speculation(ocr_text)
+            spec.future = self.speculation_executor.submit(
+                self._run_speculation, spec, screenshot_np, region, precomputed_ocr
+            )
+            self._speculations[ocr_text] = spec
+            self._speculation_stats["started"] += 1
+            self._speculation_outcomes["started"].inc()
+
+    def speculation_report(self):
+        """Return speculation hit rate and latency saved so far."""
+        with self._speculation_lock:
+            stats = dict(self._speculation_stats)
+        resolved = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / resolved if resolved else 0.0
+        stats["avg_saved_ms"] = (
+            stats["saved_ms"] / stats["hits"] if stats["hits"] else 0.0
+        )
+        return stats
+
+    def warm_up(self) -> bool:
+        """Build the service and open its connections; False if unavailable."""
+        service = self.get_service()
+        if service is None:
+            return False
+        service.warm_up()
+        return True
+
     def refresh_service(self):
-        self._refresh_service()
+        """Drop the service; the next request rebuilds it from the config."""
+        self.service = None
 
     def shutdown(self):
+        report = self.speculation_report()
+        if report["started"]:
+            logging.info(
+                "Speculation summary: started=%d, hits=%d, misses=%d, "
+                "hit rate=%.0f%%, avg saved=%.0f ms",
+                report["started"],
+                report["hits"],
+                report["misses"],
+                report["hit_rate"] * 100,
+                report["avg_saved_ms"],
+            )
+        with self._speculation_lock:
+            for spec in self._speculations.values():
+                spec.future.cancel()
+            self._speculations.clear()
+        self.speculation_executor.shutdown(wait=False)
         self.executor.shutdown(wait=False)